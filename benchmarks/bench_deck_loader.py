@@ -0,0 +1,84 @@
+"""Benchmark loading a 10,000-slide deck specification."""
+
+# %%
+
+import json
+import time
+
+from pptgen.deck_loader import load_deck
+from pptgen.model.powerpoint import (
+    BulletPoint,
+    BulletPoints,
+    ColorTheme,
+    ContentSlide,
+    ThemeColorScheme,
+    TitleSlide,
+)
+
+SLIDE_COUNT = 10_000
+
+
+def make_spec(slide_count: int) -> dict:
+    """Make a deck specification alternating title and content slides."""
+    slides = []
+    for i in range(slide_count):
+        if i % 2:
+            bullet_points = [{"text": f"Finding {i}.{j}"} for j in range(5)]
+            slides.append(
+                {
+                    "type": "content",
+                    "title": f"Findings {i}",
+                    "content": {"bullet_points": bullet_points},
+                }
+            )
+        else:
+            slides.append(
+                {"type": "title", "title": f"Section {i}", "subtitle": "Subtitle"}
+            )
+
+    return {"theme": ColorTheme.PROFESSIONAL_TEST.value, "slides": slides}
+
+
+def load_per_slide(spec: dict) -> list:
+    """Build each slide model on its own and apply the theme per slide."""
+    color_scheme = ThemeColorScheme(theme=spec["theme"])
+    slides = []
+    for slide in spec["slides"]:
+        fields = {k: v for k, v in slide.items() if k != "type"}
+        if slide["type"] == "content":
+            fields["content"] = BulletPoints(
+                bullet_points=[
+                    BulletPoint(**bullet_point)
+                    for bullet_point in fields["content"]["bullet_points"]
+                ]
+            )
+            slide_model = ContentSlide(**fields)
+        else:
+            slide_model = TitleSlide(**fields)
+        color_scheme.apply_colors(slide_model)
+        slides.append(slide_model)
+
+    return slides
+
+
+def timed(label: str, func, *args, **kwargs) -> None:
+    """Print the best of three wall-clock timings."""
+    timings = []
+    for _ in range(3):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        timings.append(time.perf_counter() - start)
+
+    print(f"{label:<24} {min(timings) * 1000:8.1f} ms")
+
+
+# %%
+
+spec = make_spec(SLIDE_COUNT)
+spec_json = json.dumps(spec)
+
+timed("per-slide models", load_per_slide, spec)
+timed("validated, dict", load_deck, spec)
+timed("validated, json", load_deck, spec_json)
+
+# %%
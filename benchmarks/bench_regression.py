@@ -0,0 +1,376 @@
+"""
+Performance regression gate over the example decks and larger variants.
+
+Each scenario builds a deck in a fresh process, so its peak memory is its
+own. The build time, peak memory and output size are compared with the
+median of the recent passing runs in the history file, and the script
+exits with status 1 when any of them grows beyond its tolerance. Passing
+runs are appended to the history, which is local to each machine.
+
+Scaling checks compare a scenario with a smaller one of the same kind, and
+fail when the build time grows faster than the size, e.g. when adding each
+slide scans every slide before it.
+
+    python benchmarks/bench_regression.py
+    python benchmarks/bench_regression.py --time-tolerance 0.3 christmas dataframe
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+from pptgen.create_presentation import create_presentation
+from pptgen.entrypoint import generate_ppt
+from pptgen.model.base_paths import BasePaths
+from pptgen.model.memory_plan import format_bytes
+from pptgen.model.powerpoint import (
+    BulletPoint,
+    BulletPoints,
+    ColorTheme,
+    ContentSlide,
+    ImageSlide,
+    ThemeColorScheme,
+    TitleSlide,
+)
+from pptgen.model.pptx_model import PPTXModel
+
+HISTORY_FILE = Path(__file__).parent / "results" / "history.jsonl"
+METRICS = ("build_seconds", "peak_rss_bytes", "output_bytes")
+BULLET_TEXT = "Fact {} about the winter season, the snow and the cold"
+
+
+class ScenarioResult(BaseModel):
+    """Best build time, peak memory and output size of a scenario."""
+
+    build_seconds: float
+    peak_rss_bytes: Optional[int]  # None where the platform does not report it
+    output_bytes: int
+
+
+def christmas_slides(copies: int) -> list:
+    """Make the slides of the Christmas example, repeated a number of times."""
+    image_path = BasePaths().find_image("christmas_tree")
+    slides = []
+    for copy in range(1, copies + 1):
+        slides += [
+            TitleSlide(title=f"Christmas Presentation {copy}", subtitle="Happy!"),
+            ContentSlide(
+                title="Winter Facts",
+                content=BulletPoints(
+                    bullet_points=[
+                        BulletPoint(text="Snow is white"),
+                        BulletPoint(text="It's cold"),
+                        BulletPoint(text="People build snowmen"),
+                    ]
+                ),
+            ),
+            ImageSlide(title="Christmas Tree", image_path=image_path),
+        ]
+
+    return slides
+
+
+def long_content_slides(bullets: int) -> list:
+    """Make a content slide with many bullets, which continues over many slides."""
+    bullet_points = [BulletPoint(text=BULLET_TEXT.format(i)) for i in range(bullets)]
+
+    return [
+        ContentSlide(
+            title="Winter Facts", content=BulletPoints(bullet_points=bullet_points)
+        )
+    ]
+
+
+def write_frame(csv_path: Path, rows: int, columns: int) -> None:
+    """Write a synthetic UCC-like CSV file, the same for the same size."""
+    rng = np.random.default_rng(0)
+    dates = pd.Timestamp("2010-01-01") + pd.to_timedelta(
+        rng.integers(0, 14 * 365, rows), unit="D"
+    )
+    data = {"FILE_DATE": dates.strftime("%Y-%m-%d"), "FILE_YEAR": dates.year}
+    for i in range(columns - 2):
+        if i % 3 == 0:
+            values = pd.Series(rng.choice([f"cat_{j}" for j in range(50)], rows))
+        elif i % 3 == 1:
+            values = pd.Series(rng.normal(size=rows))
+        else:
+            values = pd.Series(rng.integers(0, 1_000_000, rows))
+        data[f"col_{i}"] = values.mask(rng.random(rows) < 0.05)
+
+    pd.DataFrame(data).to_csv(csv_path, index=False)
+
+
+def build_christmas(work_dir: Path, copies: int) -> Path:
+    """Build the Christmas example deck through create_presentation."""
+    color_scheme = ThemeColorScheme(theme=ColorTheme.CHRISTMAS)
+    pptx_model = PPTXModel(
+        file_name=str(work_dir / f"christmas_{copies}.pptx"),
+        pptx_raw=create_presentation(christmas_slides(copies), color_scheme),
+    )
+    pptx_model.write_pptx()
+
+    return pptx_model.pptx_file
+
+
+def build_long_content(work_dir: Path, bullets: int) -> Path:
+    """Build a deck of one long content slide through create_presentation."""
+    color_scheme = ThemeColorScheme(theme=ColorTheme.CHRISTMAS)
+    pptx_model = PPTXModel(
+        file_name=str(work_dir / f"content_{bullets}.pptx"),
+        pptx_raw=create_presentation(long_content_slides(bullets), color_scheme),
+    )
+    pptx_model.write_pptx()
+
+    return pptx_model.pptx_file
+
+
+def build_dataframe(work_dir: Path, rows: int, columns: int) -> Path:
+    """Build the dataframe deck of a synthetic CSV file through generate_ppt."""
+    output_file = work_dir / f"dataframe_{rows}x{columns}.pptx"
+    generate_ppt(
+        "Benchmark", "Synthetic data", work_dir / f"{rows}x{columns}.csv", output_file
+    )
+
+    return output_file
+
+
+# Scenario name, builder and its size arguments
+SCENARIOS: Dict[str, tuple] = {
+    "christmas": (build_christmas, {"copies": 1}),
+    "christmas_x100": (build_christmas, {"copies": 100}),
+    "content_1k": (build_long_content, {"bullets": 1_000}),
+    "content_4k": (build_long_content, {"bullets": 4_000}),
+    "dataframe": (build_dataframe, {"rows": 10_000, "columns": 8}),
+    "dataframe_large": (build_dataframe, {"rows": 500_000, "columns": 12}),
+    "dataframe_wide": (build_dataframe, {"rows": 20_000, "columns": 150}),
+}
+
+# Scenario, the smaller scenario it is compared with, and how much larger it is
+SCALING_CHECKS = [("content_4k", "content_1k", 4)]
+
+
+def format_metric(metric: str, value: Optional[float]) -> str:
+    """Format a metric value for the report."""
+    if value is None:
+        return "-"
+    if metric == "build_seconds":
+        return f"{value:.2f}s"
+
+    return format_bytes(int(value))
+
+
+def process_peak_rss_bytes() -> Optional[int]:
+    """
+    Get the peak resident memory of this process since it started.
+
+    On Linux, getrusage carries over the peak of the parent a process was
+    forked from, even across exec, while VmHWM covers this process only.
+    None where /proc does not report it.
+    """
+    try:
+        with open("/proc/self/status", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    return None
+
+
+def run_once(builder: Callable, work_dir: Path, kwargs: dict) -> ScenarioResult:
+    """Build a deck in this process, which must be a fresh one."""
+    start_time = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        output_file = builder(work_dir, **kwargs)
+
+    return ScenarioResult(
+        build_seconds=time.perf_counter() - start_time,
+        peak_rss_bytes=process_peak_rss_bytes(),
+        output_bytes=output_file.stat().st_size,
+    )
+
+
+def run_scenario(name: str, work_dir: Path, repeat: int) -> ScenarioResult:
+    """Run a scenario in fresh processes, keeping the best of each metric."""
+    builder, kwargs = SCENARIOS[name]
+    if builder is build_dataframe:
+        csv_path = work_dir / f"{kwargs['rows']}x{kwargs['columns']}.csv"
+        if not csv_path.exists():
+            write_frame(csv_path, kwargs["rows"], kwargs["columns"])
+
+    results = []
+    for _ in range(repeat):
+        # Spawned rather than forked, so no memory is inherited
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            results.append(
+                executor.submit(run_once, builder, work_dir, kwargs).result()
+            )
+
+    peaks = [result.peak_rss_bytes for result in results]
+    return ScenarioResult(
+        build_seconds=min(result.build_seconds for result in results),
+        peak_rss_bytes=None if None in peaks else min(peaks),
+        output_bytes=min(result.output_bytes for result in results),
+    )
+
+
+def check_scaling(results: Dict[str, ScenarioResult], tolerance: float) -> List[str]:
+    """Check that build times grow no faster than the size of their scenarios."""
+    regressions = []
+    for name, smaller, size_ratio in SCALING_CHECKS:
+        if name not in results or smaller not in results:
+            continue
+
+        time_ratio = results[name].build_seconds / results[smaller].build_seconds
+        status = ""
+        if time_ratio > size_ratio * (1 + tolerance):
+            status = f"REGRESSED (linear x{size_ratio}, tolerance {tolerance:+.0%})"
+            regressions.append(f"{name} scaling")
+        print(
+            f"{name:<18} {'scaling':<15} {f'x{time_ratio:.1f}':>10} {smaller:>10} {status}"
+        )
+
+    return regressions
+
+
+def load_history(history_file: Path) -> List[dict]:
+    """Load the recorded runs, oldest first."""
+    if not history_file.exists():
+        return []
+
+    with open(history_file, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def baseline(
+    history: List[dict], name: str, metric: str, window: int
+) -> Optional[float]:
+    """Get the median of a metric over the last recorded runs of a scenario."""
+    values = [
+        run["scenarios"][name][metric]
+        for run in history
+        if name in run["scenarios"] and run["scenarios"][name][metric] is not None
+    ][-window:]
+
+    return statistics.median(values) if values else None
+
+
+def git_commit() -> Optional[str]:
+    """Get the commit being benchmarked, if run from a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> int:
+    """Run the scenarios, compare them with the history and record passing runs."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("scenarios", nargs="*", default=list(SCENARIOS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--window", type=int, default=5, help="Runs in the baseline")
+    parser.add_argument("--time-tolerance", type=float, default=0.20)
+    parser.add_argument("--memory-tolerance", type=float, default=0.10)
+    parser.add_argument("--size-tolerance", type=float, default=0.02)
+    parser.add_argument(
+        "--scaling-tolerance",
+        type=float,
+        default=0.5,
+        help="Share by which build time may grow faster than the scenario size",
+    )
+    parser.add_argument(
+        "--time-floor",
+        type=float,
+        default=0.05,
+        help="Seconds a build may slow down by regardless of tolerance",
+    )
+    parser.add_argument("--history", type=Path, default=HISTORY_FILE)
+    parser.add_argument(
+        "--accept", action="store_true", help="Record the run even if it regressed"
+    )
+    parser.add_argument("--no-record", action="store_true")
+    args = parser.parse_args()
+
+    unknown = sorted(set(args.scenarios) - set(SCENARIOS))
+    if unknown:
+        parser.error(f"Unknown scenarios {unknown}, choose from {list(SCENARIOS)}")
+
+    tolerances = dict(
+        zip(METRICS, (args.time_tolerance, args.memory_tolerance, args.size_tolerance))
+    )
+    history = load_history(args.history)
+    results: Dict[str, ScenarioResult] = {}
+    regressions = []
+
+    print(f"{'scenario':<18} {'metric':<15} {'current':>10} {'baseline':>10}  change")
+    with tempfile.TemporaryDirectory() as work_dir:
+        for name in args.scenarios:
+            results[name] = run_scenario(name, Path(work_dir), args.repeat)
+            for metric in METRICS:
+                current = getattr(results[name], metric)
+                reference = baseline(history, name, metric, args.window)
+                row = (
+                    f"{name:<18} {metric:<15} {format_metric(metric, current):>10} "
+                    f"{format_metric(metric, reference):>10}"
+                )
+                if current is None or reference is None:
+                    print(row)
+                    continue
+
+                change = current / reference - 1
+                status = ""
+                # Timer noise dominates builds of a few milliseconds
+                slack = args.time_floor if metric == "build_seconds" else 0
+                if change > tolerances[metric] and current - reference > slack:
+                    status = f"REGRESSED (tolerance {tolerances[metric]:+.0%})"
+                    regressions.append(f"{name} {metric}")
+                print(f"{row} {change:+7.1%} {status}")
+
+    regressions += check_scaling(results, args.scaling_tolerance)
+
+    if not args.no_record and (args.accept or not regressions):
+        args.history.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.history, "a", encoding="utf-8") as f:
+            run = {
+                "recorded_at": datetime.now().isoformat(timespec="seconds"),
+                "commit": git_commit(),
+                "python": sys.version.split()[0],
+                "scenarios": {
+                    name: result.model_dump() for name, result in results.items()
+                },
+            }
+            f.write(json.dumps(run) + "\n")
+
+    if regressions:
+        print(f"Regressed: {', '.join(regressions)}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,6 +15,7 @@ from pptgen.generate_dataframe_meta import (
     create_overview_slide,
     get_dataframe_metadata,
 )
+from pptgen.layout_planner import plan_metadata_layout
 from pptgen.model.powerpoint import ColorTheme, ThemeColorScheme, TitleSlide
 from pptgen.model.pptx_model import PPTXModel
 
@@ -49,12 +50,13 @@ add_title_slide(prs, title_slide_model, color_scheme)
 # Add overview slide
 create_overview_slide(df, prs, color_scheme, COMPANY_NAME)
 
-# Generate slides based on the number of columns
-if len(columns_meta.columns) > 10:
+# Plan the metadata slides to fit the columns
+layout_plan = plan_metadata_layout(columns_meta)
+if layout_plan.view == "consolidated":
     print("Creating consolidated view")
-    slides = create_consolidated_view(columns_meta, prs, color_scheme)
+    slides = create_consolidated_view(columns_meta, prs, color_scheme, layout_plan)
 else:
-    slides = create_detailed_view(columns_meta, prs, color_scheme)
+    slides = create_detailed_view(columns_meta, prs, color_scheme, layout_plan)
 
 # %%
 
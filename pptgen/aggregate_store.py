@@ -0,0 +1,416 @@
+"""Keep the aggregates behind the dataframe slides in SQLite, updated incrementally."""
+
+import hashlib
+import json
+import re
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from pptgen.compute.out_of_core import DistinctCounter, merge_dtypes
+from pptgen.compute.pandas_backend import PandasBackend
+from pptgen.model.base_paths import BasePaths
+from pptgen.model.dataframe_meta import ColumnMeta
+
+DATE_COLUMN = "FILE_DATE"
+CHUNK_ROWS = 200_000
+HASH_BLOCK_BYTES = 1 << 20
+SCHEMA_VERSION = 2  # Stores of other versions are only opened to be reset
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    company TEXT PRIMARY KEY,
+    csv_path TEXT NOT NULL,
+    file_bytes INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    header TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    row_count INTEGER NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS column_profiles (
+    company TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    column_name TEXT NOT NULL,
+    dtypes TEXT NOT NULL,
+    non_null_count INTEGER NOT NULL,
+    null_count INTEGER NOT NULL,
+    unique_values INTEGER NOT NULL,
+    distinct_sketch BLOB NOT NULL,
+    PRIMARY KEY (company, position)
+);
+CREATE TABLE IF NOT EXISTS year_counts (
+    company TEXT NOT NULL,
+    column_name TEXT NOT NULL,
+    value REAL NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (company, column_name, value)
+);
+CREATE TABLE IF NOT EXISTS daily_counts (
+    company TEXT NOT NULL,
+    date TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (company, date)
+);
+"""
+TABLES = ("sources", "column_profiles", "year_counts", "daily_counts")
+
+
+def is_year_candidate(column: str) -> bool:
+    """Check whether a column may be the year column, by its name."""
+    return (
+        column == "FILE_YEAR" or re.search(r"year", column, re.IGNORECASE) is not None
+    )
+
+
+def hash_file(csv_path: Path, prefix_bytes: int) -> Tuple[Optional[str], str]:
+    """
+    Hash a file and its first bytes in one pass.
+
+    Returns:
+    Tuple[Optional[str], str]: SHA-256 of the prefix, None if the file is
+    shorter, and of the whole file.
+    """
+    hasher = hashlib.sha256()
+    prefix_hash = None
+    position = 0
+    with open(csv_path, "rb") as f:
+        while True:
+            if position == prefix_bytes:
+                prefix_hash = hasher.hexdigest()
+            block = f.read(
+                min(HASH_BLOCK_BYTES, prefix_bytes - position)
+                if position < prefix_bytes
+                else HASH_BLOCK_BYTES
+            )
+            if not block:
+                break
+            hasher.update(block)
+            position += len(block)
+
+    return prefix_hash, hasher.hexdigest()
+
+
+class AggregateStore:
+    """
+    SQLite store of row counts, year counts, daily counts and column profiles.
+
+    Every table is keyed by company, so the aggregates of a deck are read
+    with an index lookup. A CSV file whose stored bytes are unchanged and
+    that only grew is updated from its new rows, and any other change
+    rebuilds the company. Checking this hashes the whole file, still far
+    cheaper than parsing it. Distinct values are kept as bounded, mergeable
+    sketches, so unique counts are exact below 4,096 values and estimated
+    above, across appends too.
+
+    A store written by another schema version is not opened, unless reset
+    is set, which drops its aggregates to rebuild them from their files.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        chunk_rows: int = CHUNK_ROWS,
+        reset: bool = False,
+    ):
+        self.db_path = Path(db_path or BasePaths().data_path / "aggregates.sqlite")
+        self.chunk_rows = chunk_rows
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.row_factory = sqlite3.Row
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        is_empty = not self.conn.execute("SELECT 1 FROM sqlite_master").fetchone()
+        if version != SCHEMA_VERSION and not is_empty:
+            if not reset:
+                self.conn.close()
+                raise ValueError(
+                    f"The aggregate store {self.db_path} has schema version "
+                    f"{version}, not {SCHEMA_VERSION}. Open it with reset=True to "
+                    "drop its aggregates and rebuild them from their files."
+                )
+            for table in TABLES:
+                self.conn.execute(f"DROP TABLE IF EXISTS {table}")
+        self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def source(self, company: str) -> sqlite3.Row:
+        """Get the stored source file of a company."""
+        source = self.conn.execute(
+            "SELECT * FROM sources WHERE company = ?", (company,)
+        ).fetchone()
+        if source is None:
+            raise ValueError(f"No aggregates stored for {company}.")
+
+        return source
+
+    def is_append(
+        self,
+        csv_path: Path,
+        file_bytes: int,
+        header: List[str],
+        prefix_hash: Optional[str],
+        source: sqlite3.Row,
+    ) -> bool:
+        """Check whether a file only had whole rows appended since it was stored."""
+        stored_bytes = source["file_bytes"]
+        if file_bytes <= stored_bytes or header != json.loads(source["header"]):
+            return False
+
+        with open(csv_path, "rb") as f:
+            f.seek(stored_bytes - 1)
+            if f.read(1) != b"\n":
+                return False
+
+        return prefix_hash == source["content_hash"]
+
+    def load_profiles(self, company: str) -> Dict[str, Dict[str, Any]]:
+        """Load the running column profiles of a company, to add new rows to."""
+        profiles = {}
+        for row in self.conn.execute(
+            "SELECT * FROM column_profiles WHERE company = ? ORDER BY position",
+            (company,),
+        ):
+            counter = DistinctCounter.from_bytes(row["distinct_sketch"])
+            profiles[row["column_name"]] = {
+                "dtypes": set(json.loads(row["dtypes"])),
+                "non_null": row["non_null_count"],
+                "null": row["null_count"],
+                "distinct": counter,
+            }
+
+        return profiles
+
+    def update(self, company: str, csv_path: Path) -> str:
+        """
+        Bring the aggregates of a company up to date with its CSV file.
+
+        Args:
+        company (str): The company the file belongs to.
+        csv_path (Path): Path to the CSV file.
+
+        Returns:
+        str: "current", "appended" or "rebuilt".
+        """
+        csv_path = Path(csv_path).resolve()
+        stat = csv_path.stat()
+        header = list(pd.read_csv(csv_path, nrows=0).columns)
+        source = self.conn.execute(
+            "SELECT * FROM sources WHERE company = ?", (company,)
+        ).fetchone()
+
+        offset = 0
+        stored_bytes = 0
+        if source is not None and source["csv_path"] == str(csv_path):
+            if (source["file_bytes"], source["mtime_ns"]) == (
+                stat.st_size,
+                stat.st_mtime_ns,
+            ):
+                return "current"
+            stored_bytes = source["file_bytes"]
+
+        prefix_hash, content_hash = hash_file(csv_path, stored_bytes)
+        if stored_bytes and self.is_append(
+            csv_path, stat.st_size, header, prefix_hash, source
+        ):
+            offset = stored_bytes
+
+        with self.conn:
+            if offset:
+                profiles = self.load_profiles(company)
+                row_count = source["row_count"]
+            else:
+                for table in TABLES:
+                    self.conn.execute(
+                        f"DELETE FROM {table} WHERE company = ?", (company,)
+                    )
+                profiles = {}
+                row_count = 0
+
+            row_count += self.scan_rows(company, csv_path, offset, header, profiles)
+
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO column_profiles VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        company,
+                        position,
+                        col,
+                        json.dumps(sorted(profile["dtypes"])),
+                        int(profile["non_null"]),
+                        int(profile["null"]),
+                        profile["distinct"].count(),
+                        profile["distinct"].to_bytes(),
+                    )
+                    for position, (col, profile) in enumerate(profiles.items())
+                ],
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    company,
+                    str(csv_path),
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                    json.dumps(header),
+                    content_hash,
+                    row_count,
+                    datetime.now().isoformat(timespec="seconds"),
+                ),
+            )
+
+        return "appended" if offset else "rebuilt"
+
+    def scan_rows(
+        self,
+        company: str,
+        csv_path: Path,
+        offset: int,
+        header: List[str],
+        profiles: Dict[str, Dict[str, Any]],
+    ) -> int:
+        """Add the rows from an offset of a file to the stored aggregates."""
+        pandas = PandasBackend()
+        daily_counts = []
+        year_counts: Dict[str, List[pd.Series]] = {}
+        rows = 0
+
+        with open(csv_path, "rb") as f:
+            f.seek(offset)
+            reader = pd.read_csv(
+                f,
+                header=None if offset else 0,
+                names=header if offset else None,
+                chunksize=self.chunk_rows,
+            )
+            with reader:
+                for chunk in reader:
+                    rows += len(chunk)
+                    for col in chunk.columns:
+                        values = chunk[col]
+                        profile = profiles.setdefault(
+                            col,
+                            {
+                                "dtypes": set(),
+                                "non_null": 0,
+                                "null": 0,
+                                "distinct": DistinctCounter(),
+                            },
+                        )
+                        profile["dtypes"].add(str(values.dtype))
+                        profile["non_null"] += values.count()
+                        profile["null"] += values.isnull().sum()
+                        profile["distinct"].add(values.dropna())
+                        if is_year_candidate(col) and values.dtype.kind in "iuf":
+                            year_counts.setdefault(col, []).append(
+                                values.value_counts()
+                            )
+                    if DATE_COLUMN in chunk.columns:
+                        daily_counts.append(pandas.daily_counts(chunk, DATE_COLUMN))
+
+        # Counts of rows already stored are added to
+        for col, counts in year_counts.items():
+            totals = pd.concat(counts).groupby(level=0).sum()
+            self.conn.executemany(
+                "INSERT INTO year_counts VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (company, column_name, value) "
+                "DO UPDATE SET count = count + excluded.count",
+                [
+                    (company, col, float(value), int(count))
+                    for value, count in totals.items()
+                ],
+            )
+        if daily_counts:
+            totals = pd.concat(daily_counts).groupby("date")[0].sum()
+            self.conn.executemany(
+                "INSERT INTO daily_counts VALUES (?, ?, ?) "
+                "ON CONFLICT (company, date) "
+                "DO UPDATE SET count = count + excluded.count",
+                [
+                    (company, date.strftime("%Y-%m-%d"), int(count))
+                    for date, count in totals.items()
+                ],
+            )
+
+        return rows
+
+    def row_count(self, company: str) -> int:
+        """Get the stored row count of a company."""
+        return self.source(company)["row_count"]
+
+    def schema(self, company: str) -> Dict[str, str]:
+        """Get the column names and dtype names of a company's file."""
+        self.source(company)
+
+        return {
+            row["column_name"]: merge_dtypes(json.loads(row["dtypes"]))
+            for row in self.conn.execute(
+                "SELECT column_name, dtypes FROM column_profiles "
+                "WHERE company = ? ORDER BY position",
+                (company,),
+            )
+        }
+
+    def column_metadata(self, company: str) -> List[ColumnMeta]:
+        """Get the stored column profiles of a company."""
+        self.source(company)
+
+        metadata = []
+        for row in self.conn.execute(
+            "SELECT column_name, dtypes, non_null_count, null_count, unique_values, "
+            "distinct_sketch FROM column_profiles WHERE company = ? ORDER BY position",
+            (company,),
+        ):
+            distinct = DistinctCounter.from_bytes(row["distinct_sketch"])
+            metadata.append(
+                ColumnMeta(
+                    column=row["column_name"],
+                    type=merge_dtypes(json.loads(row["dtypes"])),
+                    non_null_count=row["non_null_count"],
+                    null_count=row["null_count"],
+                    unique_values=row["unique_values"],
+                    is_estimate=not distinct.is_exact,
+                    unique_values_ci=distinct.interval(),
+                )
+            )
+
+        return metadata
+
+    def value_counts(self, company: str, column: str) -> pd.Series:
+        """Get the stored counts of a year column, sorted by value."""
+        dtype = self.schema(company).get(column)
+        if dtype not in ("int64", "float64") or not is_year_candidate(column):
+            raise ValueError(f"No counts stored for the {column} column.")
+
+        rows = self.conn.execute(
+            "SELECT value, count FROM year_counts "
+            "WHERE company = ? AND column_name = ? ORDER BY value",
+            (company, column),
+        ).fetchall()
+
+        index = pd.Index([row["value"] for row in rows], dtype=dtype, name=column)
+        return pd.Series(
+            [row["count"] for row in rows], index=index, dtype="int64", name="count"
+        )
+
+    def daily_counts(self, company: str) -> pd.DataFrame:
+        """Get the stored row counts per day of a company."""
+        self.source(company)
+        rows = self.conn.execute(
+            "SELECT date, count FROM daily_counts WHERE company = ? ORDER BY date",
+            (company,),
+        ).fetchall()
+
+        return pd.DataFrame(
+            {
+                "date": pd.to_datetime([row["date"] for row in rows]),
+                0: pd.Series([row["count"] for row in rows], dtype="int64"),
+            }
+        )
@@ -0,0 +1,40 @@
+from pptgen.compute.base import ComputeBackend, find_year_column
+from pptgen.compute.out_of_core import ChunkedBackend, ColumnPrunedBackend
+from pptgen.compute.pandas_backend import PandasBackend
+from pptgen.compute.parallel_backend import ParallelPandasBackend
+from pptgen.compute.polars_backend import PolarsBackend, pl
+
+BACKENDS = {
+    "pandas": PandasBackend,
+    "polars": PolarsBackend,
+    "parallel": ParallelPandasBackend,
+}
+
+
+def get_backend(name: str = "pandas") -> ComputeBackend:
+    """Get a compute backend by name."""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown compute backend: {name}")
+
+    return BACKENDS[name]()
+
+
+def backend_for(df) -> ComputeBackend:
+    """Get the compute backend for a frame."""
+    if pl is not None and isinstance(df, (pl.DataFrame, pl.LazyFrame)):
+        return PolarsBackend()
+
+    return PandasBackend()
+
+
+__all__ = [
+    "ComputeBackend",
+    "PandasBackend",
+    "PolarsBackend",
+    "ParallelPandasBackend",
+    "ColumnPrunedBackend",
+    "ChunkedBackend",
+    "get_backend",
+    "backend_for",
+    "find_year_column",
+]
@@ -0,0 +1,58 @@
+"""Interface for the compute backends behind the dataframe slides."""
+
+import re
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from pptgen.model.dataframe_meta import ColumnMeta
+from pptgen.time_aggregation import resample_counts
+
+
+def find_year_column(schema: Dict[str, str]) -> Optional[str]:
+    """Find the year column from the column names and dtypes."""
+    if "FILE_YEAR" in schema:
+        return "FILE_YEAR"
+
+    year_columns = [
+        col
+        for col, dtype in schema.items()
+        if re.search(r"year", col, re.IGNORECASE) and dtype in ("int64", "float64")
+    ]
+    return year_columns[0] if year_columns else None
+
+
+class ComputeBackend(ABC):
+    """Compute the aggregates shown on the dataframe slides."""
+
+    name: str
+
+    @abstractmethod
+    def read_csv(self, csv_data_path: Path) -> Any:
+        """Read a CSV file into the backend's frame type."""
+
+    @abstractmethod
+    def row_count(self, df: Any) -> int:
+        """Count the rows of a frame."""
+
+    @abstractmethod
+    def schema(self, df: Any) -> Dict[str, str]:
+        """Get the column names and pandas-style dtype names, without scanning data."""
+
+    @abstractmethod
+    def column_metadata(self, df: Any) -> List[ColumnMeta]:
+        """Profile every column of a frame."""
+
+    @abstractmethod
+    def value_counts(self, df: Any, column: str) -> pd.Series:
+        """Count the non-null values of a column, sorted by value."""
+
+    @abstractmethod
+    def daily_counts(self, df: Any, date_column: str) -> pd.DataFrame:
+        """Count rows per day, as a frame with "date" and 0 (count) columns."""
+
+    def monthly_counts(self, df: Any, date_column: str) -> pd.DataFrame:
+        """Count rows per month, as a frame with "date" and 0 (count) columns."""
+        return resample_counts(self.daily_counts(df, date_column), "month")
@@ -0,0 +1,244 @@
+"""Pandas compute backends that never hold a whole CSV file in memory."""
+
+import math
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from pptgen.compute.base import ComputeBackend
+from pptgen.compute.pandas_backend import PandasBackend
+from pptgen.model.dataframe_meta import ColumnMeta
+
+SKETCH_SIZE = 4096  # Smallest hashes kept per column, exact below this many values
+SKETCH_BYTES = SKETCH_SIZE * 8
+HASH_SPACE = float(1 << 64)
+
+
+def merge_dtypes(dtypes: List[str]) -> str:
+    """Get the dtype pandas infers for a whole column from the dtypes of its chunks."""
+    kinds = set(dtypes)
+    if kinds == {"int64"}:
+        return "int64"
+    if kinds <= {"int64", "float64"}:
+        return "float64"
+    if kinds == {"bool"}:
+        return "bool"
+
+    return "object"
+
+
+class DistinctCounter:
+    """
+    Count the distinct values of a column with a k-minimum-values sketch.
+
+    Only the SKETCH_SIZE smallest distinct 64-bit hashes are kept, so memory
+    stays at SKETCH_BYTES per column however many rows are added. The count
+    is exact while fewer distinct values have been added, and otherwise
+    estimated from how densely the kept hashes fill the hash space, with a
+    relative standard error of about 1.6%. Sketches of parts of a column
+    merge into the sketch of the whole column.
+    """
+
+    def __init__(self, hashes: Optional[np.ndarray] = None) -> None:
+        self.hashes = np.empty(0, dtype=np.uint64) if hashes is None else hashes
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "DistinctCounter":
+        """Load a sketch saved with to_bytes."""
+        return cls(np.frombuffer(data, dtype=np.uint64).copy())
+
+    def to_bytes(self) -> bytes:
+        """Save the sketch, at most SKETCH_BYTES long."""
+        return self.hashes.tobytes()
+
+    @property
+    def is_exact(self) -> bool:
+        """Check whether every distinct value added is still in the sketch."""
+        return len(self.hashes) < SKETCH_SIZE
+
+    def add(self, values: pd.Series) -> None:
+        """Add the non-null values of a chunk."""
+        # Chunks of the same column may parse as int or float, or bool or object
+        if values.dtype.kind in "iuf":
+            values = values.astype("float64")
+        elif values.dtype.kind == "b":
+            values = values.astype(object)
+        hashes = pd.util.hash_array(values.to_numpy())
+        if not self.is_exact:
+            hashes = hashes[hashes < self.hashes[-1]]
+        self.merge_hashes(hashes)
+
+    def merge(self, other: "DistinctCounter") -> None:
+        """Add the values of another sketch."""
+        self.merge_hashes(other.hashes)
+
+    def merge_hashes(self, hashes: np.ndarray) -> None:
+        """Keep the smallest distinct hashes of the sketch and new hashes."""
+        self.hashes = np.union1d(self.hashes, hashes)[:SKETCH_SIZE]
+
+    def count(self) -> int:
+        """Count, or estimate, the distinct values added."""
+        if self.is_exact:
+            return len(self.hashes)
+
+        return round((SKETCH_SIZE - 1) * HASH_SPACE / (float(self.hashes[-1]) + 1))
+
+    def interval(self) -> Optional[Tuple[int, int]]:
+        """Get the 95% interval of an estimated count, None when exact."""
+        if self.is_exact:
+            return None
+
+        count = self.count()
+        margin = 1.96 / math.sqrt(SKETCH_SIZE - 2)
+        return max(round(count * (1 - margin)), SKETCH_SIZE), round(
+            count * (1 + margin)
+        )
+
+
+class OutOfCoreBackend(ComputeBackend):
+    """
+    Base for backends whose frames are CSV paths, read a part at a time.
+
+    The schema and row count are cached from the column metadata pass, so
+    the overview slide does not read the file again for them.
+    """
+
+    def __init__(self) -> None:
+        self.pandas = PandasBackend()
+        self._schemas: Dict[Path, Dict[str, str]] = {}
+        self._row_counts: Dict[Path, int] = {}
+
+    def read_csv(self, csv_data_path: Path) -> Path:
+        """Defer reading the CSV file until an aggregate is computed."""
+        return Path(csv_data_path)
+
+    def cache_metadata(self, df: Path, metadata: List[ColumnMeta]) -> None:
+        """Cache the schema and row count found while profiling the columns."""
+        self._schemas[df] = {col_meta.column: col_meta.type for col_meta in metadata}
+        if metadata:
+            self._row_counts[df] = metadata[0].non_null_count + metadata[0].null_count
+
+    def row_count(self, df: Path) -> int:
+        """Count the rows of a CSV file, reading its first column only."""
+        if df not in self._row_counts:
+            self._row_counts[df] = self.count_rows(df)
+
+        return self._row_counts[df]
+
+    def schema(self, df: Path) -> Dict[str, str]:
+        """Get the column names and dtype names, profiling the columns if needed."""
+        if df not in self._schemas:
+            self.column_metadata(df)
+
+        return self._schemas[df]
+
+    def count_rows(self, df: Path) -> int:
+        """Count the rows of a CSV file."""
+        return len(pd.read_csv(df, usecols=[0]))
+
+
+class ColumnPrunedBackend(OutOfCoreBackend):
+    """Compute backend that reads a CSV file a group of columns at a time."""
+
+    name = "column_pruned"
+
+    def __init__(self, column_groups: List[List[str]]) -> None:
+        super().__init__()
+        self.column_groups = column_groups
+
+    def column_metadata(self, df: Path) -> List[ColumnMeta]:
+        """Profile every column, reading one group of columns at a time."""
+        metadata = []
+        for columns in self.column_groups:
+            metadata += self.pandas.column_metadata(pd.read_csv(df, usecols=columns))
+        self.cache_metadata(df, metadata)
+
+        return metadata
+
+    def value_counts(self, df: Path, column: str) -> pd.Series:
+        """Count the non-null values of a column, reading that column only."""
+        return self.pandas.value_counts(pd.read_csv(df, usecols=[column]), column)
+
+    def daily_counts(self, df: Path, date_column: str) -> pd.DataFrame:
+        """Count rows per day, reading the date column only."""
+        return self.pandas.daily_counts(
+            pd.read_csv(df, usecols=[date_column]), date_column
+        )
+
+
+class ChunkedBackend(OutOfCoreBackend):
+    """
+    Compute backend that streams a CSV file in chunks of rows.
+
+    Distinct values are counted with a sketch of their 64-bit hashes, so
+    memory does not grow with the file. Unique counts are exact up to hash
+    collisions below SKETCH_SIZE values, and estimated with an interval above.
+    """
+
+    name = "chunked"
+
+    def __init__(self, chunk_rows: int) -> None:
+        super().__init__()
+        self.chunk_rows = chunk_rows
+
+    def iter_chunks(
+        self, df: Path, usecols: Optional[List] = None
+    ) -> Iterator[pd.DataFrame]:
+        """Read a CSV file in chunks of rows."""
+        with pd.read_csv(df, usecols=usecols, chunksize=self.chunk_rows) as reader:
+            yield from reader
+
+    def count_rows(self, df: Path) -> int:
+        """Count the rows of a CSV file, streaming its first column."""
+        return sum(len(chunk) for chunk in self.iter_chunks(df, usecols=[0]))
+
+    def column_metadata(self, df: Path) -> List[ColumnMeta]:
+        """Profile every column in a single pass over the chunks."""
+        non_null: Optional[pd.Series] = None
+        null: Optional[pd.Series] = None
+        dtypes: Dict[str, List[str]] = {}
+        distinct: Dict[str, DistinctCounter] = {}
+
+        for chunk in self.iter_chunks(df):
+            non_null = chunk.count() if non_null is None else non_null + chunk.count()
+            nulls = chunk.isnull().sum()
+            null = nulls if null is None else null + nulls
+            for col in chunk.columns:
+                dtypes.setdefault(col, []).append(str(chunk[col].dtype))
+                distinct.setdefault(col, DistinctCounter()).add(chunk[col].dropna())
+
+        metadata = [
+            ColumnMeta(
+                column=col,
+                type=merge_dtypes(dtypes[col]),
+                non_null_count=non_null[col],
+                null_count=null[col],
+                unique_values=distinct[col].count(),
+                is_estimate=not distinct[col].is_exact,
+                unique_values_ci=distinct[col].interval(),
+            )
+            for col in dtypes
+        ]
+        self.cache_metadata(df, metadata)
+
+        return metadata
+
+    def value_counts(self, df: Path, column: str) -> pd.Series:
+        """Count the non-null values of a column, streaming that column."""
+        totals = pd.Series(dtype="int64", name="count")
+        for chunk in self.iter_chunks(df, usecols=[column]):
+            # Fold each chunk into the totals, so they stay one row per value
+            totals = totals.add(chunk[column].value_counts(), fill_value=0)
+
+        return totals.astype("int64").rename("count").sort_index()
+
+    def daily_counts(self, df: Path, date_column: str) -> pd.DataFrame:
+        """Count rows per day, streaming the date column."""
+        totals = pd.Series(dtype="int64")
+        for chunk in self.iter_chunks(df, usecols=[date_column]):
+            counts = self.pandas.daily_counts(chunk, date_column).set_index("date")[0]
+            totals = totals.add(counts, fill_value=0)
+
+        return totals.astype("int64").rename_axis("date").reset_index(name=0)
@@ -0,0 +1,57 @@
+"""Pandas compute backend."""
+
+from pathlib import Path
+from typing import Dict, List
+
+import pandas as pd
+
+from pptgen.compute.base import ComputeBackend
+from pptgen.model.dataframe_meta import ColumnMeta
+
+
+def series_metadata(column: str, values: pd.Series) -> ColumnMeta:
+    """Profile the values of a column."""
+    col_type = str(values.dtype)
+    non_null = values.count()
+    null = values.isnull().sum()
+    unique = values.nunique()
+
+    return ColumnMeta(
+        column=column,
+        type=col_type,
+        non_null_count=non_null,
+        null_count=null,
+        unique_values=unique,
+    )
+
+
+class PandasBackend(ComputeBackend):
+    """Compute backend for pandas DataFrames."""
+
+    name = "pandas"
+
+    def read_csv(self, csv_data_path: Path) -> pd.DataFrame:
+        """Read a CSV file into a DataFrame."""
+        return pd.read_csv(csv_data_path)
+
+    def row_count(self, df: pd.DataFrame) -> int:
+        """Count the rows of a DataFrame."""
+        return len(df)
+
+    def schema(self, df: pd.DataFrame) -> Dict[str, str]:
+        """Get the column names and dtype names."""
+        return {col: str(dtype) for col, dtype in df.dtypes.items()}
+
+    def column_metadata(self, df: pd.DataFrame) -> List[ColumnMeta]:
+        """Profile every column of a DataFrame."""
+        return [series_metadata(col, df[col]) for col in df.columns]
+
+    def value_counts(self, df: pd.DataFrame, column: str) -> pd.Series:
+        """Count the non-null values of a column, sorted by value."""
+        return df[column].value_counts().sort_index()
+
+    def daily_counts(self, df: pd.DataFrame, date_column: str) -> pd.DataFrame:
+        """Count rows per day."""
+        dates = pd.to_datetime(df[date_column], format="%Y-%m-%d").rename("date")
+
+        return dates.groupby(dates.dt.normalize()).size().reset_index(name=0)
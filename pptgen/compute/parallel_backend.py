@@ -0,0 +1,133 @@
+"""Pandas compute backend that profiles columns in worker processes."""
+
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from pptgen.compute.pandas_backend import PandasBackend, series_metadata
+from pptgen.model.dataframe_meta import ColumnMeta
+from pptgen.model.shared_frame import SharedColumn
+
+MIN_PARALLEL_CELLS = 2_000_000  # Smaller frames profile faster than workers start
+BUFFER_ALIGNMENT = 64  # Align each column buffer to a cache line
+SHAREABLE_KINDS = "biufcmM"  # numpy dtypes with fixed-width values
+
+
+def is_shareable(values: pd.Series) -> bool:
+    """Check whether a column is a fixed-width numpy buffer, unlike strings."""
+    return isinstance(values.dtype, np.dtype) and values.dtype.kind in SHAREABLE_KINDS
+
+
+def shard_columns(column_bytes: Dict[str, int], shards: int) -> List[List[str]]:
+    """Split columns into at most the given number of shards of similar size."""
+    heap = [(0, shard) for shard in range(shards)]
+    assignment: List[List[str]] = [[] for _ in range(shards)]
+    for col in sorted(column_bytes, key=column_bytes.get, reverse=True):
+        shard_bytes, shard = heapq.heappop(heap)
+        assignment[shard].append(col)
+        heapq.heappush(heap, (shard_bytes + column_bytes[col], shard))
+
+    return [columns for columns in assignment if columns]
+
+
+def profile_shared_columns(
+    block_name: str, columns: List[SharedColumn]
+) -> List[ColumnMeta]:
+    """Profile columns in a worker, viewing their buffers in shared memory."""
+    block = shared_memory.SharedMemory(name=block_name)
+    try:
+        metadata = []
+        for shared in columns:
+            values = np.ndarray(
+                (shared.length,),
+                dtype=np.dtype(shared.dtype),
+                buffer=block.buf,
+                offset=shared.offset,
+            )
+            metadata.append(
+                series_metadata(shared.column, pd.Series(values, copy=False))
+            )
+            del values  # Release the view so the block can be closed
+    finally:
+        block.close()
+
+    return metadata
+
+
+class ParallelPandasBackend(PandasBackend):
+    """
+    Compute backend that profiles the columns of a DataFrame in parallel.
+
+    Fixed-width columns are copied once into a shared memory block, and
+    worker processes profile their shard of columns from views of it, so no
+    column is pickled. String columns have no such buffer without pyarrow,
+    and converting them costs as much as profiling them, so this process
+    profiles them while the workers run.
+    """
+
+    name = "parallel"
+
+    def __init__(self, workers: Optional[int] = None) -> None:
+        self.workers = workers or os.cpu_count() or 1
+
+    def column_metadata(self, df: pd.DataFrame) -> List[ColumnMeta]:
+        """Profile every column of a DataFrame, across worker processes."""
+        shared = [col for col in df.columns if is_shareable(df[col])]
+        if self.workers < 2 or len(df) * len(shared) < MIN_PARALLEL_CELLS:
+            return super().column_metadata(df)
+
+        # Lay the buffers out in one block, each aligned to a cache line
+        layout: Dict[str, SharedColumn] = {}
+        block_bytes = 0
+        for col in shared:
+            values = df[col].to_numpy()
+            layout[col] = SharedColumn(
+                column=col,
+                dtype=values.dtype.str,
+                length=len(values),
+                offset=block_bytes,
+            )
+            block_bytes += -(-values.nbytes // BUFFER_ALIGNMENT) * BUFFER_ALIGNMENT
+
+        block = shared_memory.SharedMemory(create=True, size=max(block_bytes, 1))
+        try:
+            for col, column in layout.items():
+                np.ndarray(
+                    (column.length,),
+                    dtype=np.dtype(column.dtype),
+                    buffer=block.buf,
+                    offset=column.offset,
+                )[:] = df[col].to_numpy()
+
+            shards = shard_columns(
+                {col: df[col].to_numpy().nbytes for col in shared}, self.workers
+            )
+            metadata: Dict[str, ColumnMeta] = {}
+            with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+                futures = [
+                    executor.submit(
+                        profile_shared_columns,
+                        block.name,
+                        [layout[col] for col in shard],
+                    )
+                    for shard in shards
+                ]
+
+                # Profile the string columns while the workers run
+                for col in df.columns:
+                    if col not in layout:
+                        metadata[col] = series_metadata(col, df[col])
+
+                for future in futures:
+                    for column_meta in future.result():
+                        metadata[column_meta.column] = column_meta
+        finally:
+            block.close()
+            block.unlink()
+
+        return [metadata[col] for col in df.columns]
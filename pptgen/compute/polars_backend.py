@@ -0,0 +1,158 @@
+"""Polars compute backend, evaluated lazily across all cores."""
+
+from pathlib import Path
+from typing import Any, Dict, List, Union
+
+import pandas as pd
+
+from pptgen.compute.base import ComputeBackend
+from pptgen.model.dataframe_meta import ColumnMeta
+
+try:
+    import polars as pl
+except ImportError:  # polars is an optional dependency
+    pl = None
+
+# Rows used to infer column types when scanning a CSV
+INFER_SCHEMA_LENGTH = 10_000
+
+
+def pandas_dtype_name(dtype: Any, has_nulls: bool = False) -> str:
+    """Map a polars dtype to the dtype name pandas reads the same CSV column as."""
+    if dtype.is_integer():
+        # pandas reads integer columns with missing values as floats
+        return "float64" if has_nulls else "int64"
+    if dtype.is_float() or dtype == pl.Null:
+        return "float64"
+    if dtype == pl.Boolean and not has_nulls:
+        return "bool"
+
+    return "object"
+
+
+class PolarsBackend(ComputeBackend):
+    """Compute backend for polars DataFrames and LazyFrames."""
+
+    name = "polars"
+
+    def __init__(self) -> None:
+        if pl is None:
+            raise ImportError("The polars backend requires polars: pip install polars")
+
+    def lazy(self, df: Union["pl.DataFrame", "pl.LazyFrame"]) -> "pl.LazyFrame":
+        """Get a LazyFrame for a frame."""
+        return df.lazy() if isinstance(df, pl.DataFrame) else df
+
+    def read_csv(self, csv_data_path: Path) -> "pl.LazyFrame":
+        """Scan a CSV file lazily."""
+        return pl.scan_csv(csv_data_path, infer_schema_length=INFER_SCHEMA_LENGTH)
+
+    def row_count(self, df: Union["pl.DataFrame", "pl.LazyFrame"]) -> int:
+        """Count the rows of a frame."""
+        return self.lazy(df).select(pl.len()).collect().item()
+
+    def schema(self, df: Union["pl.DataFrame", "pl.LazyFrame"]) -> Dict[str, str]:
+        """
+        Get the column names and pandas-style dtype names.
+
+        Integer and boolean columns are checked for nulls in one query, as
+        pandas reads them as float64 and object when values are missing.
+        """
+        lf = self.lazy(df)
+        schema = lf.collect_schema()
+        nullable = [
+            col
+            for col, dtype in schema.items()
+            if dtype.is_integer() or dtype == pl.Boolean
+        ]
+        null_counts = (
+            lf.select(pl.col(nullable).null_count()).collect().row(0, named=True)
+            if nullable
+            else {}
+        )
+
+        return {
+            col: pandas_dtype_name(dtype, null_counts.get(col, 0) > 0)
+            for col, dtype in schema.items()
+        }
+
+    def column_metadata(
+        self, df: Union["pl.DataFrame", "pl.LazyFrame"]
+    ) -> List[ColumnMeta]:
+        """Profile every column of a frame in a single parallel query."""
+        lf = self.lazy(df)
+        schema = lf.collect_schema()
+        columns = list(schema.names())
+
+        exprs = []
+        for i, col in enumerate(columns):
+            exprs += [
+                pl.col(col).count().alias(f"{i}_count"),
+                pl.col(col).null_count().alias(f"{i}_null"),
+                pl.col(col).n_unique().alias(f"{i}_unique"),
+            ]
+        stats = lf.select(exprs).collect().row(0, named=True) if exprs else {}
+
+        metadata = []
+        for i, col in enumerate(columns):
+            null = stats[f"{i}_null"]
+            # n_unique counts null as a value, pandas nunique does not
+            unique = stats[f"{i}_unique"] - (1 if null else 0)
+
+            metadata.append(
+                ColumnMeta(
+                    column=col,
+                    type=pandas_dtype_name(schema[col], has_nulls=null > 0),
+                    non_null_count=stats[f"{i}_count"],
+                    null_count=null,
+                    unique_values=unique,
+                )
+            )
+
+        return metadata
+
+    def value_counts(
+        self, df: Union["pl.DataFrame", "pl.LazyFrame"], column: str
+    ) -> pd.Series:
+        """Count the non-null values of a column, sorted by value."""
+        counts = (
+            self.lazy(df).group_by(column).len().sort(column, nulls_last=True).collect()
+        )
+        values = counts[column].to_list()
+        lengths = counts["len"].to_list()
+
+        has_nulls = bool(values) and values[-1] is None
+        if has_nulls:
+            values, lengths = values[:-1], lengths[:-1]
+
+        index = pd.Index(values, name=column)
+        if has_nulls and counts.schema[column].is_integer():
+            index = index.astype("float64")
+
+        return pd.Series(lengths, index=index, name="count")
+
+    def daily_counts(
+        self, df: Union["pl.DataFrame", "pl.LazyFrame"], date_column: str
+    ) -> pd.DataFrame:
+        """Count rows per day."""
+        counts = (
+            self.lazy(df)
+            .select(
+                pl.col(date_column)
+                .cast(pl.String)
+                .str.to_date("%Y-%m-%d")
+                .alias("date")
+            )
+            .drop_nulls()
+            .group_by("date")
+            .len()
+            .sort("date")
+            .collect()
+        )
+
+        return pd.DataFrame(
+            {
+                "date": pd.to_datetime(counts["date"].to_list()),
+                0: counts["len"].to_list(),
+            }
+        )
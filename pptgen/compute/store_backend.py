@@ -0,0 +1,55 @@
+"""Compute backend that reads a company's aggregates from an aggregate store."""
+
+from pathlib import Path
+from typing import Dict, List
+
+import pandas as pd
+
+from pptgen.aggregate_store import DATE_COLUMN, AggregateStore
+from pptgen.compute.base import ComputeBackend
+from pptgen.model.dataframe_meta import ColumnMeta
+
+
+class StoreBackend(ComputeBackend):
+    """
+    Compute backend whose frames are company names in an aggregate store.
+
+    Reading a CSV file brings the company's aggregates up to date with it.
+    Every aggregate is then an index lookup, without reading the file again.
+    """
+
+    name = "store"
+
+    def __init__(self, store: AggregateStore, company: str) -> None:
+        self.store = store
+        self.company = company
+
+    def read_csv(self, csv_data_path: Path) -> str:
+        """Update the stored aggregates from a CSV file."""
+        status = self.store.update(self.company, csv_data_path)
+        print(f"Aggregate store for {self.company}: {status}")
+
+        return self.company
+
+    def row_count(self, df: str) -> int:
+        """Get the stored row count."""
+        return self.store.row_count(df)
+
+    def schema(self, df: str) -> Dict[str, str]:
+        """Get the stored column names and dtype names."""
+        return self.store.schema(df)
+
+    def column_metadata(self, df: str) -> List[ColumnMeta]:
+        """Get the stored column profiles."""
+        return self.store.column_metadata(df)
+
+    def value_counts(self, df: str, column: str) -> pd.Series:
+        """Get the stored counts of a year column, sorted by value."""
+        return self.store.value_counts(df, column)
+
+    def daily_counts(self, df: str, date_column: str) -> pd.DataFrame:
+        """Get the stored row counts per day."""
+        if date_column != DATE_COLUMN:
+            raise ValueError(f"Only the {DATE_COLUMN} column is counted per day.")
+
+        return self.store.daily_counts(df)
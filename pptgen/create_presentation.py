@@ -1,41 +1,80 @@
 """Construct Powerpoint."""
 
+import copy
 import io
-from typing import Any, List
+from collections import Counter
+from typing import Any, Iterable, List, Optional, Tuple
 
 from pptx import Presentation
+from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
-from pptx.util import Inches
+from pptx.util import Inches, Pt
 
 from pptgen.colors import apply_background_gradient, apply_text_formatting
+from pptgen.deck_patch import tag_slide
+from pptgen.image_pipeline import process_image
+from pptgen.layout_planner import paginate_paragraphs
+from pptgen.model.image_settings import ImageSettings
 from pptgen.model.powerpoint.common import BulletPoints
 from pptgen.model.powerpoint.content_slide import ContentSlide
 from pptgen.model.powerpoint.image_slide import ImageSlide
 from pptgen.model.powerpoint.title_slide import TitleSlide
+from pptgen.slide_append import append_slide
 
 
-def apply_paragraph_formatting(paragraph, slide_model, color_scheme, bullet_point=None):
-    """Apply formatting to a paragraph."""
-    if bullet_point:
-        font_size = bullet_point.font_size
-        font_name = bullet_point.font_name
-    else:
-        font_size = slide_model.content_font_size
-        font_name = slide_model.content_font_name
+def content_paragraphs(slide_model) -> List[Tuple[str, str, int]]:
+    """Get the text, font name and font size of each paragraph of a content slide."""
+    if isinstance(slide_model.content, BulletPoints):
+        return [
+            (bullet.text, bullet.font_name, bullet.font_size)
+            for bullet in slide_model.content.bullet_points
+        ]
 
-    apply_text_formatting(
-        paragraph,
-        color_scheme.content_color,
-        font_size,
-        font_name,
-        alignment=PP_ALIGN.LEFT,
+    return [
+        (line, slide_model.content_font_name, slide_model.content_font_size)
+        for line in slide_model.content.split("\n")
+    ]
+
+
+def apply_paragraph_style(
+    paragraphs,
+    color,
+    font_size,
+    font_name,
+    bold=False,
+    italic=False,
+    alignment=PP_ALIGN.LEFT,
+):
+    """
+    Apply text formatting to paragraphs as their default character properties.
+
+    The properties are set once, on the first paragraph, and copied to the
+    others, so a large text frame does not format every run on its own.
+    """
+    if not paragraphs:
+        return
+
+    first = paragraphs[0]
+    first.alignment = alignment
+    font = first.font
+    font.name = font_name
+    font.size = Pt(font_size)
+    font.color.rgb = (
+        RGBColor.from_string(color.lstrip("#")) if color else RGBColor(0, 0, 0)
     )
+    font.bold = bold
+    font.italic = italic
+
+    p_pr = first._p.get_or_add_pPr()
+    for paragraph in paragraphs[1:]:
+        p = paragraph._p
+        p.replace(p.get_or_add_pPr(), copy.deepcopy(p_pr))
 
 
 def add_title_slide(prs, slide_model, color_scheme):
     """Add a title slide to the presentation."""
     layout = prs.slide_layouts[0]  # Title Slide layout
-    slide = prs.slides.add_slide(layout)
+    slide = append_slide(prs, layout)
     title = slide.shapes.title
     subtitle = slide.placeholders[1]
 
@@ -66,14 +105,14 @@ def add_title_slide(prs, slide_model, color_scheme):
     return slide
 
 
-def add_content_slide(prs, slide_model, color_scheme):
-    """Add a content slide to the presentation."""
+def add_content_page(prs, slide_model, color_scheme, title_text, paragraphs):
+    """Add a slide with content paragraphs, formatting the most common font once."""
     layout = prs.slide_layouts[1]  # Content with Caption layout
-    slide = prs.slides.add_slide(layout)
+    slide = append_slide(prs, layout)
     title = slide.shapes.title
     content = slide.placeholders[1]
 
-    title.text = slide_model.title
+    title.text = title_text
 
     # Apply text properties to title
     apply_text_formatting(
@@ -85,19 +124,29 @@ def add_content_slide(prs, slide_model, color_scheme):
         alignment=PP_ALIGN.LEFT,
     )
 
-    # Handle content based on its type
-    if isinstance(slide_model.content, str):
-        content.text = slide_model.content
-        for paragraph in content.text_frame.paragraphs:
-            apply_paragraph_formatting(paragraph, slide_model, color_scheme)
-    elif isinstance(slide_model.content, BulletPoints):
-        text_frame = content.text_frame
-        text_frame.clear()  # Clear any existing text
-        for bullet in slide_model.content.bullet_points:
-            p = text_frame.add_paragraph()
-            p.text = bullet.text
-            p.level = 0  # Set to 0 for top-level bullets
-            apply_paragraph_formatting(p, slide_model, color_scheme, bullet)
+    # Format the paragraphs in the most common font once, and others on their own
+    fonts = Counter((font_name, font_size) for _, font_name, font_size in paragraphs)
+    font_name, font_size = (
+        fonts.most_common(1)[0][0]
+        if fonts
+        else (slide_model.content_font_name, slide_model.content_font_size)
+    )
+    text_frame = content.text_frame
+    common = []
+    for i, (text, paragraph_font_name, paragraph_font_size) in enumerate(paragraphs):
+        paragraph = text_frame.paragraphs[0] if i == 0 else text_frame.add_paragraph()
+        paragraph.text = text
+        if (paragraph_font_name, paragraph_font_size) == (font_name, font_size):
+            common.append(paragraph)
+            continue
+        apply_text_formatting(
+            paragraph,
+            color_scheme.content_color,
+            paragraph_font_size,
+            paragraph_font_name,
+            alignment=PP_ALIGN.LEFT,
+        )
+    apply_paragraph_style(common, color_scheme.content_color, font_size, font_name)
 
     # Set background gradient
     apply_background_gradient(slide, color_scheme.background_gradient)
@@ -105,10 +154,36 @@ def add_content_slide(prs, slide_model, color_scheme):
     return slide
 
 
-def add_image_slide(prs, slide_model, color_scheme):
+def add_content_slide(prs, slide_model, color_scheme) -> List[Any]:
+    """
+    Add a content slide to the presentation, returning each of its slides.
+
+    Content that does not fit is split between paragraphs across
+    continuation slides, numbered in their titles.
+    """
+    paragraphs = content_paragraphs(slide_model)
+    pages = paginate_paragraphs(paragraphs)
+
+    slides = []
+    for page, (start, stop) in enumerate(pages, start=1):
+        title_text = slide_model.title
+        if len(pages) > 1:
+            title_text = f"{title_text} ({page}/{len(pages)})"
+        slides.append(
+            add_content_page(
+                prs, slide_model, color_scheme, title_text, paragraphs[start:stop]
+            )
+        )
+
+    return slides
+
+
+def add_image_slide(
+    prs, slide_model, color_scheme, image_settings: Optional[ImageSettings] = None
+):
     """Add an image slide to the presentation."""
     layout = prs.slide_layouts[5]  # Picture with Caption layout
-    slide = prs.slides.add_slide(layout)
+    slide = append_slide(prs, layout)
     title = slide.shapes.title
     title.text = slide_model.title
 
@@ -127,7 +202,8 @@ def add_image_slide(prs, slide_model, color_scheme):
     top = Inches(slide_model.image_margin_top)
     width = Inches(slide_model.image_width)
     height = Inches(slide_model.image_height)
-    slide.shapes.add_picture(slide_model.image_path, left, top, width, height)
+    image = process_image(slide_model.image_path, width, height, image_settings)
+    slide.shapes.add_picture(image, left, top, width, height)
 
     # Set background gradient
     apply_background_gradient(slide, color_scheme.background_gradient)
@@ -135,17 +211,52 @@ def add_image_slide(prs, slide_model, color_scheme):
     return slide
 
 
-def create_presentation(slide_models: List[Any], color_scheme) -> io.BytesIO:
-    """Create a complete presentation based on slide models and color scheme."""
+def add_slide(
+    prs,
+    slide_model,
+    color_scheme,
+    image_settings: Optional[ImageSettings] = None,
+    tag: Optional[str] = None,
+):
+    """
+    Add a slide of the model's type to the presentation, and tag it.
+
+    The tag defaults to "slide-N" by position. Continuation slides of long
+    content are tagged after their first slide, as "slide-N-p2" onwards, so
+    the tags of later slides do not depend on how much earlier content spans.
+    """
+    tag = tag or f"slide-{len(prs.slides) + 1}"
+    if isinstance(slide_model, TitleSlide):
+        slides = [add_title_slide(prs, slide_model, color_scheme)]
+    elif isinstance(slide_model, ContentSlide):
+        slides = add_content_slide(prs, slide_model, color_scheme)
+    elif isinstance(slide_model, ImageSlide):
+        slides = [add_image_slide(prs, slide_model, color_scheme, image_settings)]
+    else:
+        return None
+
+    tag_slide(slides[0], tag)
+    for page, slide in enumerate(slides[1:], start=2):
+        tag_slide(slide, f"{tag}-p{page}")
+
+    return slides[0]
+
+
+def create_presentation(
+    slide_models: Iterable[Any],
+    color_scheme,
+    image_settings: Optional[ImageSettings] = None,
+) -> io.BytesIO:
+    """
+    Create a complete presentation based on slide models and color scheme.
+
+    Slide models may come from a generator; each one is added as it arrives,
+    so the full list of models never needs to be held in memory.
+    """
     prs = Presentation()
 
-    for slide in slide_models:
-        if isinstance(slide, TitleSlide):
-            add_title_slide(prs, slide, color_scheme)
-        elif isinstance(slide, ContentSlide):
-            add_content_slide(prs, slide, color_scheme)
-        elif isinstance(slide, ImageSlide):
-            add_image_slide(prs, slide, color_scheme)
+    for position, slide in enumerate(slide_models, start=1):
+        add_slide(prs, slide, color_scheme, image_settings, f"slide-{position}")
 
     # Save to a BytesIO object
     pptx_file = io.BytesIO()
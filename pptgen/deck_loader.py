@@ -0,0 +1,68 @@
+"""Bulk-load slide models from a deck specification."""
+
+import json
+from typing import Any, Dict, List, Tuple, Union
+
+from pydantic import BaseModel, TypeAdapter
+
+from pptgen.model.powerpoint.color_themes import ThemeColorScheme
+from pptgen.model.powerpoint.deck_spec import (
+    ContentSlideSpec,
+    DeckSpec,
+    ImageSlideSpec,
+    SlideSpec,
+    TitleSlideSpec,
+)
+
+SLIDE_SPECS = {
+    "title": TitleSlideSpec,
+    "content": ContentSlideSpec,
+    "image": ImageSlideSpec,
+}
+
+SLIDE_SPEC_ADAPTER: TypeAdapter = TypeAdapter(SlideSpec)
+
+
+def theme_overrides(color_scheme: ThemeColorScheme) -> Dict[str, Dict[str, Any]]:
+    """Resolve the theme color overrides for each slide type."""
+    return {
+        slide_type: color_scheme.color_overrides(slide_class)
+        for slide_type, slide_class in SLIDE_SPECS.items()
+    }
+
+
+def load_slide(slide: Dict[str, Any], overrides: Dict[str, Dict[str, Any]]) -> Any:
+    """Load a single slide model, applying the resolved theme overrides."""
+    fields = {**slide, **overrides.get(slide.get("type"), {})}
+
+    return SLIDE_SPEC_ADAPTER.validate_python(fields)
+
+
+def load_deck(
+    spec: Union[Dict[str, Any], str, bytes],
+) -> Tuple[ThemeColorScheme, List[BaseModel]]:
+    """
+    Load the color scheme and slide models of a deck specification.
+
+    Theme colors are resolved once per slide type and merged into the slide
+    fields up front. The specification is then validated once, as a whole,
+    against the DeckSpec schema, which builds the slide models in the same pass.
+
+    Args:
+    spec (Union[Dict[str, Any], str, bytes]): The deck specification, as a dict or JSON.
+
+    Returns:
+    Tuple[ThemeColorScheme, List[BaseModel]]: The color scheme and slide models.
+    """
+    if not isinstance(spec, dict):
+        spec = json.loads(spec)
+
+    color_scheme = ThemeColorScheme(theme=spec["theme"])
+    overrides = theme_overrides(color_scheme)
+    slides = [
+        {**slide, **overrides.get(slide.get("type"), {})} for slide in spec["slides"]
+    ]
+
+    deck_spec = DeckSpec.model_validate({"theme": spec["theme"], "slides": slides})
+
+    return color_scheme, deck_spec.slides
@@ -0,0 +1,354 @@
+"""Replace tagged slides of a saved deck without rewriting its other parts."""
+
+import copy
+import io
+import itertools
+import os
+import posixpath
+import shutil
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from lxml import etree
+from pptx.presentation import Presentation
+from pptx.slide import Slide
+
+from pptgen.model.package_settings import PackageSettings
+from pptgen.model.patch_report import PatchReport
+from pptgen.packaging import (
+    CONTENT_TYPES_PART,
+    CT_NS,
+    P_NS,
+    R_NS,
+    SLIDE_LAYOUT_RELATIONSHIP,
+    internal_relationships,
+    rels_part_name,
+    remove_content_type_overrides,
+    resolve_target,
+    should_store,
+    source_part_name,
+)
+
+PRESENTATION_PART = "ppt/presentation.xml"
+SLIDE_RELATIONSHIP = f"{R_NS}/slide"
+NOTES_SLIDE_RELATIONSHIP = f"{R_NS}/notesSlide"
+# Relationships a patched slide keeps pointing to, rather than replacing
+SHARED_RELATIONSHIPS = (SLIDE_LAYOUT_RELATIONSHIP, NOTES_SLIDE_RELATIONSHIP)
+
+DATA_DESCRIPTOR_FLAG = 0x08
+COPY_BLOCK_BYTES = 1 << 20
+
+
+def tag_slide(slide: Slide, tag: str) -> None:
+    """Write a stable tag into a slide, as the name of its common slide data."""
+    slide._element.cSld.name = tag
+
+
+def read_slide_tag(zf: zipfile.ZipFile, part_name: str) -> str:
+    """Read the tag of a slide part, parsing no further than its start."""
+    with zf.open(part_name) as f:
+        for _, element in etree.iterparse(f, events=("start",), tag=f"{{{P_NS}}}cSld"):
+            return element.get("name", "")
+
+    return ""
+
+
+def slide_parts(zf: zipfile.ZipFile) -> List[str]:
+    """Get the part names of the slides in a package."""
+    rels = etree.fromstring(zf.read(rels_part_name(PRESENTATION_PART)))
+
+    return [
+        resolve_target(PRESENTATION_PART, rel.get("Target"))
+        for rel in internal_relationships(rels)
+        if rel.get("Type") == SLIDE_RELATIONSHIP
+    ]
+
+
+def tagged_slides(zf: zipfile.ZipFile) -> Dict[str, str]:
+    """Map the tags of the slides in a package to their part names."""
+    slides: Dict[str, str] = {}
+    for part_name in slide_parts(zf):
+        tag = read_slide_tag(zf, part_name)
+        if tag in slides:
+            raise ValueError(
+                f"Slides {slides[tag]} and {part_name} share the tag {tag!r}."
+            )
+        if tag:
+            slides[tag] = part_name
+
+    return slides
+
+
+def content_type(content_types: etree._Element, part_name: str) -> Optional[str]:
+    """Get the content type of a part from its override or its extension."""
+    for override in content_types.iterfind(f"{{{CT_NS}}}Override"):
+        if override.get("PartName").lstrip("/") == part_name:
+            return override.get("ContentType")
+
+    extension = posixpath.splitext(part_name)[1][1:].lower()
+    for default in content_types.iterfind(f"{{{CT_NS}}}Default"):
+        if default.get("Extension").lower() == extension:
+            return default.get("ContentType")
+
+    return None
+
+
+def free_part_name(part_name: str, taken: Set[str]) -> str:
+    """Number a part name like python-pptx does, avoiding the names taken."""
+    directory, name = posixpath.split(part_name)
+    stem, extension = posixpath.splitext(name)
+    stem = stem.rstrip("0123456789")
+    for number in itertools.count(1):
+        candidate = posixpath.join(directory, f"{stem}{number}{extension}")
+        if candidate not in taken:
+            taken.add(candidate)
+            return candidate
+
+    raise AssertionError("unreachable")
+
+
+def replace_slide(
+    deck_zip: zipfile.ZipFile,
+    patch_zip: zipfile.ZipFile,
+    deck_slide: str,
+    patch_slide: str,
+    names: Set[str],
+    written: Dict[str, bytes],
+    content_types: etree._Element,
+    modified: Set[str],
+) -> Set[str]:
+    """
+    Write a patch slide over a deck slide, with its relationships and media.
+
+    Media identical to what the deck slide used keeps its part, other media
+    is added under a free name. Notes of the deck slide are kept.
+
+    Returns:
+    Set[str]: Parts the deck slide pointed to that the new slide does not.
+    """
+    rels = etree.fromstring(patch_zip.read(rels_part_name(patch_slide)))
+    patch_content_types = etree.fromstring(patch_zip.read(CONTENT_TYPES_PART))
+
+    deck_rels_part = rels_part_name(deck_slide)
+    old_targets: Dict[str, bytes] = {}
+    notes_rels = []
+    if deck_rels_part in names:
+        for old_rel in internal_relationships(
+            etree.fromstring(deck_zip.read(deck_rels_part))
+        ):
+            target = resolve_target(deck_slide, old_rel.get("Target"))
+            if old_rel.get("Type") == NOTES_SLIDE_RELATIONSHIP:
+                notes_rels.append(old_rel)
+            elif old_rel.get("Type") not in SHARED_RELATIONSHIPS and target in names:
+                old_targets[target] = deck_zip.read(target)
+
+    kept: Set[str] = set()
+    for rel in internal_relationships(rels):
+        target = resolve_target(patch_slide, rel.get("Target"))
+        if rel.get("Type") == SLIDE_LAYOUT_RELATIONSHIP:
+            if target not in names:
+                raise ValueError(f"The deck has no slide layout {target}.")
+            new_target = target
+        else:
+            if rels_part_name(target) in patch_zip.namelist():
+                raise ValueError(f"Cannot patch {target}, it has relationships.")
+            data = patch_zip.read(target)
+            new_target = next(
+                (old for old, old_data in old_targets.items() if old_data == data),
+                None,
+            )
+            if new_target is None:
+                new_target = free_part_name(target, names)
+                written[new_target] = data
+                patch_type = content_type(patch_content_types, target)
+                if content_type(content_types, new_target) != patch_type:
+                    etree.SubElement(
+                        content_types,
+                        f"{{{CT_NS}}}Override",
+                        PartName=f"/{new_target}",
+                        ContentType=patch_type,
+                    )
+                    modified.add(CONTENT_TYPES_PART)
+            kept.add(new_target)
+        rel.set("Target", posixpath.relpath(new_target, posixpath.dirname(deck_slide)))
+
+    # Keep the notes, under an id the new relationships do not use
+    rel_ids = {rel.get("Id") for rel in rels}
+    for notes_rel in notes_rels:
+        notes_rel = copy.copy(notes_rel)
+        notes_rel.set(
+            "Id",
+            next(f"rId{n}" for n in itertools.count(1) if f"rId{n}" not in rel_ids),
+        )
+        rel_ids.add(notes_rel.get("Id"))
+        rels.append(notes_rel)
+
+    written[deck_slide] = patch_zip.read(patch_slide)
+    written[deck_rels_part] = etree.tostring(
+        rels, xml_declaration=True, encoding="UTF-8", standalone=True
+    )
+
+    return set(old_targets) - kept
+
+
+def referenced_parts(
+    deck_zip: zipfile.ZipFile, candidates: Set[str], written: Dict[str, bytes]
+) -> Set[str]:
+    """Find the candidate parts that relationships of the patched deck target."""
+    referenced: Set[str] = set()
+    for name in deck_zip.namelist():
+        if not name.endswith(".rels"):
+            continue
+        pending = candidates - referenced
+        if not pending:
+            break
+        data = written[name] if name in written else deck_zip.read(name)
+        # Only parse the relationships that mention a candidate file name
+        if not any(posixpath.basename(c).encode() in data for c in pending):
+            continue
+        source = source_part_name(name)
+        for rel in internal_relationships(etree.fromstring(data)):
+            target = resolve_target(source, rel.get("Target"))
+            if target in pending:
+                referenced.add(target)
+
+    return referenced
+
+
+def copy_entry(
+    source_zip: zipfile.ZipFile, info: zipfile.ZipInfo, zf: zipfile.ZipFile
+) -> None:
+    """
+    Copy a zip entry from a source zip file with its name, date and compression.
+
+    The entry is streamed through ZipFile.open, so it is never held in memory.
+    """
+    entry = copy.copy(info)
+    entry.flag_bits &= ~DATA_DESCRIPTOR_FLAG  # The sizes go in the local header
+    with source_zip.open(info) as src, zf.open(entry, "w") as dst:
+        shutil.copyfileobj(src, dst, COPY_BLOCK_BYTES)
+
+
+def patch_deck(
+    deck_file: Path,
+    patch: Presentation,
+    output_file: Optional[Path] = None,
+    tags: Optional[Iterable[str]] = None,
+) -> PatchReport:
+    """
+    Replace the slides of a saved deck with the same tagged slides of a patch.
+
+    Only the replaced slides, their relationships and new media are written.
+    Every other zip entry is streamed through without parsing it. Both decks
+    must be built from the same template, and the patch cannot add or remove
+    slides.
+
+    Args:
+    deck_file (Path): The saved PPTX file to patch.
+    patch (Presentation): A presentation holding the new, tagged slides.
+    output_file (Optional[Path]): Where to save the patched deck, in place if None.
+    tags (Optional[Iterable[str]]): Tags to replace, every patch slide if None.
+
+    Returns:
+    PatchReport: The slides replaced and the entries written and copied.
+    """
+    start_time = time.perf_counter()
+    output_file = Path(output_file or deck_file)
+    buffer = io.BytesIO()
+    patch.save(buffer)
+
+    written: Dict[str, bytes] = {}
+    modified: Set[str] = set()
+    released: Set[str] = set()
+    copied = 0
+    temp = tempfile.NamedTemporaryFile(
+        dir=output_file.parent, suffix=".pptx", delete=False
+    )
+    try:
+        with zipfile.ZipFile(buffer) as patch_zip, zipfile.ZipFile(
+            deck_file
+        ) as deck_zip:
+            patch_slides = tagged_slides(patch_zip)
+            deck_slides = tagged_slides(deck_zip)
+            slide_count = len(slide_parts(deck_zip))
+            tags = sorted(patch_slides if tags is None else tags)
+            unknown = [
+                tag for tag in tags if tag not in deck_slides or tag not in patch_slides
+            ]
+            if unknown:
+                raise ValueError(
+                    f"Slides tagged {unknown} are not in both the deck and the patch."
+                )
+
+            names = set(deck_zip.namelist())
+            content_types = etree.fromstring(deck_zip.read(CONTENT_TYPES_PART))
+            for tag in tags:
+                released |= replace_slide(
+                    deck_zip,
+                    patch_zip,
+                    deck_slides[tag],
+                    patch_slides[tag],
+                    names,
+                    written,
+                    content_types,
+                    modified,
+                )
+
+            # Media the replaced slides used is removed unless shared
+            removed = released - referenced_parts(deck_zip, released, written)
+            remove_content_type_overrides(
+                {CONTENT_TYPES_PART: content_types}, removed, modified
+            )
+            if modified:
+                written[CONTENT_TYPES_PART] = etree.tostring(
+                    content_types,
+                    xml_declaration=True,
+                    encoding="UTF-8",
+                    standalone=True,
+                )
+
+            with zipfile.ZipFile(temp, "w") as zf:
+                infos = deck_zip.infolist()
+                for info in infos:
+                    if info.filename in removed:
+                        continue
+                    if info.filename not in written:
+                        copy_entry(deck_zip, info, zf)
+                        copied += 1
+                        continue
+                    zinfo = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+                    zinfo.create_system = info.create_system
+                    zinfo.compress_type = info.compress_type
+                    zf.writestr(zinfo, written[info.filename])
+
+                # New media goes last, stored when deflate would not shrink it.
+                # It takes the deck's timestamp, so deterministic decks stay so.
+                settings = PackageSettings()
+                deck_info = deck_zip.getinfo(CONTENT_TYPES_PART)
+                for name in sorted(set(written) - {info.filename for info in infos}):
+                    zinfo = zipfile.ZipInfo(name, date_time=deck_info.date_time)
+                    zinfo.create_system = deck_info.create_system
+                    zinfo.compress_type = (
+                        zipfile.ZIP_STORED
+                        if should_store(name, written[name], settings)
+                        else zipfile.ZIP_DEFLATED
+                    )
+                    zf.writestr(zinfo, written[name])
+        temp.close()
+        os.replace(temp.name, output_file)
+    except BaseException:
+        temp.close()
+        os.remove(temp.name)
+        raise
+
+    return PatchReport(
+        patched_tags=tags,
+        slide_count=slide_count,
+        parts_written=len(written),
+        parts_copied=copied,
+        parts_removed=sorted(removed),
+        patch_seconds=time.perf_counter() - start_time,
+    )
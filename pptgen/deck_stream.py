@@ -0,0 +1,116 @@
+"""Stream slides from a JSON Lines deck specification into a presentation."""
+
+import json
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from pptx import Presentation
+from pydantic import BaseModel
+
+from pptgen.create_presentation import add_slide
+from pptgen.deck_loader import load_slide, theme_overrides
+from pptgen.model.image_settings import ImageSettings
+from pptgen.model.package_settings import PackageSettings
+from pptgen.model.powerpoint.color_themes import ColorTheme, ThemeColorScheme
+from pptgen.model.powerpoint.content_slide import ContentSlide
+from pptgen.model.powerpoint.image_slide import ImageSlide
+from pptgen.model.powerpoint.title_slide import TitleSlide
+from pptgen.packaging import save_package
+
+SLIDE_TYPES = {TitleSlide: "title", ContentSlide: "content", ImageSlide: "image"}
+
+# A JSON Lines deck is a header record followed by one slide record per line:
+#   {"theme": "christmas"}
+#   {"type": "title", "title": "Christmas Presentation", "subtitle": "Happy Holidays!"}
+#   {"type": "image", "title": "Christmas Tree", "image_path": "data/images/tree.jpg"}
+
+
+def read_deck_stream(
+    lines: Iterable[Union[str, bytes]],
+) -> Tuple[ThemeColorScheme, Iterator[BaseModel]]:
+    """
+    Read the header of a JSON Lines deck and return a lazy iterator of its slides.
+
+    Args:
+    lines (Iterable[Union[str, bytes]]): Lines of the deck, e.g. an open file.
+
+    Returns:
+    Tuple[ThemeColorScheme, Iterator[BaseModel]]: The color scheme and slides.
+    """
+    lines = iter(lines)
+    header = json.loads(next(lines))
+    if "theme" not in header:
+        raise ValueError("The first line of a deck must be a header with a theme.")
+
+    color_scheme = ThemeColorScheme(theme=header["theme"])
+    overrides = theme_overrides(color_scheme)
+
+    def iter_slides() -> Iterator[BaseModel]:
+        for line in lines:
+            if line.strip():
+                yield load_slide(json.loads(line), overrides)
+
+    return color_scheme, iter_slides()
+
+
+def slide_record(slide: Union[BaseModel, Dict[str, Any]]) -> Dict[str, Any]:
+    """Convert a slide model to a deck record, leaving out default values."""
+    if not isinstance(slide, BaseModel):
+        return slide
+
+    slide_type = next(
+        name for model, name in SLIDE_TYPES.items() if isinstance(slide, model)
+    )
+    return {"type": slide_type, **slide.model_dump(mode="json", exclude_defaults=True)}
+
+
+def write_deck_stream(
+    file: IO[str], theme: ColorTheme, slides: Iterable[Union[BaseModel, Dict[str, Any]]]
+) -> int:
+    """Write a theme header and slide records as JSON Lines, returning the slide count."""
+    file.write(json.dumps({"theme": ColorTheme(theme).value}) + "\n")
+
+    slide_count = 0
+    for slide in slides:
+        file.write(json.dumps(slide_record(slide)) + "\n")
+        slide_count += 1
+
+    return slide_count
+
+
+def build_deck_stream(
+    deck_file: Path,
+    output_file: Union[Path, IO[bytes]],
+    image_settings: Optional[ImageSettings] = None,
+    package_settings: Optional[PackageSettings] = None,
+) -> int:
+    """
+    Build a presentation from a JSON Lines deck, one slide at a time.
+
+    Each slide record is parsed, added and released before the next line is
+    read, and the presentation is saved straight to the output.
+
+    Args:
+    deck_file (Path): Path to the JSON Lines deck.
+    output_file (Union[Path, IO[bytes]]): Path or binary file to save the PPTX to.
+    image_settings (Optional[ImageSettings]): Settings for image slides.
+    package_settings (Optional[PackageSettings]): Settings to repack the saved file.
+
+    Returns:
+    int: The number of slides written.
+    """
+    prs = Presentation()
+
+    with open(deck_file, "r", encoding="utf-8") as f:
+        color_scheme, slides = read_deck_stream(f)
+        slide_count = 0
+        for slide in slides:
+            slide_count += 1
+            add_slide(prs, slide, color_scheme, image_settings, f"slide-{slide_count}")
+
+    if package_settings is None:
+        prs.save(output_file)
+    else:
+        print(save_package(prs, output_file, package_settings).summary())
+
+    return slide_count
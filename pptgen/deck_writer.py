@@ -0,0 +1,94 @@
+"""Write decks: serialize, repack and save them, and collect their telemetry."""
+
+import hashlib
+import io
+import time
+import zipfile
+from typing import Optional
+
+from pptgen.deck_patch import slide_parts
+from pptgen.model.build_telemetry import BuildTelemetry
+from pptgen.model.pptx_model import PPTXModel
+from pptgen.packaging import MEDIA_DIR, package_pptx
+
+
+def collect_telemetry(
+    pptx_model: PPTXModel,
+    pptx_bytes: bytes,
+    serialize_seconds: Optional[float] = None,
+    patch_seconds: Optional[float] = None,
+) -> BuildTelemetry:
+    """
+    Collect the build telemetry of a written file from its zip directory.
+
+    Args:
+    pptx_model (PPTXModel): The model of the deck, which keeps the telemetry.
+    pptx_bytes (bytes): The written PPTX file.
+    serialize_seconds (Optional[float]): Time taken to save the presentation.
+    patch_seconds (Optional[float]): Time taken to patch slides into the saved deck.
+
+    Returns:
+    BuildTelemetry: Sizes and timings of the deck.
+    """
+    with zipfile.ZipFile(io.BytesIO(pptx_bytes)) as zf:
+        infos = zf.infolist()
+        slide_count = len(slide_parts(zf))
+
+    media = [info for info in infos if info.filename.startswith(MEDIA_DIR)]
+    part_bytes = {
+        info.filename: info.file_size
+        for info in infos
+        if info.filename.endswith((".xml", ".rels"))
+    }
+    package_report = pptx_model.package_report
+    pptx_model.build_telemetry = BuildTelemetry(
+        file_name=pptx_model.pptx_file.name,
+        file_bytes=len(pptx_bytes),
+        content_hash=hashlib.sha256(pptx_bytes).hexdigest(),
+        slide_count=slide_count,
+        media_count=len(media),
+        media_bytes=sum(info.file_size for info in media),
+        xml_bytes=sum(part_bytes.values()),
+        part_bytes=part_bytes,
+        build_seconds=pptx_model.build_seconds,
+        serialize_seconds=serialize_seconds,
+        package_seconds=package_report.package_seconds if package_report else None,
+        patch_seconds=patch_seconds,
+        input_rows=pptx_model.input_rows,
+        input_columns=pptx_model.input_columns,
+    )
+
+    return pptx_model.build_telemetry
+
+
+def write_deck(pptx_model: PPTXModel) -> BuildTelemetry:
+    """
+    Save a deck, repacked when the model has package settings.
+
+    The build telemetry is collected, and written as a sidecar when the
+    model asks for one.
+
+    Args:
+    pptx_model (PPTXModel): The model of the deck to write.
+
+    Returns:
+    BuildTelemetry: Sizes and timings of the deck.
+    """
+    start_time = time.perf_counter()
+    pptx_bytes = pptx_model.pptx
+    serialize_seconds = time.perf_counter() - start_time
+
+    if pptx_model.package_settings is not None:
+        pptx_bytes, pptx_model.package_report = package_pptx(
+            pptx_bytes, pptx_model.package_settings
+        )
+        pptx_model.package_report.save_seconds = serialize_seconds
+        print(pptx_model.package_report.summary())
+
+    pptx_model.write_pptx(pptx_bytes)
+
+    build_telemetry = collect_telemetry(pptx_model, pptx_bytes, serialize_seconds)
+    if pptx_model.telemetry_sidecar:
+        pptx_model.write_telemetry()
+
+    return build_telemetry
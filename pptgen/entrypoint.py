@@ -1,71 +1,195 @@
 """Entrypoint."""
 
 from pathlib import Path
+from typing import List, Optional, Tuple
+
+from pptgen.aggregate_store import AggregateStore
+from pptgen.compute import ComputeBackend, PandasBackend, get_backend
+from pptgen.compute.store_backend import StoreBackend
+from pptgen.generate_dataframe_meta import compute_overview, get_dataframe_metadata
+from pptgen.layout_planner import plan_deck
+from pptgen.memory_budget import PeakMemoryMonitor, backend_for_plan, plan_memory
+from pptgen.model.dataframe_meta import ColumnsMeta
+from pptgen.model.deck_aggregates import DeckAggregates
+from pptgen.model.layout_plan import DeckPlan
+from pptgen.model.memory_plan import MemoryPlan
+from pptgen.model.package_settings import PackageSettings
+from pptgen.sampling import (
+    estimate_column_metadata,
+    estimate_total_rows,
+    sample_csv,
+)
+from pptgen.sinks import OutputSink, PptxSink
+from pptgen.sinks.pptx_sink import aggregates_for_tags
 
-import pandas as pd
-from pptx import Presentation
+DRY_RUN_TIME_BUDGET = 2.0  # Seconds, of which sampling spends about half
 
-from pptgen.create_presentation import add_title_slide
-from pptgen.generate_dataframe_meta import (
-    create_consolidated_view,
-    create_detailed_view,
-    create_overview_slide,
-    get_dataframe_metadata,
-)
-from pptgen.model.powerpoint import ColorTheme, ThemeColorScheme, TitleSlide
-from pptgen.model.pptx_model import PPTXModel
 
+def select_backend(
+    csv_data_path: Path, backend: str, memory_budget: Optional[int]
+) -> Tuple[ComputeBackend, Optional[MemoryPlan]]:
+    """Get the compute backend, planned to fit the memory budget if one is given."""
+    if memory_budget is None:
+        return get_backend(backend), None
+    if backend == "polars":
+        print(f"The {backend} backend scans lazily, ignoring the memory budget")
+        return get_backend(backend), None
 
-def generate_ppt(
-    company_name: str, subtitle_company: str, csv_data_path: Path, output_file: Path
-) -> Path:
+    memory_plan = plan_memory(csv_data_path, memory_budget)
+    print(memory_plan.summary())
+    if memory_plan.mode == "in_memory":
+        return get_backend(backend), memory_plan
+
+    return backend_for_plan(memory_plan), memory_plan
+
+
+def dry_run_ppt(
+    csv_data_path: Path,
+    max_table_slides: Optional[int] = None,
+    time_budget: float = DRY_RUN_TIME_BUDGET,
+) -> DeckPlan:
     """
-    Generate a PowerPoint presentation based on the given CSV data.
+    Plan the PowerPoint presentation for the given CSV data without building it.
+
+    The plan comes from the schema and a sample of the rows, so the CSV is
+    not profiled. Counts are planned as the full deck would show them, from
+    their estimates.
 
     Args:
     csv_data_path (Path): Path to the CSV file.
-    company_name (str): Name of the company.
-    subtitle_company (str): Subtitle for the company.
-    output_dir (Path): Directory to save the output PPTX file.
+    max_table_slides (Optional[int]): Cap on the number of metadata table slides.
+    time_budget (float): Target time in seconds for sampling the rows.
 
     Returns:
-    Path: Path to the generated PPTX file.
+    DeckPlan: The planned slide count and estimated file size.
     """
-    # Read CSV data
-    df = pd.read_csv(csv_data_path)
+    sample = sample_csv(csv_data_path, time_budget)
+    columns_meta = ColumnsMeta(
+        columns=[
+            column_meta.model_copy(
+                update={"is_estimate": False, "unique_values_lower_bound": False}
+            )
+            for column_meta in estimate_column_metadata(sample).columns
+        ]
+    )
+    row_count, _, _ = estimate_total_rows(sample)
 
-    # Get the metadata
-    columns_meta = get_dataframe_metadata(df)
+    return plan_deck(columns_meta, row_count, max_table_slides=max_table_slides)
 
-    # Create a presentation
-    prs = Presentation()
 
-    color_scheme = ThemeColorScheme(theme=ColorTheme.PROFESSIONAL_TEST)
+def generate_ppt(
+    company_name: str,
+    subtitle_company: str,
+    csv_data_path: Path,
+    output_file: Optional[Path],
+    max_table_slides: Optional[int] = None,
+    backend: str = "pandas",
+    preview: bool = False,
+    preview_time_budget: float = 30.0,
+    preview_strategy: str = "stratified",
+    chart_granularity: str = "auto",
+    package_settings: Optional[PackageSettings] = None,
+    memory_budget: Optional[int] = None,
+    year_table_summary: str = "auto",
+    sinks: Optional[List[OutputSink]] = None,
+    patch_slides: Optional[List[str]] = None,
+    telemetry_sidecar: bool = False,
+    aggregate_store: Optional[AggregateStore] = None,
+) -> Optional[Path]:
+    """
+    Generate a PowerPoint presentation based on the given CSV data.
+
+    Args:
+    csv_data_path (Path): Path to the CSV file.
+    company_name (str): Name of the company.
+    subtitle_company (str): Subtitle for the company.
+    output_file (Optional[Path]): Path of the PPTX file, or None for sinks only.
+    max_table_slides (Optional[int]): Cap on the number of metadata table slides.
+    backend (str): Compute backend, "pandas", "parallel" or "polars".
+    preview (bool): Build a quick preview deck from a sample of the rows.
+    preview_time_budget (float): Target time in seconds for a preview deck.
+    preview_strategy (str): "stratified" by year or uniform "reservoir" sampling.
+    chart_granularity (str): "auto", "day", "week", "month", "quarter" or "year".
+    package_settings (Optional[PackageSettings]): Settings to repack the saved file.
+    memory_budget (Optional[int]): Memory budget in bytes for the pandas backends.
+    year_table_summary (str): "auto", "bin", "top_n" or "none" for extra years.
+    sinks (Optional[List[OutputSink]]): Further outputs from the same aggregates.
+    patch_slides (Optional[List[str]]): Tags of the slides to patch into the saved deck.
+    telemetry_sidecar (bool): Write the build telemetry as JSON next to the deck.
+    aggregate_store (Optional[AggregateStore]): Read the aggregates from this store.
 
-    # Create a TitleSlide model
-    title_slide_model = TitleSlide(
-        title=f"UCC Data - {company_name.upper()}",
+    Returns:
+    Optional[Path]: Path to the generated PPTX file, if one was requested.
+    """
+    # Patching a saved deck computes only what the patched slides show
+    needed = {"overview", "columns_meta"}
+    if patch_slides is not None and not sinks and output_file is not None:
+        if Path(output_file).exists():
+            needed = aggregates_for_tags(patch_slides)
+
+    df = sample = None
+    columns_meta = overview = None
+    memory_plan = None
+    memory_monitor = PeakMemoryMonitor().start() if memory_budget else None
+    if preview:
+        # Sample the CSV data and estimate the metadata
+        sample = sample_csv(
+            csv_data_path, preview_time_budget, strategy=preview_strategy
+        )
+        print(
+            f"Preview from {len(sample.df):,} sampled rows "
+            f"({sample.bytes_read:,} of {sample.file_bytes:,} bytes read)"
+        )
+        compute = PandasBackend()
+        df = sample.df
+        if "columns_meta" in needed:
+            columns_meta = estimate_column_metadata(sample)
+    elif needed:
+        if aggregate_store is not None:
+            # Update the stored aggregates and read them by company
+            compute = StoreBackend(aggregate_store, company_name)
+        else:
+            # Read CSV data, out of core if it would not fit the memory budget
+            compute, memory_plan = select_backend(csv_data_path, backend, memory_budget)
+        df = compute.read_csv(csv_data_path)
+
+        # Get the metadata
+        if "columns_meta" in needed:
+            columns_meta = get_dataframe_metadata(df, compute)
+
+    # Compute the aggregates and chart once for every output
+    if "overview" in needed:
+        overview = compute_overview(
+            df, company_name, compute, sample, chart_granularity
+        )
+    aggregates = DeckAggregates(
+        title=f"UCC Data - {company_name.upper()}{' (Preview)' if preview else ''}",
         subtitle=subtitle_company,
+        overview=overview,
+        columns_meta=columns_meta,
     )
 
-    # Add title slide
-    add_title_slide(prs, title_slide_model, color_scheme)
-
-    # Add overview slide
-    create_overview_slide(df, prs, color_scheme, company_name)
-
-    # Generate slides based on the number of columns
-    if len(columns_meta.columns) > 10:
-        print("Creating consolidated view")
-        create_consolidated_view(columns_meta, prs, color_scheme)
-    else:
-        create_detailed_view(columns_meta, prs, color_scheme)
-
-    # Create PPTXModel and write to file
-    pptx_model = PPTXModel(file_name=str(output_file), pptx_raw=prs)
-    pptx_model.write_pptx()
-
-    # Check that the output file exists and print that the PPTX file was created
-    pptx_model.validate_output_exists()
+    outputs = list(sinks or [])
+    if output_file is not None:
+        outputs.insert(
+            0,
+            PptxSink(
+                output_file,
+                max_table_slides,
+                package_settings,
+                year_table_summary,
+                patch_tags=patch_slides,
+                telemetry_sidecar=telemetry_sidecar,
+            ),
+        )
+    for sink in outputs:
+        sink.write(aggregates)
+
+    if memory_monitor is not None:
+        peak_rss_bytes = memory_monitor.stop()
+        if memory_plan is not None:
+            memory_plan.start_rss_bytes = memory_monitor.start_bytes
+            memory_plan.peak_rss_bytes = peak_rss_bytes
+            print(memory_plan.summary())
 
     return output_file
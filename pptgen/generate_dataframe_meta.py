@@ -1,7 +1,7 @@
 """Generate the dataframe meta data for the given dataframe."""
 
 from io import BytesIO
-from typing import List
+from typing import List, Optional, Tuple
 
 import matplotlib.pyplot as plt
 import pandas as pd
@@ -9,166 +9,295 @@ from pptx import Presentation, presentation
 from pptx.util import Inches
 
 from pptgen.colors import apply_background_gradient, apply_text_formatting
+from pptgen.compute import ComputeBackend, backend_for, find_year_column
+from pptgen.layout_planner import (
+    TABLE_LEFT,
+    TABLE_TOP,
+    TABLE_WIDTH,
+    metadata_row_values,
+    omitted_columns_text,
+    plan_metadata_layout,
+)
 from pptgen.model.dataframe_meta import ColumnMeta, ColumnsMeta
+from pptgen.model.dataframe_sample import DataFrameSample
+from pptgen.model.deck_aggregates import OverviewAggregates
+from pptgen.model.layout_plan import LayoutPlan
+from pptgen.sampling import (
+    estimate_counts,
+    estimate_date_span,
+    estimate_total_rows,
+    estimate_year_counts,
+)
+from pptgen.slide_append import append_slide
+from pptgen.table_summary import (
+    format_label,
+    sparkline,
+    summarize_counts,
+    summary_note,
+)
+from pptgen.time_aggregation import (
+    GRANULARITY_LABELS,
+    TARGET_POINTS,
+    aggregate_daily_counts,
+    chart_counts,
+    choose_granularity,
+    remove_partial_last_bucket,
+)
+
+
+def get_dataframe_metadata(
+    df: pd.DataFrame, backend: Optional[ComputeBackend] = None
+) -> ColumnsMeta:
+    """Extract metadata from dataframe and return a ColumnsMeta object."""
+    backend = backend or backend_for(df)
 
+    return ColumnsMeta(columns=backend.column_metadata(df))
 
-def get_dataframe_metadata(df: pd.DataFrame) -> ColumnsMeta:
-    """Extract metadata from dataframe and return a ColumnsMeta object."""
-    metadata = []
-    for col in df.columns:
-        col_type = str(df[col].dtype)
-        non_null = df[col].count()
-        null = df[col].isnull().sum()
-        unique = df[col].nunique()
-
-        column_meta = ColumnMeta(
-            column=col,
-            type=col_type,
-            non_null_count=non_null,
-            null_count=null,
-            unique_values=unique,
-        )
-        metadata.append(column_meta)
 
-    return ColumnsMeta(columns=metadata)
+def add_metadata_table_slide(
+    prs: Presentation,
+    color_scheme,
+    title_text: str,
+    chunk: List[ColumnMeta],
+    layout_plan: LayoutPlan,
+    start: int = 0,
+    note: Optional[str] = None,
+) -> presentation.Slides:
+    """Add a slide with a metadata table laid out according to the plan."""
+    slide = append_slide(prs, prs.slide_layouts[5])  # Table slide layout
+
+    # Add title, labelling sample-derived numbers as estimates
+    if any(col_data.is_estimate for col_data in chunk):
+        title_text = f"{title_text} (Estimated)"
+    title = slide.shapes.title
+    title.text = title_text
+    apply_text_formatting(
+        title.text_frame.paragraphs[0], color_scheme.title_color, 24, "Arial", bold=True
+    )
 
+    # Add table sized to the planned rows
+    row_heights = [layout_plan.header_height] + layout_plan.row_heights[
+        start : start + len(chunk)
+    ]
+    if note is not None:
+        row_heights.append(layout_plan.omitted_height)
+    rows, cols = len(row_heights), len(layout_plan.headers)
+    left = Inches(TABLE_LEFT)
+    top = Inches(TABLE_TOP)
+    width = Inches(TABLE_WIDTH)
+    height = Inches(sum(row_heights))
 
-def create_consolidated_view(
-    columns_meta: ColumnsMeta, prs: Presentation, color_scheme
-) -> List[presentation.Slides]:
-    """Create a consolidated view for dataframes with more than 10 columns."""
-    slides = []
-    chunk_size = 8  # Changed from 50 to 8
+    table = slide.shapes.add_table(rows, cols, left, top, width, height).table
 
-    for i in range(0, len(columns_meta.columns), chunk_size):
-        chunk = columns_meta.columns[i : i + chunk_size]
-        slide = prs.slides.add_slide(prs.slide_layouts[5])  # Table slide layout
+    for j, column_width in enumerate(layout_plan.column_widths):
+        table.columns[j].width = Inches(column_width)
+    for i, row_height in enumerate(row_heights):
+        table.rows[i].height = Inches(row_height)
 
-        # Add title
-        title = slide.shapes.title
-        title.text = f"DataFrame Metadata (Columns {i+1}-{i+len(chunk)})"
+    # Set header
+    for j, header in enumerate(layout_plan.headers):
+        cell = table.cell(0, j)
+        cell.text = header
         apply_text_formatting(
-            title.text_frame.paragraphs[0],
-            color_scheme.title_color,
-            24,
-            "Arial",
+            cell.text_frame.paragraphs[0],
+            color_scheme.subtitle_color,
+            layout_plan.header_font_size,
+            layout_plan.font_name,
             bold=True,
         )
 
-        # Add table
-        rows, cols = len(chunk) + 1, 3  # +1 for header
-        left = Inches(0.5)
-        top = Inches(1.5)
-        width = Inches(9)
-        height = Inches(5.5)
-
-        table = slide.shapes.add_table(rows, cols, left, top, width, height).table
-
-        # Set header
-        headers = ["Column", "Type", "Non-Null Count"]
-        for j, header in enumerate(headers):
-            cell = table.cell(0, j)
-            cell.text = header
+    # Fill data
+    for row, col_data in enumerate(chunk, start=1):
+        values = metadata_row_values(col_data, layout_plan.view)
+        for j, value in enumerate(values):
+            cell = table.cell(row, j)
+            cell.text = value
             apply_text_formatting(
                 cell.text_frame.paragraphs[0],
-                color_scheme.subtitle_color,
-                14,
-                "Arial",
-                bold=True,
+                color_scheme.content_color,
+                layout_plan.font_size,
+                layout_plan.font_name,
             )
 
-        # Fill data
-        for row, col_data in enumerate(chunk, start=1):
-            table.cell(row, 0).text = col_data.column
-            table.cell(row, 1).text = col_data.type
-            table.cell(row, 2).text = str(col_data.non_null_count)
+    # Note across the last row, e.g. the columns left out
+    if note is not None:
+        cell = table.cell(rows - 1, 0)
+        cell.merge(table.cell(rows - 1, cols - 1))
+        cell.text = note
+        apply_text_formatting(
+            cell.text_frame.paragraphs[0],
+            color_scheme.content_color,
+            layout_plan.font_size,
+            layout_plan.font_name,
+            italic=True,
+        )
+
+    # Apply background gradient
+    apply_background_gradient(slide, color_scheme.background_gradient)
+
+    return slide
 
-        # Apply background gradient
-        apply_background_gradient(slide, color_scheme.background_gradient)
 
+def add_metadata_table_slides(
+    columns_meta: ColumnsMeta,
+    prs: Presentation,
+    color_scheme,
+    layout_plan: LayoutPlan,
+    title: Optional[str] = None,
+) -> List[presentation.Slides]:
+    """
+    Add a table slide per chunk of a plan, noting any columns left out last.
+
+    Slides are titled with their column range unless a title is given.
+    """
+    slides = []
+    for number, (start, stop) in enumerate(layout_plan.chunks, start=1):
+        chunk = columns_meta.columns[start:stop]
+        note = None
+        if layout_plan.omitted_columns and number == layout_plan.slide_count:
+            note = omitted_columns_text(layout_plan.omitted_columns)
+        slide = add_metadata_table_slide(
+            prs,
+            color_scheme,
+            title or f"DataFrame Metadata (Columns {start+1}-{stop})",
+            chunk,
+            layout_plan,
+            start=start,
+            note=note,
+        )
         slides.append(slide)
 
     return slides
 
 
-def create_detailed_view(
-    columns_meta: ColumnsMeta, prs: Presentation, color_scheme
+def create_consolidated_view(
+    columns_meta: ColumnsMeta,
+    prs: Presentation,
+    color_scheme,
+    layout_plan: Optional[LayoutPlan] = None,
 ) -> List[presentation.Slides]:
-    """Create a detailed view for dataframes with 10 or fewer columns."""
-    slide = prs.slides.add_slide(prs.slide_layouts[5])  # Table slide layout
-
-    # Add title
-    title = slide.shapes.title
-    title.text = "DataFrame Metadata"
-    apply_text_formatting(
-        title.text_frame.paragraphs[0], color_scheme.title_color, 24, "Arial", bold=True
-    )
+    """Create a consolidated view, packing as many columns per slide as fit."""
+    if layout_plan is None:
+        layout_plan = plan_metadata_layout(columns_meta, view="consolidated")
 
-    # Add table
-    rows, cols = len(columns_meta.columns) + 1, 5  # +1 for header
-    left = Inches(0.5)
-    top = Inches(1.5)
-    width = Inches(9)
-    height = Inches(5.5)
+    return add_metadata_table_slides(columns_meta, prs, color_scheme, layout_plan)
 
-    table = slide.shapes.add_table(rows, cols, left, top, width, height).table
 
-    # Set header
-    headers = ["Column", "Type", "Non-Null Count", "Null Count", "Unique Values"]
-    for j, header in enumerate(headers):
-        cell = table.cell(0, j)
-        cell.text = header
-        apply_text_formatting(
-            cell.text_frame.paragraphs[0],
-            color_scheme.subtitle_color,
-            14,
-            "Arial",
-            bold=True,
-        )
+def create_detailed_view(
+    columns_meta: ColumnsMeta,
+    prs: Presentation,
+    color_scheme,
+    layout_plan: Optional[LayoutPlan] = None,
+) -> List[presentation.Slides]:
+    """
+    Create a detailed view, meant for dataframes whose columns fit on one slide.
 
-    # Fill data
-    for row, col_data in enumerate(columns_meta.columns, start=1):
-        table.cell(row, 0).text = col_data.column
-        table.cell(row, 1).text = col_data.type
-        table.cell(row, 2).text = str(col_data.non_null_count)
-        table.cell(row, 3).text = str(col_data.null_count)
-        table.cell(row, 4).text = str(col_data.unique_values)
+    Columns that do not fit go on further slides titled with their range, as
+    the plan chunks them.
+    """
+    if layout_plan is None:
+        layout_plan = plan_metadata_layout(columns_meta, view="detailed")
 
-    # Apply background gradient
-    apply_background_gradient(slide, color_scheme.background_gradient)
+    fits_one_slide = layout_plan.slide_count == 1 and not layout_plan.omitted_columns
+    title = "DataFrame Metadata" if fits_one_slide else None
 
-    return [slide]
+    return add_metadata_table_slides(
+        columns_meta, prs, color_scheme, layout_plan, title
+    )
 
 
 def remove_last_monthly_count(monthly_counts: pd.DataFrame) -> pd.DataFrame:
     """Remove the last monthly count."""
-    # Check if the last month should be excluded
-    if len(monthly_counts) > 1:
-        last_month_count = monthly_counts.iloc[-1][0]
-        previous_month_count = monthly_counts.iloc[-2][0]
-        if last_month_count < 0.5 * previous_month_count:
-            monthly_counts = monthly_counts[:-1]  # Exclude the last month
-
-    return monthly_counts
+    return remove_partial_last_bucket(monthly_counts)
 
 
-def create_df_monthly_counts(df: pd.DataFrame) -> pd.DataFrame:
+def create_df_monthly_counts(
+    df: pd.DataFrame, backend: Optional[ComputeBackend] = None
+) -> pd.DataFrame:
     """Create the dataframe for monthly counts."""
-    df["date"] = pd.to_datetime(df["FILE_DATE"], format="%Y-%m-%d")
-    # Create a cumulative count of filings
-    monthly_counts = df.groupby(df["date"].dt.to_period("M")).size().reset_index()
-    monthly_counts["date"] = monthly_counts["date"].dt.to_timestamp()
+    backend = backend or backend_for(df)
+    monthly_counts = backend.monthly_counts(df, "FILE_DATE")
 
     # Remove the last monthly count if it is less than half of the previous month
     return remove_last_monthly_count(monthly_counts)
 
 
-def plot_monthly_counts(monthly_counts: pd.DataFrame, company_name: str) -> BytesIO:
-    """Plot the monthly counts."""
+def create_df_time_counts(
+    df: pd.DataFrame,
+    backend: Optional[ComputeBackend] = None,
+    granularity: str = "auto",
+    target_points: int = TARGET_POINTS,
+) -> Tuple[pd.DataFrame, pd.DataFrame, str]:
+    """
+    Create the row counts over time, at the chart granularity.
+
+    Returns:
+    Tuple[pd.DataFrame, pd.DataFrame, str]: The counts of every bucket, the
+    series to plot and the granularity used.
+    """
+    backend = backend or backend_for(df)
+    daily_counts = backend.daily_counts(df, "FILE_DATE")
+    counts, granularity = aggregate_daily_counts(
+        daily_counts, granularity, target_points
+    )
+    last_date = daily_counts["date"].max() if len(daily_counts) else None
+
+    return (
+        counts,
+        chart_counts(counts, last_date, granularity, target_points),
+        granularity,
+    )
+
+
+def estimate_time_counts(
+    sample: DataFrameSample,
+    granularity: str = "auto",
+    target_points: int = TARGET_POINTS,
+) -> Tuple[pd.DataFrame, pd.DataFrame, str]:
+    """
+    Estimate the row counts over time from a sample, at the chart granularity.
+
+    Returns:
+    Tuple[pd.DataFrame, pd.DataFrame, str]: The estimated counts of every
+    bucket, the series to plot and the granularity used.
+    """
+    first_date, last_date = estimate_date_span(sample)
+    if granularity == "auto":
+        granularity = choose_granularity(first_date, last_date, target_points)
+
+    counts = estimate_counts(sample, granularity)
+
+    return (
+        counts,
+        chart_counts(counts, last_date, granularity, target_points),
+        granularity,
+    )
+
+
+def plot_monthly_counts(
+    monthly_counts: pd.DataFrame,
+    company_name: str,
+    granularity: str = "month",
+    image_format: str = "png",
+) -> BytesIO:
+    """Plot the counts over time, with a confidence band for estimated counts."""
+    is_estimate = "lower" in monthly_counts.columns
     plt.figure(figsize=(6, 4))
     plt.plot(monthly_counts["date"], monthly_counts[0], color="#0066CC")
+    if is_estimate:
+        plt.fill_between(
+            monthly_counts["date"],
+            monthly_counts["lower"],
+            monthly_counts["upper"],
+            color="#0066CC",
+            alpha=0.2,
+            label="95% confidence interval",
+        )
+        plt.legend(fontsize=8)
     plt.title(
-        f"Monthly Count of Filings for {company_name.upper()}",
+        f"{'Estimated ' if is_estimate else ''}{GRANULARITY_LABELS[granularity]} "
+        f"Count of Filings "
+        f"for {company_name.upper()}",
         fontsize=14,
         fontweight="bold",
     )
@@ -180,7 +309,7 @@ def plot_monthly_counts(monthly_counts: pd.DataFrame, company_name: str) -> Byte
 
     # Save the plot to a BytesIO object
     img_bytes = BytesIO()
-    plt.savefig(img_bytes, format="png", dpi=300, bbox_inches="tight")
+    plt.savefig(img_bytes, format=image_format, dpi=300, bbox_inches="tight")
     img_bytes.seek(0)
 
     return img_bytes
@@ -201,26 +330,102 @@ def add_plot_to_slide(
     plt.close()
 
 
-def create_overview_slide(
-    df: pd.DataFrame, prs: Presentation, color_scheme, company_name: str
+def compute_overview(
+    df: pd.DataFrame,
+    company_name: str,
+    backend: Optional[ComputeBackend] = None,
+    sample: Optional[DataFrameSample] = None,
+    granularity: str = "auto",
+) -> OverviewAggregates:
+    """
+    Compute the overview counts and render the chart of counts over time.
+
+    The year column is found from the schema alone. The chart granularity is
+    chosen from the date span unless given. When a sample is given, df is
+    the sampled rows and every count is scaled up to the whole file.
+    """
+    backend = backend or backend_for(df)
+
+    # Count the rows
+    row_count_ci = None
+    if sample is None:
+        row_count = backend.row_count(df)
+    else:
+        row_count, lower, upper = estimate_total_rows(sample)
+        row_count_ci = (lower, upper)
+
+    # Find year column and count the rows per year
+    year_column = find_year_column(backend.schema(df))
+    year_counts = None
+    if year_column:
+        if sample is None:
+            year_counts = backend.value_counts(df, year_column).to_frame("count")
+        else:
+            year_counts = estimate_year_counts(sample)
+            year_counts["count"] = year_counts["count"].round().astype(int)
+
+    # Count the rows over time, and downsample them only for the chart
+    if sample is None:
+        time_counts, chart_series, granularity = create_df_time_counts(
+            df, backend, granularity
+        )
+    else:
+        time_counts, chart_series, granularity = estimate_time_counts(
+            sample, granularity
+        )
+
+    img_bytes = plot_monthly_counts(chart_series, company_name, granularity)
+    plt.close()
+
+    return OverviewAggregates(
+        company_name=company_name,
+        row_count=row_count,
+        row_count_ci=row_count_ci,
+        sampled_rows=len(sample.df) if sample is not None else None,
+        year_column=year_column,
+        year_counts=year_counts,
+        time_counts=time_counts,
+        chart_counts=chart_series,
+        granularity=granularity,
+        chart_png=img_bytes.getvalue(),
+    )
+
+
+def add_overview_slide(
+    prs: Presentation,
+    color_scheme,
+    overview: OverviewAggregates,
+    year_table_summary: str = "auto",
 ) -> presentation.Slides:
-    """Create an overview slide with total row count and rows per year."""
-    slide = prs.slides.add_slide(prs.slide_layouts[5])  # Title and Content layout
+    """
+    Add an overview slide with total row count, rows per year and the chart.
+
+    Years that do not fit the table are summarized by year_table_summary,
+    with a sparkline of every year. Estimated counts are labelled as such.
+    """
+    slide = append_slide(prs, prs.slide_layouts[5])  # Title and Content layout
 
     # Add title
     title = slide.shapes.title
-    title.text = f"{company_name.upper()} Overview"
+    title.text = f"{overview.company_name.upper()} Overview"
     apply_text_formatting(
         title.text_frame.paragraphs[0], color_scheme.title_color, 24, "Arial", bold=True
     )
 
     # Add total row count
-    total_rows = len(df)
     total_rows_shape = slide.shapes.add_textbox(
         Inches(0.5), Inches(1.5), Inches(9), Inches(0.5)
     )
     total_rows_text = total_rows_shape.text_frame.add_paragraph()
-    total_rows_text.text = f"Total number of rows: {total_rows:,}"
+    if not overview.is_estimate:
+        total_rows_text.text = f"Total number of rows: {overview.row_count:,}"
+    else:
+        lower, upper = overview.row_count_ci
+        total_rows_text.text = (
+            f"Estimated number of rows: ~{overview.row_count:,} "
+            f"(95% CI {lower:,}-{upper:,}, "
+            f"preview from {overview.sampled_rows:,} sampled rows)"
+        )
     apply_text_formatting(
         total_rows_text, color_scheme.content_color, 18, "Arial", bold=True
     )
@@ -231,31 +436,17 @@ def create_overview_slide(
     width = Inches(4.5)
     height = Inches(4.5)
 
-    # Find year column
-    if "FILE_YEAR" in df.columns:
-        year_column = "FILE_YEAR"
-    else:
-        year_columns = (
-            df.filter(regex=r"year", case=False)
-            .select_dtypes(include=["int64", "float64"])
-            .columns
-        )
-        year_column = year_columns[0] if len(year_columns) > 0 else None
+    if overview.year_counts is not None:
+        year_counts = overview.year_counts["count"]
+        count_prefix = "~" if overview.is_estimate else ""
 
-    if year_column:
-        # Get value counts for the year column
-        year_counts = df[year_column].value_counts().sort_index()
+        # Summarize the years that do not fit the table
+        year_table_counts = summarize_counts(year_counts, strategy=year_table_summary)
+        is_summarized = len(year_table_counts) < len(year_counts)
 
         # Add table
-        # rows, cols = len(year_counts) + 1, 2  # +1 for header
-        # Add table
-        rows = min(len(year_counts) + 1, 20)  # Limit to 19 data rows + header
+        rows = len(year_table_counts) + 1  # +1 for header
         cols = 2
-        # left = Inches(0.5)
-        # top = Inches(2.5)
-        # width = Inches(4)
-        # height = Inches(0.5 * (rows + 1))
-        # height = Inches(4.5)  # Fixed height
         table = slide.shapes.add_table(
             rows, cols, left_margin, top_margin, width, height
         ).table
@@ -274,11 +465,9 @@ def create_overview_slide(
             )
 
         # Fill data
-        for row, (year, count) in enumerate(year_counts.items(), start=1):
-            if row >= rows:
-                break
+        for row, (year, count) in enumerate(year_table_counts.items(), start=1):
             table.cell(row, 0).text = str(year)
-            table.cell(row, 1).text = f"{count:,}"
+            table.cell(row, 1).text = f"{count_prefix}{count:,}"
             apply_text_formatting(
                 table.cell(row, 0).text_frame.paragraphs[0],
                 color_scheme.content_color,
@@ -294,6 +483,29 @@ def create_overview_slide(
         # Adjust row heights
         for row in table.rows:
             row.height = int(height / rows)
+
+        # Show every year as a sparkline under a summarized table, and how
+        # the table was summarized
+        if is_summarized:
+            sparkline_shape = slide.shapes.add_textbox(
+                left_margin, top_margin + height, width, Inches(0.5)
+            )
+            sparkline_text = sparkline_shape.text_frame.paragraphs[0]
+            sparkline_text.text = (
+                f"{format_label(year_counts.index[0])} {sparkline(year_counts)} "
+                f"{format_label(year_counts.index[-1])}"
+            )
+            apply_text_formatting(
+                sparkline_text, color_scheme.content_color, 10, "Arial"
+            )
+            note_text = sparkline_shape.text_frame.add_paragraph()
+            note_text.text = (
+                f"{summary_note(year_counts, year_table_counts)}. "
+                f"Years come from the {overview.year_column} column."
+            )
+            apply_text_formatting(
+                note_text, color_scheme.content_color, 9, "Arial", italic=True
+            )
     else:
         # If no year column found, add a message
         no_year_shape = slide.shapes.add_textbox(
@@ -305,9 +517,7 @@ def create_overview_slide(
             no_year_text, color_scheme.content_color, 14, "Arial", italic=True
         )
 
-    monthly_counts = create_df_monthly_counts(df.copy())
-
-    img_bytes = plot_monthly_counts(monthly_counts, company_name)
+    img_bytes = BytesIO(overview.chart_png)
 
     graph_left = Inches(5.5)  # Adjusted to create some space between table and graph
     add_plot_to_slide(img_bytes, slide, graph_left, top_margin, width, height)
@@ -316,3 +526,19 @@ def create_overview_slide(
     apply_background_gradient(slide, color_scheme.background_gradient)
 
     return slide
+
+
+def create_overview_slide(
+    df: pd.DataFrame,
+    prs: Presentation,
+    color_scheme,
+    company_name: str,
+    backend: Optional[ComputeBackend] = None,
+    sample: Optional[DataFrameSample] = None,
+    granularity: str = "auto",
+    year_table_summary: str = "auto",
+) -> presentation.Slides:
+    """Create an overview slide with total row count and rows per year."""
+    overview = compute_overview(df, company_name, backend, sample, granularity)
+
+    return add_overview_slide(prs, color_scheme, overview, year_table_summary)
@@ -0,0 +1,117 @@
+"""Cached filename index over the image directory."""
+
+import bisect
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, PrivateAttr
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+# Indexes built in this process, keyed by image directory
+_image_indexes: Dict[Path, "ImageIndex"] = {}
+
+
+class ImageIndex(BaseModel):
+    """Filename index over an image directory, invalidated by directory mtimes."""
+
+    root: Path
+    directory_mtimes: Dict[str, int]  # Relative directory -> mtime in ns
+    files: List[str]  # Relative paths, in lookup priority order
+
+    _by_name: Dict[str, str] = PrivateAttr(default_factory=dict)
+    _by_stem: Dict[str, str] = PrivateAttr(default_factory=dict)
+    _sorted_names: List[str] = PrivateAttr(default_factory=list)
+
+    def model_post_init(self, __context) -> None:
+        """Build the lookup tables."""
+        for file in self.files:
+            name = Path(file).name
+            self._by_name.setdefault(name, file)
+            self._by_stem.setdefault(Path(file).stem, file)
+        self._sorted_names = sorted(self._by_name)
+
+    @classmethod
+    def build(cls, root: Path) -> "ImageIndex":
+        """Walk the image directory once and index every image file."""
+        directory_mtimes = {}
+        files = []
+        for dir_path, _, file_names in os.walk(root):
+            relative_dir = os.path.relpath(dir_path, root)
+            directory_mtimes[relative_dir] = os.stat(dir_path).st_mtime_ns
+            for file_name in file_names:
+                if file_name.lower().endswith(IMAGE_EXTENSIONS):
+                    files.append(
+                        os.path.normpath(os.path.join(relative_dir, file_name))
+                    )
+
+        # Keep the previous lookup order: by extension, then by path
+        files.sort(key=lambda f: (IMAGE_EXTENSIONS.index(Path(f).suffix.lower()), f))
+
+        return cls(root=root, directory_mtimes=directory_mtimes, files=files)
+
+    def is_stale(self) -> bool:
+        """Check whether any indexed directory changed since the index was built."""
+        for relative_dir, mtime in self.directory_mtimes.items():
+            try:
+                if os.stat(self.root.joinpath(relative_dir)).st_mtime_ns != mtime:
+                    return True
+            except FileNotFoundError:
+                return True
+
+        return not self.directory_mtimes
+
+    def find(self, file_name: str) -> Optional[Path]:
+        """Find an image by exact name, stem, name prefix or name substring."""
+        match = self._by_name.get(file_name) or self._by_stem.get(file_name)
+
+        if match is None:
+            i = bisect.bisect_left(self._sorted_names, file_name)
+            if i < len(self._sorted_names) and self._sorted_names[i].startswith(
+                file_name
+            ):
+                match = self._by_name[self._sorted_names[i]]
+
+        if match is None:
+            match = next((f for f in self.files if file_name in Path(f).name), None)
+
+        return self.root.joinpath(match).resolve() if match else None
+
+    def save(self, index_file: Path) -> None:
+        """Persist the index as JSON."""
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        index_file.write_text(self.model_dump_json())
+
+    @classmethod
+    def load(cls, index_file: Path) -> "ImageIndex":
+        """Load a persisted index."""
+        return cls.model_validate_json(index_file.read_text())
+
+
+def get_image_index(root: Path, index_file: Optional[Path] = None) -> ImageIndex:
+    """
+    Get the index for an image directory, rebuilding it only when it is stale.
+
+    Args:
+    root (Path): The image directory.
+    index_file (Optional[Path]): JSON file to persist the index across processes.
+
+    Returns:
+    ImageIndex: An up to date index of the image directory.
+    """
+    index = _image_indexes.get(root)
+
+    if index is None and index_file is not None and index_file.exists():
+        index = ImageIndex.load(index_file)
+        if index.root != root:
+            index = None
+
+    if index is None or index.is_stale():
+        index = ImageIndex.build(root)
+        if index_file is not None:
+            index.save(index_file)
+
+    _image_indexes[root] = index
+
+    return index
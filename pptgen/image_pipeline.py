@@ -0,0 +1,163 @@
+"""Resize, recompress and cache images before they are added to a slide."""
+
+import hashlib
+import io
+import os
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from PIL import ExifTags, Image, ImageOps
+
+from pptgen.model.image_settings import ImageSettings
+
+MAX_CACHED_IMAGES = 256
+PHOTO_SAMPLE_SIZE = (128, 128)
+PHOTO_MIN_COLORS = 4096  # Distinct colors in the sample that mark a photograph
+
+# Processed image bytes keyed by source digest, target size and encoding
+_processed_images: "OrderedDict[Tuple, bytes]" = OrderedDict()
+
+
+@lru_cache(maxsize=4096)
+def hash_source(image_path: str, mtime_ns: int, size: int) -> str:
+    """Hash the contents of an image file, cached by path, mtime and size."""
+    digest = hashlib.sha256()
+    with open(image_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+
+def file_digest(image_path: str) -> str:
+    """Get the content hash of an image file."""
+    stat = os.stat(image_path)
+    return hash_source(os.path.abspath(image_path), stat.st_mtime_ns, stat.st_size)
+
+
+def target_pixels(width: int, height: int, dpi: int) -> Tuple[int, int]:
+    """Convert a placement size in EMU to pixels at the given DPI."""
+    emu_per_inch = 914400
+    return (
+        max(round(width * dpi / emu_per_inch), 1),
+        max(round(height * dpi / emu_per_inch), 1),
+    )
+
+
+def is_photographic(image: Image.Image) -> bool:
+    """Guess whether an image is a photograph, from the colors of a pixel sample."""
+    sample = image.resize(PHOTO_SAMPLE_SIZE, Image.NEAREST).convert("RGB")
+    return sample.getcolors(PHOTO_MIN_COLORS) is None
+
+
+def choose_format(image: Image.Image, settings: ImageSettings) -> str:
+    """
+    Choose the output format.
+
+    JPEG sources stay JPEG. Other images become JPEG only when they look
+    photographic, so logos, screenshots and images with transparency keep
+    the sharp edges of PNG.
+    """
+    if settings.image_format != "auto":
+        return settings.image_format
+
+    has_alpha = image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+    if has_alpha or image.mode == "P":
+        return "PNG"
+    if image.format == "JPEG" or is_photographic(image):
+        return "JPEG"
+
+    return "PNG"
+
+
+def resize_image(
+    image_path: str, size: Tuple[int, int], settings: ImageSettings
+) -> bytes:
+    """Rotate an image upright, downsample it to fit the target size and recompress it."""
+    with open(image_path, "rb") as f:
+        source = f.read()
+
+    with Image.open(io.BytesIO(source)) as image:
+        image_format = choose_format(image, settings)
+        # Apply the EXIF orientation, which is not kept in the output
+        transposed = image.getexif().get(ExifTags.Base.Orientation, 1) != 1
+        if transposed:
+            image = ImageOps.exif_transpose(image)
+
+        # Never upscale, only shrink each axis to the target
+        new_size = (min(image.width, size[0]), min(image.height, size[1]))
+        resized = new_size != image.size
+        if resized:
+            image = image.resize(new_size, Image.LANCZOS)
+
+        output = io.BytesIO()
+        if image_format == "JPEG":
+            image.convert("RGB").save(
+                output, format="JPEG", quality=settings.jpeg_quality, optimize=True
+            )
+        else:
+            image.save(output, format="PNG", optimize=True)
+
+    # Keep the original when recompressing alone does not make it smaller
+    if not (resized or transposed) and len(output.getvalue()) >= len(source):
+        return source
+
+    return output.getvalue()
+
+
+def cache_image(key: Tuple, image_bytes: bytes) -> None:
+    """Add processed bytes to the in-memory cache, evicting the oldest entries."""
+    _processed_images[key] = image_bytes
+    _processed_images.move_to_end(key)
+    while len(_processed_images) > MAX_CACHED_IMAGES:
+        _processed_images.popitem(last=False)
+
+
+def process_image(
+    image_path: str, width: int, height: int, settings: Optional[ImageSettings] = None
+) -> io.BytesIO:
+    """
+    Get image bytes downsampled to the placement size, using the caches.
+
+    Args:
+    image_path (str): Path to the source image.
+    width (int): Placement width in EMU.
+    height (int): Placement height in EMU.
+    settings (Optional[ImageSettings]): Resize and recompression settings.
+
+    Returns:
+    io.BytesIO: The processed image.
+    """
+    settings = settings or ImageSettings()
+    size = target_pixels(width, height, settings.dpi)
+    key = (
+        file_digest(image_path),
+        size,
+        settings.image_format,
+        settings.jpeg_quality,
+    )
+
+    image_bytes = _processed_images.get(key)
+    if image_bytes is not None:
+        _processed_images.move_to_end(key)
+        return io.BytesIO(image_bytes)
+
+    cache_file = None
+    if settings.cache_dir is not None:
+        key_hash = hashlib.sha256(repr(key).encode()).hexdigest()
+        cache_file = settings.cache_dir.joinpath(f"{key_hash}.img")
+        if cache_file.exists():
+            image_bytes = cache_file.read_bytes()
+
+    if image_bytes is None:
+        image_bytes = resize_image(image_path, size, settings)
+        if cache_file is not None:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file.write_bytes(image_bytes)
+            tmp_file.replace(cache_file)
+
+    cache_image(key, image_bytes)
+
+    return io.BytesIO(image_bytes)
@@ -0,0 +1,363 @@
+"""Plan the layout of the metadata table slides from cached font metrics."""
+
+import logging
+import math
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from matplotlib import font_manager, ft2font
+
+from pptgen.model.dataframe_meta import ColumnMeta, ColumnsMeta
+from pptgen.model.layout_plan import DeckPlan, LayoutPlan
+
+CONSOLIDATED_HEADERS = ["Column", "Type", "Non-Null Count"]
+DETAILED_HEADERS = ["Column", "Type", "Non-Null Count", "Null Count", "Unique Values"]
+
+# Table placement on a default 10 x 7.5 inch slide
+TABLE_LEFT = 0.5
+TABLE_TOP = 1.5
+TABLE_WIDTH = 9.0
+TABLE_HEIGHT = 5.5
+
+# python-pptx default cell margins and text frame insets, in inches
+CELL_MARGIN_X = 0.1
+CELL_MARGIN_Y = 0.05
+
+# Body placeholder of the Title and Content layout, in inches
+CONTENT_WIDTH = 9.0
+CONTENT_HEIGHT = 4.95
+BULLET_INDENT = 0.375  # Left margin of first-level bullets
+PARAGRAPH_SPACING = 0.2  # Space before each paragraph, as a share of a line
+
+LINE_SPACING = 1.2
+AVERAGE_CHAR_WIDTH = 0.55  # In em, used when a glyph or font cannot be measured
+MAX_COLUMN_SHARE = 0.6  # No single column takes more than this share of the table
+
+# Approximate serialized sizes, measured against decks built by python-pptx
+BASE_PPTX_BYTES = 28_000
+TITLE_SLIDE_BYTES = 1_500
+OVERVIEW_SLIDE_BYTES = 200_000
+TABLE_SLIDE_BYTES = 700
+TABLE_CELL_BYTES = 15
+
+
+@lru_cache(maxsize=None)
+def get_font_metrics(font_name: str) -> Dict[str, float]:
+    """
+    Load the advance widths of the printable ASCII glyphs of a font.
+
+    The font is resolved through matplotlib's font manager, falling back to its
+    default font when the font is not installed. Widths are returned in em.
+    """
+    try:
+        font_path = font_manager.findfont(
+            font_manager.FontProperties(family=font_name), fallback_to_default=True
+        )
+        font = ft2font.FT2Font(font_path)
+    except (OSError, RuntimeError, ValueError):
+        logging.warning("Could not load font metrics for %s", font_name)
+        return {}
+
+    load_flags = getattr(ft2font, "LoadFlags", ft2font)
+    no_scale = getattr(load_flags, "NO_SCALE", None) or ft2font.LOAD_NO_SCALE
+    units_per_em = font.units_per_EM
+
+    return {
+        chr(code): font.load_char(code, flags=no_scale).horiAdvance / units_per_em
+        for code in range(32, 127)
+    }
+
+
+@lru_cache(maxsize=65536)
+def measure_text_width(text: str, font_name: str, font_size: int) -> float:
+    """Estimate the width in inches of a single line of text."""
+    advances = get_font_metrics(font_name)
+    ems = sum(advances.get(char, AVERAGE_CHAR_WIDTH) for char in text)
+    return ems * font_size / 72
+
+
+def count_wrapped_lines(text: str, width: float, font_name: str, font_size: int) -> int:
+    """Estimate the number of lines text wraps to in a box of the given width."""
+    if width <= 0:
+        raise ValueError("Width must be positive.")
+
+    space_width = measure_text_width(" ", font_name, font_size)
+    lines = 0
+    for line in text.split("\n"):
+        lines += 1
+        line_width = 0.0
+        for word in line.split():
+            word_width = measure_text_width(word, font_name, font_size)
+            if line_width and line_width + space_width + word_width <= width:
+                line_width += space_width + word_width
+                continue
+            if line_width:
+                lines += 1
+            # Words wider than the box are broken across lines
+            extra_lines = max(math.ceil(word_width / width) - 1, 0)
+            lines += extra_lines
+            line_width = word_width - extra_lines * width
+
+    return lines
+
+
+def line_height(font_size: int) -> float:
+    """Height of one line of text in inches."""
+    return font_size * LINE_SPACING / 72
+
+
+@lru_cache(maxsize=65536)
+def paragraph_height(text: str, width: float, font_name: str, font_size: int) -> float:
+    """Estimate the height in inches of a paragraph, with the space before it."""
+    lines = count_wrapped_lines(text, width, font_name, font_size)
+    return (lines + PARAGRAPH_SPACING) * line_height(font_size)
+
+
+def paginate_paragraphs(
+    paragraphs: List[Tuple[str, str, int]],
+    width: float = CONTENT_WIDTH,
+    height: float = CONTENT_HEIGHT,
+) -> List[Tuple[int, int]]:
+    """
+    Split paragraphs into pages that fit a bulleted text placeholder.
+
+    Args:
+    paragraphs (List[Tuple[str, str, int]]): Text, font name and font size.
+    width (float): Placeholder width in inches.
+    height (float): Placeholder height in inches.
+
+    Returns:
+    List[Tuple[int, int]]: Start and stop indices of the paragraphs on each page.
+    """
+    text_width = width - 2 * CELL_MARGIN_X - BULLET_INDENT
+    heights = [
+        paragraph_height(text, text_width, font_name, font_size)
+        for text, font_name, font_size in paragraphs
+    ]
+
+    return pack_rows(heights, height - 2 * CELL_MARGIN_Y) or [(0, 0)]
+
+
+def format_count(
+    value: int, ci: Optional[Tuple[int, int]] = None, lower_bound: bool = False
+) -> str:
+    """Format a count, marking estimates with "~" and their interval."""
+    if lower_bound:
+        return f"≥{value:,}"
+    if ci is None:
+        return str(value)
+
+    return f"~{value:,} ({ci[0]:,}-{ci[1]:,})"
+
+
+def metadata_row_values(column_meta: ColumnMeta, view: str) -> List[str]:
+    """Get the cell values of a metadata table row for the given view."""
+    is_estimate = column_meta.is_estimate
+    values = [
+        column_meta.column,
+        column_meta.type,
+        format_count(
+            column_meta.non_null_count,
+            column_meta.non_null_count_ci if is_estimate else None,
+        ),
+    ]
+    if view == "detailed":
+        values += [
+            format_count(
+                column_meta.null_count,
+                column_meta.null_count_ci if is_estimate else None,
+            ),
+            format_count(
+                column_meta.unique_values,
+                column_meta.unique_values_ci if is_estimate else None,
+                is_estimate and column_meta.unique_values_lower_bound,
+            ),
+        ]
+
+    return values
+
+
+def plan_column_widths(
+    headers: List[str],
+    rows: List[List[str]],
+    font_name: str,
+    font_size: int,
+    header_font_size: int,
+    table_width: float = TABLE_WIDTH,
+) -> List[float]:
+    """Split the table width across columns in proportion to their content."""
+    natural_widths = []
+    for j, header in enumerate(headers):
+        widest = max(
+            [measure_text_width(header, font_name, header_font_size)]
+            + [measure_text_width(row[j], font_name, font_size) for row in rows]
+        )
+        natural_widths.append(
+            min(widest + 2 * CELL_MARGIN_X, table_width * MAX_COLUMN_SHARE)
+        )
+
+    scale = table_width / sum(natural_widths)
+    return [width * scale for width in natural_widths]
+
+
+def row_height(
+    values: List[str], column_widths: List[float], font_name: str, font_size: int
+) -> float:
+    """Estimate the height in inches of a table row."""
+    lines = max(
+        count_wrapped_lines(value, width - 2 * CELL_MARGIN_X, font_name, font_size)
+        for value, width in zip(values, column_widths)
+    )
+    return lines * line_height(font_size) + 2 * CELL_MARGIN_Y
+
+
+def pack_rows(
+    row_heights: List[float], available_height: float
+) -> List[Tuple[int, int]]:
+    """Greedily pack rows into slides without exceeding the available height."""
+    chunks = []
+    start = 0
+    used = 0.0
+    for i, height in enumerate(row_heights):
+        if i > start and used + height > available_height:
+            chunks.append((start, i))
+            start = i
+            used = 0.0
+        used += height
+
+    if start < len(row_heights):
+        chunks.append((start, len(row_heights)))
+
+    return chunks
+
+
+def plan_view(
+    columns_meta: ColumnsMeta,
+    view: str,
+    font_name: str = "Arial",
+    font_size: int = 10,
+    header_font_size: int = 14,
+) -> LayoutPlan:
+    """Plan the metadata table slides for a single view."""
+    headers = DETAILED_HEADERS if view == "detailed" else CONSOLIDATED_HEADERS
+    rows = [metadata_row_values(col, view) for col in columns_meta.columns]
+
+    column_widths = plan_column_widths(
+        headers, rows, font_name, font_size, header_font_size
+    )
+    header_height = row_height(headers, column_widths, font_name, header_font_size)
+    row_heights = [
+        row_height(values, column_widths, font_name, font_size) for values in rows
+    ]
+
+    return LayoutPlan(
+        view=view,
+        headers=headers,
+        column_widths=column_widths,
+        font_name=font_name,
+        font_size=font_size,
+        header_font_size=header_font_size,
+        row_heights=row_heights,
+        header_height=header_height,
+        chunks=pack_rows(row_heights, TABLE_HEIGHT - header_height),
+    )
+
+
+def plan_metadata_layout(
+    columns_meta: ColumnsMeta,
+    font_name: str = "Arial",
+    font_size: int = 10,
+    header_font_size: int = 14,
+    view: Optional[str] = None,
+) -> LayoutPlan:
+    """
+    Plan the metadata table slides.
+
+    The detailed view is used when every column fits on a single slide,
+    otherwise the consolidated view is packed across as few slides as fit.
+    """
+    if view is not None:
+        return plan_view(columns_meta, view, font_name, font_size, header_font_size)
+
+    detailed = plan_view(
+        columns_meta, "detailed", font_name, font_size, header_font_size
+    )
+    if detailed.slide_count <= 1:
+        return detailed
+
+    return plan_view(
+        columns_meta, "consolidated", font_name, font_size, header_font_size
+    )
+
+
+def omitted_columns_text(omitted_columns: int) -> str:
+    """Get the note on the last table slide about the columns left out."""
+    return f"{omitted_columns:,} column{'s' if omitted_columns != 1 else ''} omitted"
+
+
+def cap_table_slides(layout_plan: LayoutPlan, max_table_slides: int) -> LayoutPlan:
+    """
+    Keep the first table slides of a plan, and note the columns left out.
+
+    The note takes a last row on the last slide kept, so columns are moved
+    off that slide until the row fits.
+    """
+    if max_table_slides < 1:
+        raise ValueError("At least one table slide must be kept.")
+    if layout_plan.slide_count <= max_table_slides:
+        return layout_plan
+
+    column_count = layout_plan.chunks[-1][1]
+    chunks = layout_plan.chunks[:max_table_slides]
+    omitted_height = row_height(
+        [omitted_columns_text(column_count)],
+        [sum(layout_plan.column_widths)],
+        layout_plan.font_name,
+        layout_plan.font_size,
+    )
+    start, stop = chunks[-1]
+    available = TABLE_HEIGHT - layout_plan.header_height - omitted_height
+    while stop > start + 1 and sum(layout_plan.row_heights[start:stop]) > available:
+        stop -= 1
+    chunks[-1] = (start, stop)
+
+    return layout_plan.model_copy(
+        update={
+            "chunks": chunks,
+            "omitted_columns": column_count - stop,
+            "omitted_height": omitted_height,
+        }
+    )
+
+
+def estimate_deck_bytes(layout_plan: LayoutPlan) -> int:
+    """Estimate the file size of a deck with a title, overview and table slides."""
+    table_rows = sum(stop - start for start, stop in layout_plan.chunks)
+    cells = (table_rows + layout_plan.slide_count) * len(layout_plan.headers)
+    return (
+        BASE_PPTX_BYTES
+        + TITLE_SLIDE_BYTES
+        + OVERVIEW_SLIDE_BYTES
+        + TABLE_SLIDE_BYTES * layout_plan.slide_count
+        + TABLE_CELL_BYTES * cells
+    )
+
+
+def plan_deck(
+    columns_meta: ColumnsMeta,
+    row_count: int,
+    layout_plan: Optional[LayoutPlan] = None,
+    max_table_slides: Optional[int] = None,
+) -> DeckPlan:
+    """Summarize the deck that would be built, without building it."""
+    layout_plan = layout_plan or plan_metadata_layout(columns_meta)
+    if max_table_slides is not None:
+        layout_plan = cap_table_slides(layout_plan, max_table_slides)
+
+    return DeckPlan(
+        row_count=row_count,
+        column_count=len(columns_meta.columns),
+        layout=layout_plan,
+        slide_count=layout_plan.slide_count + 2,  # Title and overview slides
+        estimated_bytes=estimate_deck_bytes(layout_plan),
+    )
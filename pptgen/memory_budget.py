@@ -0,0 +1,201 @@
+"""Plan how to process a CSV file within a memory budget."""
+
+import os
+import threading
+from pathlib import Path
+from typing import IO, Dict, List, Optional
+
+import pandas as pd
+
+from pptgen.compute import (
+    ChunkedBackend,
+    ColumnPrunedBackend,
+    ComputeBackend,
+    PandasBackend,
+)
+from pptgen.compute.out_of_core import SKETCH_BYTES
+from pptgen.model.memory_plan import MemoryPlan
+
+SAMPLE_ROWS = 10_000  # Rows read to estimate the bytes per row
+PARSE_OVERHEAD = 2.0  # read_csv peaks at about twice the frame it returns
+CHUNK_BUDGET_SHARE = 0.25  # Share of the budget for one chunk, the rest for totals
+MIN_CHUNK_ROWS = 1_000
+SAMPLE_INTERVAL = 0.01  # Seconds between resident memory samples
+PAGE_BYTES = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+class LineReader:
+    """
+    Feed a binary file to read_csv one line at a time, counting the bytes read.
+
+    read_csv then stops reading at the end of the rows it was asked for, even
+    when quoted fields hold newlines, so the count is the bytes those rows take.
+    """
+
+    def __init__(self, f: IO[bytes]) -> None:
+        self.f = f
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        """Read the next line, whatever the size asked for."""
+        line = self.f.readline()
+        self.bytes_read += len(line)
+        return line
+
+    def __iter__(self) -> "LineReader":
+        return self
+
+    def __next__(self) -> bytes:
+        line = self.read()
+        if not line:
+            raise StopIteration
+        return line
+
+
+def group_columns(
+    column_bytes: Dict[str, int], limit: float
+) -> Optional[List[List[str]]]:
+    """Group consecutive columns whose estimated bytes fit together under a limit."""
+    groups: List[List[str]] = []
+    group_bytes = 0
+    for col, col_bytes in column_bytes.items():
+        if col_bytes > limit:
+            return None
+        if not groups or group_bytes + col_bytes > limit:
+            groups.append([])
+            group_bytes = 0
+        groups[-1].append(col)
+        group_bytes += col_bytes
+
+    return groups
+
+
+def plan_memory(
+    csv_data_path: Path, budget_bytes: int, sample_rows: int = SAMPLE_ROWS
+) -> MemoryPlan:
+    """
+    Estimate the in-memory footprint of a CSV file and choose how to process it.
+
+    The footprint is extrapolated from the file size and the first rows. The
+    file is read whole when it fits the budget. Otherwise it is read a group
+    of columns at a time, or streamed in chunks of rows when even single
+    columns do not fit.
+
+    Args:
+    csv_data_path (Path): Path to the CSV file.
+    budget_bytes (int): Memory budget in bytes.
+    sample_rows (int): Rows read to estimate the bytes per row.
+
+    Returns:
+    MemoryPlan: The footprint estimate and the processing mode.
+    """
+    file_bytes = os.path.getsize(csv_data_path)
+    with open(csv_data_path, "rb") as f:
+        reader = LineReader(f)
+        sample = pd.read_csv(reader, nrows=sample_rows)
+
+    if len(sample) < sample_rows or reader.bytes_read >= file_bytes:
+        estimated_rows = len(sample)  # The whole file was sampled
+    else:
+        estimated_rows = round(file_bytes / reader.bytes_read * len(sample))
+
+    bytes_per_row = sample.memory_usage(deep=True, index=False) / max(len(sample), 1)
+    column_bytes = {
+        col: round(col_bytes * estimated_rows)
+        for col, col_bytes in bytes_per_row.items()
+    }
+    estimated_bytes = round(sum(column_bytes.values()) * PARSE_OVERHEAD)
+
+    plan = MemoryPlan(
+        file_bytes=file_bytes,
+        estimated_rows=estimated_rows,
+        column_bytes=column_bytes,
+        estimated_bytes=estimated_bytes,
+        budget_bytes=budget_bytes,
+        mode="in_memory",
+    )
+    if estimated_bytes <= budget_bytes:
+        return plan
+
+    column_groups = group_columns(column_bytes, budget_bytes / PARSE_OVERHEAD)
+    if column_groups is not None:
+        plan.mode = "column_pruned"
+        plan.column_groups = column_groups
+    else:
+        plan.mode = "chunked"
+        # The distinct sketches are kept for the whole pass, chunks come and go
+        plan.distinct_bytes = SKETCH_BYTES * len(column_bytes)
+        chunk_bytes = (
+            max(budget_bytes - plan.distinct_bytes, 0)
+            * CHUNK_BUDGET_SHARE
+            / PARSE_OVERHEAD
+        )
+        row_bytes = max(bytes_per_row.sum(), 1)  # Header-only samples have none
+        plan.chunk_rows = max(int(chunk_bytes / row_bytes), MIN_CHUNK_ROWS)
+
+    return plan
+
+
+def backend_for_plan(plan: MemoryPlan) -> ComputeBackend:
+    """Get the compute backend for the processing mode of a plan."""
+    if plan.mode == "column_pruned":
+        return ColumnPrunedBackend(plan.column_groups)
+    if plan.mode == "chunked":
+        return ChunkedBackend(plan.chunk_rows)
+
+    return PandasBackend()
+
+
+def current_rss_bytes() -> Optional[int]:
+    """Get the resident memory of this process, if /proc reports it."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * PAGE_BYTES
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+class PeakMemoryMonitor:
+    """
+    Track the peak resident memory of a run on a sampling thread.
+
+    Unlike ru_maxrss, the peak over the whole life of the process, the peak
+    only covers the run from start to stop. Spikes shorter than the sampling
+    interval may be missed. Where /proc is not available, no peak is reported.
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL) -> None:
+        self.interval = interval
+        self.start_bytes: Optional[int] = None
+        self.peak_bytes: Optional[int] = None
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def sample(self) -> None:
+        """Sample the resident memory, keeping the peak."""
+        rss = current_rss_bytes()
+        if rss is not None and (self.peak_bytes is None or rss > self.peak_bytes):
+            self.peak_bytes = rss
+
+    def run(self) -> None:
+        """Sample until stopped."""
+        while not self._stopped.wait(self.interval):
+            self.sample()
+
+    def start(self) -> "PeakMemoryMonitor":
+        """Start sampling on a daemon thread."""
+        self.start_bytes = self.peak_bytes = current_rss_bytes()
+        if self.start_bytes is not None:
+            self._thread = threading.Thread(target=self.run, daemon=True)
+            self._thread.start()
+
+        return self
+
+    def stop(self) -> Optional[int]:
+        """Stop sampling and get the peak resident memory of the run."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.sample()
+
+        return self.peak_bytes
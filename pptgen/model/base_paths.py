@@ -1,14 +1,21 @@
 """Base Model for the basic paths."""
 
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 from pydantic import BaseModel, computed_field
 
+from pptgen.image_index import get_image_index
 
+
+@lru_cache(maxsize=None)
 def find_project_root(current_path: Path = Path.cwd()) -> Path:
     """
     Recursively search for a pyproject.toml file to determine the project root.
 
+    Results are memoized per starting path.
+
     Args:
     current_path (Path): The path to start searching from. Defaults to the current working directory.
 
@@ -30,6 +37,8 @@ def find_project_root(current_path: Path = Path.cwd()) -> Path:
 class BasePaths(BaseModel):
     """BaseModel for the basic paths."""
 
+    image_index_file: Optional[Path] = None  # Persist the image index as JSON
+
     @computed_field  # type: ignore
     @property
     def data_path(self) -> Path:
@@ -50,16 +59,15 @@ class BasePaths(BaseModel):
 
     def find_image(self, file_name: str) -> str:
         """Find the image path."""
-        extensions = ["*.png", "*.jpg", "*.jpeg"]
-        # Get the list of all files in the image directory
-        image_files = [f for ext in extensions for f in self.image_path.rglob(ext)]
+        image_index = get_image_index(self.image_path, self.image_index_file)
 
-        if not image_files:
+        if not image_index.files:
             raise FileNotFoundError("No images found in the image directory")
 
-        # Find the file name in the list of files
-        for image_file in image_files:
-            if image_file.name == file_name or file_name in image_file.name:
-                return str(image_file.resolve())
+        image_file = image_index.find(file_name)
+        if image_file is None:
+            raise FileNotFoundError(
+                f"Could not find {file_name} in the image directory."
+            )
 
-        raise FileNotFoundError(f"Could not find {file_name} in the image directory.")
+        return str(image_file)
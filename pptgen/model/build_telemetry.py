@@ -0,0 +1,45 @@
+"""Pydantic Model for the telemetry of a deck build."""
+
+from typing import Dict, Optional
+
+from pydantic import BaseModel
+
+from pptgen.model.memory_plan import format_bytes
+
+
+class BuildTelemetry(BaseModel):
+    """Sizes and timings of a written deck, read from its zip directory."""
+
+    file_name: str
+    file_bytes: int
+    content_hash: str  # SHA-256 of the file, stable for deterministic builds
+    slide_count: int
+    media_count: int
+    media_bytes: int  # Uncompressed
+    xml_bytes: int  # Uncompressed, relationships included
+    part_bytes: Dict[str, int]  # Uncompressed size of each XML part
+    build_seconds: Optional[float] = None  # Adding the slides
+    serialize_seconds: Optional[float] = None  # Saving the presentation
+    package_seconds: Optional[float] = None  # Repacking the saved file
+    patch_seconds: Optional[float] = None  # Patching slides into the saved deck
+    input_rows: Optional[int] = None
+    input_columns: Optional[int] = None
+
+    def timing_summary(self) -> str:
+        """Summarize how long the deck took to write."""
+        if self.patch_seconds is not None:
+            return f"patched in {self.patch_seconds:.2f}s"
+        if self.serialize_seconds is not None:
+            return f"serialized in {self.serialize_seconds:.2f}s"
+
+        return "written"
+
+    def summary(self) -> str:
+        """Summarize the telemetry in one line."""
+        return (
+            f"Deck of {self.slide_count} slides, {format_bytes(self.file_bytes)} "
+            f"({self.media_count} media, {format_bytes(self.media_bytes)}; "
+            f"XML {format_bytes(self.xml_bytes)}), "
+            f"{self.timing_summary()}, "
+            f"sha256 {self.content_hash[:12]}"
+        )
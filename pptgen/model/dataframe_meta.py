@@ -1,6 +1,6 @@
 """Pydantic Models for DataFrame Column Metadata."""
 
-from typing import List
+from typing import List, Optional, Tuple
 
 from pydantic import BaseModel
 
@@ -11,6 +11,13 @@ class ColumnMeta(BaseModel):
     non_null_count: int
     null_count: int
     unique_values: int
+    # Set when any count is estimated, with 95% intervals on the estimated ones
+    is_estimate: bool = False
+    non_null_count_ci: Optional[Tuple[int, int]] = None
+    null_count_ci: Optional[Tuple[int, int]] = None
+    unique_values_ci: Optional[Tuple[int, int]] = None
+    # Set when unique_values counts the values seen, and the file may hold more
+    unique_values_lower_bound: bool = False
 
 
 class ColumnsMeta(BaseModel):
@@ -0,0 +1,38 @@
+"""Pydantic Model for a sample of a large CSV file."""
+
+from typing import Dict, Literal, Optional, Tuple
+
+import pandas as pd
+from pydantic import BaseModel
+
+
+class DataFrameSample(BaseModel):
+    """
+    Rows and per-block aggregates sampled from randomly placed blocks of a CSV file.
+
+    The aggregates hold one row per block read, so totals over the whole file
+    can be estimated by cluster sampling. The rows are a uniform (reservoir)
+    or year-stratified subsample of the rows read.
+    """
+
+    df: pd.DataFrame
+    strategy: Literal["reservoir", "stratified"]
+    block_rows: pd.Series
+    block_null_counts: pd.DataFrame  # Blocks by columns
+    block_year_counts: Optional[pd.DataFrame] = None  # Blocks by years
+    block_daily_counts: Optional[pd.DataFrame] = None  # "block", "date", "count"
+    year_column: Optional[str] = None
+    unique_read: Dict[str, int] = {}  # Distinct values in every block read
+    unique_read_ci: Dict[str, Tuple[int, int]] = {}  # 95% intervals where sketched
+    total_blocks: int
+    bytes_read: int
+    file_bytes: int
+    elapsed: float  # Seconds spent reading
+
+    @property
+    def exhaustive(self) -> bool:
+        """Whether every block of the file was read."""
+        return len(self.block_rows) >= self.total_blocks
+
+    class Config:
+        arbitrary_types_allowed = True
@@ -0,0 +1,92 @@
+"""Pydantic Models for the aggregates computed once per input and shared by sinks."""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+from pydantic import BaseModel
+
+from pptgen.model.dataframe_meta import ColumnsMeta
+
+
+def json_label(label: Any) -> Any:
+    """Convert a date or numpy label to a JSON-safe value."""
+    if hasattr(label, "isoformat"):
+        return label.isoformat()
+    if hasattr(label, "item"):
+        label = label.item()
+    if isinstance(label, float) and label.is_integer():
+        return int(label)
+
+    return label
+
+
+def count_records(counts: pd.DataFrame, label: str) -> List[Dict[str, Any]]:
+    """Convert a count table to JSON-safe records, keyed by the label column."""
+    records = []
+    for key, row in counts.iterrows():
+        record = {label: json_label(key)}
+        for col, value in row.items():
+            record[col] = round(float(value)) if pd.notna(value) else None
+        records.append(record)
+
+    return records
+
+
+class OverviewAggregates(BaseModel):
+    """Row counts, year counts and the counts over time behind the overview slide."""
+
+    company_name: str
+    row_count: int
+    row_count_ci: Optional[Tuple[int, int]] = None  # 95% interval for previews
+    sampled_rows: Optional[int] = None  # Rows sampled for previews
+    year_column: Optional[str] = None
+    year_counts: Optional[pd.DataFrame] = None  # "count", "lower" and "upper"
+    time_counts: pd.DataFrame  # Every bucket: "date", 0 (count), "lower", "upper"
+    chart_counts: pd.DataFrame  # The plotted series, downsampled for the chart
+    granularity: str
+    chart_png: bytes  # The counts over time, rendered once
+
+    @property
+    def is_estimate(self) -> bool:
+        """Whether the counts are estimated from a sample."""
+        return self.sampled_rows is not None
+
+    class Config:
+        arbitrary_types_allowed = True
+
+
+class DeckAggregates(BaseModel):
+    """
+    Everything the output sinks need, computed from one pass over the input.
+
+    The overview and column metadata are None when only slides that do not
+    show them are patched.
+    """
+
+    title: str
+    subtitle: str
+    overview: Optional[OverviewAggregates] = None
+    columns_meta: Optional[ColumnsMeta] = None
+
+    def summary(self) -> Dict[str, Any]:
+        """Get the aggregates as JSON-safe data."""
+        overview = self.overview
+        year_counts = overview.year_counts
+        time_counts = overview.time_counts.rename(columns={0: "count"})
+
+        return {
+            "title": self.title,
+            "subtitle": self.subtitle,
+            "company_name": overview.company_name,
+            "is_estimate": overview.is_estimate,
+            "row_count": overview.row_count,
+            "row_count_ci": overview.row_count_ci,
+            "sampled_rows": overview.sampled_rows,
+            "year_column": overview.year_column,
+            "year_counts": (
+                count_records(year_counts, "year") if year_counts is not None else None
+            ),
+            "granularity": overview.granularity,
+            "time_counts": count_records(time_counts.set_index("date"), "date"),
+            "columns": self.columns_meta.model_dump()["columns"],
+        }
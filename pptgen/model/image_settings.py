@@ -0,0 +1,15 @@
+"""Pydantic Model for the image ingestion settings."""
+
+from pathlib import Path
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+class ImageSettings(BaseModel):
+    """Settings for resizing and recompressing images before they are placed."""
+
+    dpi: int = Field(150, gt=0)
+    image_format: Literal["auto", "PNG", "JPEG"] = "auto"
+    jpeg_quality: int = Field(85, ge=1, le=95)
+    cache_dir: Optional[Path] = None  # Persist processed images across processes
@@ -0,0 +1,37 @@
+"""Pydantic Models for the metadata slide layout plan."""
+
+from typing import List, Literal, Tuple
+
+from pydantic import BaseModel, computed_field
+
+
+class LayoutPlan(BaseModel):
+    """Layout plan for the metadata table slides."""
+
+    view: Literal["detailed", "consolidated"]
+    headers: List[str]
+    column_widths: List[float]  # Inches
+    font_name: str
+    font_size: int
+    header_font_size: int
+    row_heights: List[float]  # Inches, one per metadata row
+    header_height: float  # Inches
+    chunks: List[Tuple[int, int]]  # (start, stop) column indices per slide
+    omitted_columns: int = 0  # Columns left out by a cap on the slide count
+    omitted_height: float = 0.0  # Inches, of the row noting the omitted columns
+
+    @computed_field  # type: ignore
+    @property
+    def slide_count(self) -> int:
+        """Number of table slides."""
+        return len(self.chunks)
+
+
+class DeckPlan(BaseModel):
+    """Dry-run summary of a deck before it is built."""
+
+    row_count: int
+    column_count: int
+    layout: LayoutPlan
+    slide_count: int
+    estimated_bytes: int
@@ -0,0 +1,53 @@
+"""Pydantic Model for the memory plan of a CSV file."""
+
+from typing import Dict, List, Literal, Optional
+
+from pydantic import BaseModel
+
+
+def format_bytes(value: float) -> str:
+    """Format a byte count with a binary unit."""
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if value < 1024:
+            return f"{value:,.1f} {unit}"
+        value /= 1024
+
+    return f"{value:,.1f} TiB"
+
+
+class MemoryPlan(BaseModel):
+    """Estimated in-memory footprint of a CSV file and the processing mode chosen."""
+
+    file_bytes: int
+    estimated_rows: int
+    column_bytes: Dict[str, int]  # Estimated in-memory bytes per column
+    estimated_bytes: int  # Estimated peak while reading the whole file
+    budget_bytes: int
+    mode: Literal["in_memory", "column_pruned", "chunked"]
+    column_groups: List[List[str]] = []  # Columns read together when pruned
+    chunk_rows: Optional[int] = None  # Rows per chunk when chunked
+    distinct_bytes: int = 0  # Distinct value sketches kept across chunks
+    start_rss_bytes: Optional[int] = None  # Resident memory when the run started
+    peak_rss_bytes: Optional[int] = None  # Peak resident memory during the run
+
+    def summary(self) -> str:
+        """Summarize the plan in one line."""
+        summary = (
+            f"Memory mode: {self.mode} (estimated {format_bytes(self.estimated_bytes)} "
+            f"for a budget of {format_bytes(self.budget_bytes)}"
+        )
+        if self.mode == "column_pruned":
+            summary += f", {len(self.column_groups)} column groups"
+        elif self.mode == "chunked":
+            summary += (
+                f", {self.chunk_rows:,} rows per chunk, "
+                f"{format_bytes(self.distinct_bytes)} of distinct sketches"
+            )
+        if self.peak_rss_bytes is not None and self.start_rss_bytes is not None:
+            summary += (
+                f", peak {format_bytes(self.peak_rss_bytes)}, "
+                f"{format_bytes(self.peak_rss_bytes - self.start_rss_bytes)} "
+                "above the start"
+            )
+
+        return summary + ")"
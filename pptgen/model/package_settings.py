@@ -0,0 +1,42 @@
+"""Pydantic Models for the PPTX packaging stage."""
+
+from datetime import datetime
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class PackageSettings(BaseModel):
+    """Settings for repacking the PPTX zip after the presentation is saved."""
+
+    compression_level: int = Field(6, ge=0, le=9)  # 0 stores every part
+    store_media: bool = True  # Store media that deflate does not shrink
+    dedupe_media: bool = True  # Keep one copy of identical media parts
+    strip_unused: bool = True  # Drop slide layouts and parts no slide uses
+    # Same bytes for the same deck: fixed timestamps, entry order and core properties
+    deterministic: bool = False
+    build_date: datetime = datetime(1980, 1, 1)  # Timestamp of deterministic output
+
+
+class PackageReport(BaseModel):
+    """Sizes and timings of a packaged PPTX file."""
+
+    input_bytes: int
+    output_bytes: int
+    media_deduplicated: int
+    parts_removed: List[str]
+    save_seconds: float = 0.0
+    package_seconds: float
+    content_hash: str  # SHA-256 of the packaged file
+
+    def summary(self) -> str:
+        """Summarize the report in one line."""
+        saved = self.input_bytes - self.output_bytes
+        return (
+            f"Packaged {self.output_bytes:,} bytes ({saved:,} saved, "
+            f"{self.media_deduplicated} duplicate media, "
+            f"{len(self.parts_removed)} unused parts removed) "
+            f"in {self.save_seconds + self.package_seconds:.2f}s "
+            f"(save {self.save_seconds:.2f}s, package {self.package_seconds:.2f}s), "
+            f"sha256 {self.content_hash[:12]}"
+        )
@@ -0,0 +1,25 @@
+"""Pydantic Model for the report of a patched deck."""
+
+from typing import List
+
+from pydantic import BaseModel
+
+
+class PatchReport(BaseModel):
+    """Slides replaced and zip entries touched when patching a deck."""
+
+    patched_tags: List[str]
+    slide_count: int
+    parts_written: int  # Slides, relationships and media written anew
+    parts_copied: int  # Entries copied through without inflating them
+    parts_removed: List[str]  # Media no slide uses after the patch
+    patch_seconds: float
+
+    def summary(self) -> str:
+        """Summarize the report in one line."""
+        return (
+            f"Patched {len(self.patched_tags)} of {self.slide_count} slides "
+            f"({', '.join(self.patched_tags)}) in {self.patch_seconds:.2f}s "
+            f"({self.parts_written} parts written, {self.parts_copied} copied, "
+            f"{len(self.parts_removed)} removed)"
+        )
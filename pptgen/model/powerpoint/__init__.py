@@ -1,6 +1,12 @@
 from pptgen.model.powerpoint.color_themes import ColorTheme, ThemeColorScheme
 from pptgen.model.powerpoint.common import BulletPoint, BulletPoints
 from pptgen.model.powerpoint.content_slide import ContentSlide
+from pptgen.model.powerpoint.deck_spec import (
+    ContentSlideSpec,
+    DeckSpec,
+    ImageSlideSpec,
+    TitleSlideSpec,
+)
 from pptgen.model.powerpoint.image_slide import ImageSlide
 from pptgen.model.powerpoint.title_slide import TitleSlide
 
@@ -12,4 +18,8 @@ __all__ = [
     "BulletPoints",
     "ThemeColorScheme",
     "ColorTheme",
+    "DeckSpec",
+    "TitleSlideSpec",
+    "ContentSlideSpec",
+    "ImageSlideSpec",
 ]
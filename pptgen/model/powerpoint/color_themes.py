@@ -1,7 +1,7 @@
 from enum import Enum
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple, Type
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 
 class ColorTheme(str, Enum):
@@ -29,19 +29,32 @@ class ColorMixin(BaseModel):
     secondary_gradient: Optional[Tuple[str, str]] = None  # TODO - remove
     background_gradient: Optional[Tuple[str, str]] = None
 
+    _color_overrides: Dict[Type[BaseModel], Dict[str, Any]] = PrivateAttr(
+        default_factory=dict
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._color_overrides = {}
+
+    def color_overrides(self, slide_class: Type[BaseModel]) -> Dict[str, Any]:
+        """Resolve the color settings for a slide model class, once per class."""
+        overrides = self._color_overrides.get(slide_class)
+        if overrides is None:
+            overrides = {
+                field: value
+                for field, value in self.model_dump(exclude_unset=True).items()
+                if value is not None and field in slide_class.model_fields
+            }
+            self._color_overrides[slide_class] = overrides
+
+        return overrides
+
     def apply_colors(self, slide_model: BaseModel) -> None:
         """Apply color settings to a slide model."""
-        for field, value in self.dict(exclude_unset=True).items():
-            if value is not None and hasattr(slide_model, field):
-                setattr(slide_model, field, value)
-
-        # Apply solid colors to title, subtitle, and content
-        if self.title_color and hasattr(slide_model, "title_color"):
-            slide_model.title_color = self.title_color
-        if self.subtitle_color and hasattr(slide_model, "subtitle_color"):
-            slide_model.subtitle_color = self.subtitle_color
-        if self.content_color and hasattr(slide_model, "content_color"):
-            slide_model.content_color = self.content_color
+        for field, value in self.color_overrides(type(slide_model)).items():
+            setattr(slide_model, field, value)
 
 
 class ThemeColorScheme(ColorMixin):
@@ -0,0 +1,41 @@
+"""Pydantic Models for a declarative deck specification."""
+
+from typing import Annotated, List, Literal, Union
+
+from pydantic import BaseModel, Field
+
+from pptgen.model.powerpoint.color_themes import ColorTheme
+from pptgen.model.powerpoint.content_slide import ContentSlide
+from pptgen.model.powerpoint.image_slide import ImageSlide
+from pptgen.model.powerpoint.title_slide import TitleSlide
+
+
+class TitleSlideSpec(TitleSlide):
+    """Title slide entry of a deck specification."""
+
+    type: Literal["title"] = "title"
+
+
+class ContentSlideSpec(ContentSlide):
+    """Content slide entry of a deck specification."""
+
+    type: Literal["content"] = "content"
+
+
+class ImageSlideSpec(ImageSlide):
+    """Image slide entry of a deck specification."""
+
+    type: Literal["image"] = "image"
+
+
+SlideSpec = Annotated[
+    Union[TitleSlideSpec, ContentSlideSpec, ImageSlideSpec],
+    Field(discriminator="type"),
+]
+
+
+class DeckSpec(BaseModel):
+    """BaseModel for a deck specification: a theme and its slides."""
+
+    theme: ColorTheme
+    slides: List[SlideSpec]
@@ -2,12 +2,14 @@
 
 import io
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 from pptx.presentation import Presentation
 from pydantic import computed_field
 
 from pptgen.model.base_paths import BasePaths
+from pptgen.model.build_telemetry import BuildTelemetry
+from pptgen.model.package_settings import PackageReport, PackageSettings
 
 
 class PPTXModel(BasePaths):
@@ -15,6 +17,14 @@ class PPTXModel(BasePaths):
 
     file_name: str
     pptx_raw: Union[bytes, io.BytesIO, Presentation]
+    package_settings: Optional[PackageSettings] = None
+    package_report: Optional[PackageReport] = None
+    # Build telemetry, collected when the file is written
+    input_rows: Optional[int] = None
+    input_columns: Optional[int] = None
+    build_seconds: Optional[float] = None
+    telemetry_sidecar: bool = False  # Also write the telemetry as JSON
+    build_telemetry: Optional[BuildTelemetry] = None  # Set by deck_writer
 
     @computed_field
     @property
@@ -22,17 +32,53 @@ class PPTXModel(BasePaths):
         """Get pptx file."""
         return self.output_path.joinpath(self.file_name).with_suffix(".pptx")
 
+    @computed_field
+    @property
+    def telemetry_file(self) -> Path:
+        """Get the JSON sidecar file of the build telemetry."""
+        return self.pptx_file.with_suffix(".telemetry.json")
+
     @computed_field
     @property
     def pptx(self) -> bytes:
         """Get pptx."""
         return self.save_pptx_to_bytesio(self.pptx_raw).getvalue()
 
-    def write_pptx(self) -> None:
-        """Write pptx."""
-        # Save the file
+    def write_pptx(self, pptx_bytes: Optional[bytes] = None) -> None:
+        """
+        Write pptx.
+
+        Deterministic packages are not rewritten when the same bytes are
+        already saved, which keeps the modification time of the file.
+        """
+        pptx_bytes = self.pptx if pptx_bytes is None else pptx_bytes
+        deterministic = (
+            self.package_settings is not None and self.package_settings.deterministic
+        )
+        if deterministic and self.is_saved(pptx_bytes):
+            print(f"Output file unchanged: {self.pptx_file}")
+            return
+
         with open(str(self.pptx_file), "wb") as f:
-            f.write(self.pptx)
+            f.write(pptx_bytes)
+
+    def is_saved(self, pptx_bytes: bytes) -> bool:
+        """Check whether the pptx file already holds these bytes."""
+        if not self.pptx_file.exists() or self.pptx_file.stat().st_size != len(
+            pptx_bytes
+        ):
+            return False
+
+        return self.pptx_file.read_bytes() == pptx_bytes
+
+    def write_telemetry(self) -> Path:
+        """Write the build telemetry as a JSON sidecar next to the pptx file."""
+        if self.build_telemetry is None:
+            raise ValueError("No build telemetry, write the pptx file first.")
+
+        self.telemetry_file.write_text(self.build_telemetry.model_dump_json(indent=2))
+
+        return self.telemetry_file
 
     def save_pptx_to_bytesio(self, prs: Union[io.BytesIO, Presentation]) -> io.BytesIO:
         if isinstance(prs, io.BytesIO):
@@ -50,6 +96,8 @@ class PPTXModel(BasePaths):
             raise FileNotFoundError(f"Output file not found: {self.pptx_file}")
 
         print(f"Output file created: {self.pptx_file}")
+        if self.build_telemetry is not None:
+            print(self.build_telemetry.summary())
 
     class Config:
         arbitrary_types_allowed = True
@@ -0,0 +1,12 @@
+"""Pydantic Model for the columns of a DataFrame placed in shared memory."""
+
+from pydantic import BaseModel
+
+
+class SharedColumn(BaseModel):
+    """A column's buffer within a shared memory block."""
+
+    column: str
+    dtype: str  # numpy dtype string, e.g. "<f8"
+    length: int
+    offset: int  # Byte offset of the buffer in the block
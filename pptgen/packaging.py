@@ -0,0 +1,334 @@
+"""Repack saved PPTX files with compression controls and without unused parts."""
+
+import hashlib
+import io
+import posixpath
+import time
+import zipfile
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Dict, List, Optional, Set, Tuple, Union
+
+from lxml import etree
+from pptx.presentation import Presentation
+
+from pptgen.model.package_settings import PackageReport, PackageSettings
+
+CONTENT_TYPES_PART = "[Content_Types].xml"
+CORE_PROPERTIES_PART = "docProps/core.xml"
+MEDIA_DIR = "ppt/media/"
+# Formats that deflate never shrinks, and formats worth a quick deflate trial
+STORED_EXTENSIONS = (".jpg", ".jpeg", ".wdp", ".mp4", ".m4a")
+TRIAL_EXTENSIONS = (".png", ".gif")
+MIN_DEFLATE_SAVING = 0.02  # Share of the size deflate must save on a trial
+
+ZIP_CREATE_SYSTEM = 3  # Unix, so deterministic output matches across platforms
+
+CT_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+CP_NS = "http://schemas.openxmlformats.org/package/2006/metadata/core-properties"
+DCTERMS_NS = "http://purl.org/dc/terms/"
+P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+SLIDE_LAYOUT_RELATIONSHIP = f"{R_NS}/slideLayout"
+SLIDE_MASTER_RELATIONSHIP = f"{R_NS}/slideMaster"
+
+
+def rels_part_name(part_name: str) -> str:
+    """Get the relationships part of a part, "" being the package itself."""
+    directory, name = posixpath.split(part_name)
+    return posixpath.join(directory, "_rels", f"{name}.rels")
+
+
+def source_part_name(rels_part: str) -> str:
+    """Get the part a relationships part belongs to, "" being the package itself."""
+    directory, name = posixpath.split(rels_part)
+    return posixpath.join(posixpath.dirname(directory), name[: -len(".rels")])
+
+
+def resolve_target(source: str, target: str) -> str:
+    """Resolve a relationship target to a part name."""
+    if target.startswith("/"):
+        return target[1:]
+
+    return posixpath.normpath(posixpath.join(posixpath.dirname(source), target))
+
+
+def internal_relationships(rels: etree._Element) -> List[etree._Element]:
+    """Get the relationships that point to parts of the package."""
+    return [rel for rel in rels if rel.get("TargetMode") != "External"]
+
+
+def dedupe_media(
+    parts: Dict[str, bytes], trees: Dict[str, etree._Element], modified: Set[str]
+) -> Dict[str, str]:
+    """
+    Point every relationship to one copy of each distinct media part.
+
+    Returns:
+    Dict[str, str]: The duplicate media parts and the copy that replaces them.
+    """
+    copies: Dict[str, str] = {}
+    duplicates: Dict[str, str] = {}
+    for name in sorted(parts):
+        if name.startswith(MEDIA_DIR):
+            digest = hashlib.sha256(parts[name]).hexdigest()
+            copy = copies.setdefault(digest, name)
+            if copy != name:
+                duplicates[name] = copy
+
+    for rels_part, rels in trees.items():
+        if not rels_part.endswith(".rels"):
+            continue
+        source = source_part_name(rels_part)
+        for rel in internal_relationships(rels):
+            target = resolve_target(source, rel.get("Target"))
+            if target in duplicates:
+                copy = duplicates[target]
+                rel.set(
+                    "Target", posixpath.relpath(copy, posixpath.dirname(source) or ".")
+                )
+                modified.add(rels_part)
+
+    return duplicates
+
+
+def strip_unused_layouts(
+    parts: Dict[str, bytes], trees: Dict[str, etree._Element], modified: Set[str]
+) -> None:
+    """Remove the slide layouts no slide uses from their slide masters."""
+    masters: Set[str] = set()
+    layout_users: Dict[str, Set[str]] = {}
+    for rels_part, rels in trees.items():
+        if not rels_part.endswith(".rels"):
+            continue
+        source = source_part_name(rels_part)
+        for rel in internal_relationships(rels):
+            target = resolve_target(source, rel.get("Target"))
+            if rel.get("Type") == SLIDE_MASTER_RELATIONSHIP:
+                masters.add(target)
+            elif rel.get("Type") == SLIDE_LAYOUT_RELATIONSHIP:
+                layout_users.setdefault(source, set()).add(target)
+
+    used_layouts: Set[str] = set()
+    for source, layouts in layout_users.items():
+        if source not in masters:
+            used_layouts.update(layouts)
+
+    for master in sorted(masters):
+        rels_part = rels_part_name(master)
+        layout_rels = [
+            rel
+            for rel in internal_relationships(trees[rels_part])
+            if rel.get("Type") == SLIDE_LAYOUT_RELATIONSHIP
+        ]
+        unused = [
+            rel
+            for rel in layout_rels
+            if resolve_target(master, rel.get("Target")) not in used_layouts
+        ]
+        if len(unused) == len(layout_rels):
+            unused = unused[1:]  # A slide master needs at least one layout
+        if not unused:
+            continue
+
+        unused_ids = {rel.get("Id") for rel in unused}
+        master_xml = trees.setdefault(master, etree.fromstring(parts[master]))
+        for layout_id in master_xml.iterfind(f"{{{P_NS}}}sldLayoutIdLst/*"):
+            if layout_id.get(f"{{{R_NS}}}id") in unused_ids:
+                layout_id.getparent().remove(layout_id)
+        for rel in unused:
+            rel.getparent().remove(rel)
+
+        modified.update((master, rels_part))
+
+
+def reachable_parts(trees: Dict[str, etree._Element]) -> Set[str]:
+    """Find the parts reachable through relationships from the package."""
+    reached: Set[str] = set()
+    pending = [""]
+    while pending:
+        source = pending.pop()
+        rels = trees.get(rels_part_name(source))
+        if rels is None:
+            continue
+        for rel in internal_relationships(rels):
+            target = resolve_target(source, rel.get("Target"))
+            if target not in reached:
+                reached.add(target)
+                pending.append(target)
+
+    return reached
+
+
+def remove_content_type_overrides(
+    trees: Dict[str, etree._Element], removed: Set[str], modified: Set[str]
+) -> None:
+    """Remove the content type overrides of removed parts."""
+    content_types = trees[CONTENT_TYPES_PART]
+    for override in content_types.findall(f"{{{CT_NS}}}Override"):
+        if override.get("PartName").lstrip("/") in removed:
+            content_types.remove(override)
+            modified.add(CONTENT_TYPES_PART)
+
+
+def normalize_core_properties(core: etree._Element, build_date: datetime) -> None:
+    """Set the dates and revision of the core properties to fixed values."""
+    timestamp = build_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+    for name in ("created", "modified"):
+        element = core.find(f"{{{DCTERMS_NS}}}{name}")
+        if element is not None:
+            element.text = timestamp
+
+    revision = core.find(f"{{{CP_NS}}}revision")
+    if revision is not None:
+        revision.text = "1"
+    last_printed = core.find(f"{{{CP_NS}}}lastPrinted")
+    if last_printed is not None:
+        core.remove(last_printed)
+
+
+def entry_order(info: zipfile.ZipInfo) -> Tuple[bool, str]:
+    """Order zip entries by name, with the content types first."""
+    return info.filename != CONTENT_TYPES_PART, info.filename
+
+
+def should_store(name: str, data: bytes, settings: PackageSettings) -> bool:
+    """Decide whether to store a part without deflate."""
+    if settings.compression_level == 0:
+        return True
+    if not settings.store_media:
+        return False
+
+    extension = posixpath.splitext(name)[1].lower()
+    if extension in TRIAL_EXTENSIONS:
+        # Encoders vary, some PNGs still shrink by a tenth
+        trial_bytes = len(zlib.compress(data, 1))
+        return trial_bytes > (1 - MIN_DEFLATE_SAVING) * len(data)
+
+    return extension in STORED_EXTENSIONS
+
+
+def package_pptx(
+    pptx_bytes: bytes, settings: Optional[PackageSettings] = None
+) -> Tuple[bytes, PackageReport]:
+    """
+    Repack a PPTX file with the given compression and clean-up settings.
+
+    Args:
+    pptx_bytes (bytes): The saved PPTX file.
+    settings (Optional[PackageSettings]): Compression and clean-up settings.
+
+    Returns:
+    Tuple[bytes, PackageReport]: The repacked PPTX file and its report.
+    """
+    start_time = time.perf_counter()
+    settings = settings or PackageSettings()
+
+    with zipfile.ZipFile(io.BytesIO(pptx_bytes)) as zf:
+        infos = zf.infolist()
+        parts = {info.filename: zf.read(info) for info in infos}
+
+    trees = {
+        name: etree.fromstring(data)
+        for name, data in parts.items()
+        if name.endswith(".rels") or name == CONTENT_TYPES_PART
+    }
+    modified: Set[str] = set()
+    removed: Set[str] = set()
+
+    duplicates: Dict[str, str] = {}
+    if settings.dedupe_media:
+        duplicates = dedupe_media(parts, trees, modified)
+        removed.update(duplicates)
+
+    if settings.strip_unused:
+        strip_unused_layouts(parts, trees, modified)
+        reached = reachable_parts(trees) | {""}
+        for name in parts:
+            # Relationship parts go with the part they belong to
+            part = source_part_name(name) if name.endswith(".rels") else name
+            if name != CONTENT_TYPES_PART and part not in reached:
+                removed.add(name)
+
+    remove_content_type_overrides(trees, removed, modified)
+
+    if settings.deterministic:
+        infos = sorted(infos, key=entry_order)
+        if CORE_PROPERTIES_PART in parts:
+            core = etree.fromstring(parts[CORE_PROPERTIES_PART])
+            normalize_core_properties(core, settings.build_date)
+            trees[CORE_PROPERTIES_PART] = core
+            modified.add(CORE_PROPERTIES_PART)
+
+    output = io.BytesIO()
+    with zipfile.ZipFile(output, "w") as zf:
+        for info in infos:
+            if info.filename in removed:
+                continue
+
+            data = parts[info.filename]
+            if info.filename in modified:
+                data = etree.tostring(
+                    trees[info.filename],
+                    xml_declaration=True,
+                    encoding="UTF-8",
+                    standalone=True,
+                )
+
+            if settings.deterministic:
+                zinfo = zipfile.ZipInfo(
+                    info.filename, date_time=settings.build_date.timetuple()[:6]
+                )
+                zinfo.create_system = ZIP_CREATE_SYSTEM
+            else:
+                zinfo = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+            zinfo.compress_type = (
+                zipfile.ZIP_STORED
+                if should_store(info.filename, data, settings)
+                else zipfile.ZIP_DEFLATED
+            )
+            zf.writestr(zinfo, data, compresslevel=settings.compression_level)
+
+    report = PackageReport(
+        input_bytes=len(pptx_bytes),
+        output_bytes=output.tell(),
+        media_deduplicated=len(duplicates),
+        parts_removed=sorted(removed),
+        package_seconds=time.perf_counter() - start_time,
+        content_hash=hashlib.sha256(output.getbuffer()).hexdigest(),
+    )
+
+    return output.getvalue(), report
+
+
+def save_package(
+    prs: Presentation,
+    output_file: Union[Path, IO[bytes]],
+    settings: Optional[PackageSettings] = None,
+) -> PackageReport:
+    """
+    Save a presentation and repack it with the given settings.
+
+    Args:
+    prs (Presentation): The presentation to save.
+    output_file (Union[Path, IO[bytes]]): Path or binary file to save the PPTX to.
+    settings (Optional[PackageSettings]): Compression and clean-up settings.
+
+    Returns:
+    PackageReport: Sizes and timings of the saved file.
+    """
+    start_time = time.perf_counter()
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    save_seconds = time.perf_counter() - start_time
+
+    pptx_bytes, report = package_pptx(buffer.getvalue(), settings)
+    report.save_seconds = save_seconds
+
+    if isinstance(output_file, (str, Path)):
+        Path(output_file).write_bytes(pptx_bytes)
+    else:
+        output_file.write(pptx_bytes)
+
+    return report
@@ -0,0 +1,325 @@
+"""Sample large CSV files with bounded I/O and estimate the slide aggregates."""
+
+import io
+import math
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Literal, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from pptgen.compute import PandasBackend, find_year_column
+from pptgen.compute.out_of_core import DistinctCounter
+from pptgen.model.dataframe_meta import ColumnMeta, ColumnsMeta
+from pptgen.model.dataframe_sample import DataFrameSample
+from pptgen.time_aggregation import bucket_starts
+
+BLOCK_BYTES = 1 << 17  # Size of the randomly placed blocks read from the file
+IO_BUDGET_SHARE = 0.5  # Share of the time budget spent reading the file
+HEADER_SAMPLE_ROWS = 1_000  # Rows read to detect the column types
+DATE_COLUMN = "FILE_DATE"
+Z_95 = 1.96
+
+KEY_COLUMN = "__sample_key__"
+STRATUM_COLUMN = "__sample_stratum__"
+
+
+def iter_blocks(
+    f: io.BufferedReader, data_start: int, file_bytes: int, rng: np.random.Generator
+) -> Iterator[bytes]:
+    """
+    Read the data of a file in randomly ordered blocks of whole lines.
+
+    Each line belongs to the block it starts in, so every line is read once.
+    Assumes that quoted fields do not contain newlines.
+    """
+    starts = np.arange(data_start, file_bytes, BLOCK_BYTES)
+    rng.shuffle(starts)
+
+    for start in starts:
+        end = min(start + BLOCK_BYTES, file_bytes)
+        f.seek(start - 1)
+        if f.read(1) != b"\n":
+            f.readline()  # The partial line belongs to the previous block
+        if f.tell() >= end:
+            yield b""
+            continue
+
+        block = f.read(end - f.tell())
+        if not block.endswith(b"\n"):
+            block += f.readline()
+
+        yield block
+
+
+def stratum_labels(chunk: pd.DataFrame, year_column: Optional[str]) -> pd.Series:
+    """Label the rows of a chunk with their stratum."""
+    if year_column is None:
+        return pd.Series("all", index=chunk.index)
+
+    years = pd.to_numeric(chunk[year_column], errors="coerce").round().astype("Int64")
+    return years.astype(str).replace("<NA>", "missing")
+
+
+def trim_reservoir(reservoir: pd.DataFrame, sample_rows: int) -> pd.DataFrame:
+    """Keep the rows with the smallest random keys, split evenly across strata."""
+    per_stratum = max(sample_rows // reservoir[STRATUM_COLUMN].nunique(), 1)
+
+    return (
+        reservoir.sort_values(KEY_COLUMN)
+        .groupby(STRATUM_COLUMN, sort=False)
+        .head(per_stratum)
+    )
+
+
+def block_table(rows: List[pd.Series]) -> pd.DataFrame:
+    """Stack per-block counts into a blocks by categories table."""
+    return pd.DataFrame(rows).fillna(0).reset_index(drop=True)
+
+
+def sample_csv(
+    csv_data_path: Path,
+    time_budget: float = 30.0,
+    sample_rows: int = 100_000,
+    strategy: Literal["reservoir", "stratified"] = "stratified",
+    seed: int = 0,
+) -> DataFrameSample:
+    """
+    Sample the rows of a CSV file within a time budget.
+
+    Blocks at random offsets are read until the I/O share of the time budget
+    is spent. Row, null, year and daily counts are kept for every block
+    read, along with sketches of the distinct values seen. A uniform
+    (reservoir) or year-stratified sample of the rows is kept for profiling.
+
+    Args:
+    csv_data_path (Path): Path to the CSV file.
+    time_budget (float): Target time in seconds for building the preview deck.
+    sample_rows (int): Maximum number of rows to keep.
+    strategy (str): "reservoir" for a uniform sample or "stratified" by year.
+    seed (int): Seed of the random number generator.
+
+    Returns:
+    DataFrameSample: The sampled rows and per-block counts.
+    """
+    start_time = time.perf_counter()
+    rng = np.random.default_rng(seed)
+
+    head = pd.read_csv(csv_data_path, nrows=HEADER_SAMPLE_ROWS)
+    year_column = find_year_column(PandasBackend().schema(head))
+    has_dates = DATE_COLUMN in head.columns
+    stratum_column = year_column if strategy == "stratified" else None
+    if strategy == "stratified" and year_column is None:
+        print("No year column found, sampling without strata")
+        strategy = "reservoir"
+
+    reservoir: List[pd.DataFrame] = []
+    reservoir_rows = 0
+    block_rows, null_counts, year_counts, daily_counts = [], [], [], []
+    distinct: Dict[str, DistinctCounter] = {}
+
+    with open(csv_data_path, "rb") as f:
+        header = f.readline()
+        data_start = f.tell()
+        file_bytes = os.fstat(f.fileno()).st_size
+        total_blocks = math.ceil((file_bytes - data_start) / BLOCK_BYTES)
+        bytes_read = 0
+
+        for block in iter_blocks(f, data_start, file_bytes, rng):
+            bytes_read += len(block)
+            chunk = pd.read_csv(io.BytesIO(header + block))
+
+            block_rows.append(len(chunk))
+            null_counts.append(chunk.isnull().sum())
+            for col in chunk.columns:
+                distinct.setdefault(col, DistinctCounter()).add(chunk[col].dropna())
+            if year_column is not None:
+                year_counts.append(chunk[year_column].value_counts())
+            if has_dates:
+                dates = pd.to_datetime(
+                    chunk[DATE_COLUMN], format="%Y-%m-%d", errors="coerce"
+                )
+                daily_counts.append(
+                    dates.dt.normalize()
+                    .value_counts()
+                    .rename_axis("date")
+                    .reset_index(name="count")
+                    .assign(block=len(block_rows) - 1)
+                )
+
+            if len(chunk):
+                chunk[KEY_COLUMN] = rng.random(len(chunk))
+                chunk[STRATUM_COLUMN] = stratum_labels(chunk, stratum_column).to_numpy()
+                reservoir.append(chunk)
+                reservoir_rows += len(chunk)
+                # Trim once the pending rows reach twice the sample size
+                if reservoir_rows >= 2 * sample_rows:
+                    reservoir = [trim_reservoir(pd.concat(reservoir), sample_rows)]
+                    reservoir_rows = len(reservoir[0])
+
+            if time.perf_counter() - start_time > time_budget * IO_BUDGET_SHARE:
+                break
+
+    if not reservoir:
+        raise ValueError(f"No rows could be sampled from {csv_data_path}")
+
+    sample = trim_reservoir(pd.concat(reservoir), sample_rows)
+
+    return DataFrameSample(
+        df=sample.drop(columns=[KEY_COLUMN, STRATUM_COLUMN]).reset_index(drop=True),
+        strategy=strategy,
+        block_rows=pd.Series(block_rows, dtype="float64"),
+        block_null_counts=block_table(null_counts),
+        block_year_counts=block_table(year_counts) if year_counts else None,
+        block_daily_counts=(
+            pd.concat(daily_counts, ignore_index=True) if daily_counts else None
+        ),
+        year_column=year_column,
+        unique_read={col: counter.count() for col, counter in distinct.items()},
+        unique_read_ci={
+            col: counter.interval()
+            for col, counter in distinct.items()
+            if not counter.is_exact
+        },
+        total_blocks=total_blocks,
+        bytes_read=bytes_read,
+        file_bytes=file_bytes,
+        elapsed=time.perf_counter() - start_time,
+    )
+
+
+def estimate_block_totals(
+    block_totals: pd.DataFrame, sample: DataFrameSample
+) -> pd.DataFrame:
+    """
+    Estimate totals over the whole file with 95% confidence intervals.
+
+    Blocks are sampled at random without replacement, so this is the cluster
+    sampling estimator M / m * sum(y_b), with a finite population correction.
+
+    Args:
+    block_totals (pd.DataFrame): Counts of each category in each block read.
+    sample (DataFrameSample): The sample the counts were taken from.
+
+    Returns:
+    pd.DataFrame: "count", "lower" and "upper" for each category.
+    """
+    blocks_read = len(block_totals)
+    total_blocks = max(sample.total_blocks, blocks_read)
+    totals = block_totals.sum() * total_blocks / blocks_read
+
+    if blocks_read > 1:
+        fpc = 1 - blocks_read / total_blocks
+        variance = total_blocks**2 * fpc * block_totals.var(ddof=1) / blocks_read
+    else:
+        variance = pd.Series(0.0, index=totals.index)
+    margin = Z_95 * np.sqrt(variance)
+
+    return pd.DataFrame(
+        {
+            "count": totals,
+            "lower": (totals - margin).clip(lower=0),
+            "upper": totals + margin,
+        }
+    )
+
+
+def estimate_total_rows(sample: DataFrameSample) -> Tuple[int, int, int]:
+    """Estimate the rows in the file, with the bounds of a 95% interval."""
+    estimate = estimate_block_totals(sample.block_rows.to_frame("rows"), sample)
+    return tuple(round(v) for v in estimate.loc["rows"])  # type: ignore
+
+
+def estimate_column_metadata(sample: DataFrameSample) -> ColumnsMeta:
+    """
+    Estimate the column metadata of the file from a sample.
+
+    Null and non-null counts are estimated from their counts in each block.
+    Rows cluster in blocks, so the distinct values of the rows read say little
+    about the rest of the file, and are only given as a lower bound.
+    """
+    total_rows, _, _ = estimate_total_rows(sample)
+    null_estimates = estimate_block_totals(sample.block_null_counts, sample)
+    non_null_estimates = estimate_block_totals(
+        sample.block_null_counts.rsub(sample.block_rows, axis=0), sample
+    )
+
+    metadata = []
+    for col in sample.df.columns:
+        null, null_lower, null_upper = (
+            min(round(v), total_rows)
+            for v in null_estimates.loc[col, ["count", "lower", "upper"]]
+        )
+        non_null_lower, non_null_upper = (
+            round(v) for v in non_null_estimates.loc[col, ["lower", "upper"]]
+        )
+        unique_ci = sample.unique_read_ci.get(col) if sample.exhaustive else None
+        # Every block was read, so only sketched unique counts are estimates
+        count_cis = not sample.exhaustive
+
+        metadata.append(
+            ColumnMeta(
+                column=col,
+                type=str(sample.df[col].dtype),
+                non_null_count=total_rows - null,
+                null_count=null,
+                unique_values=sample.unique_read.get(col, 0),
+                is_estimate=not sample.exhaustive or unique_ci is not None,
+                non_null_count_ci=(
+                    (non_null_lower, non_null_upper) if count_cis else None
+                ),
+                null_count_ci=(null_lower, null_upper) if count_cis else None,
+                unique_values_ci=unique_ci,
+                unique_values_lower_bound=not sample.exhaustive,
+            )
+        )
+
+    return ColumnsMeta(columns=metadata)
+
+
+def estimate_year_counts(sample: DataFrameSample) -> pd.DataFrame:
+    """Estimate the rows per year, sorted by year."""
+    if sample.block_year_counts is None:
+        raise ValueError("The sample has no year column.")
+
+    return estimate_block_totals(sample.block_year_counts, sample).sort_index()
+
+
+def estimate_date_span(sample: DataFrameSample) -> Tuple[pd.Timestamp, pd.Timestamp]:
+    """Get the first and last dates seen in the sample."""
+    if sample.block_daily_counts is None:
+        raise ValueError(f"The sample has no {DATE_COLUMN} column.")
+
+    dates = sample.block_daily_counts["date"]
+    return dates.min(), dates.max()
+
+
+def estimate_counts(sample: DataFrameSample, granularity: str) -> pd.DataFrame:
+    """
+    Estimate the rows per bucket of a granularity, with 95% confidence intervals.
+
+    The daily counts of each block are summed into buckets before estimating,
+    so the intervals account for rows of the same block sharing a bucket.
+
+    Returns:
+    pd.DataFrame: Frame with "date", 0 (count), "lower" and "upper" columns.
+    """
+    if sample.block_daily_counts is None:
+        raise ValueError(f"The sample has no {DATE_COLUMN} column.")
+
+    daily_counts = sample.block_daily_counts
+    buckets = bucket_starts(daily_counts["date"], granularity)
+    block_counts = (
+        daily_counts.groupby(["block", buckets])["count"]
+        .sum()
+        .unstack(fill_value=0)
+        # Blocks without dates count zero rows in every bucket
+        .reindex(range(len(sample.block_rows)), fill_value=0)
+    )
+
+    counts = estimate_block_totals(block_counts, sample)
+    counts = counts.sort_index().rename(columns={"count": 0})
+
+    return counts.rename_axis("date").reset_index()
@@ -0,0 +1,13 @@
+from pptgen.sinks.base import OutputSink
+from pptgen.sinks.chart_sink import ChartImageSink
+from pptgen.sinks.csv_sink import CsvSummarySink
+from pptgen.sinks.json_sink import JsonSink
+from pptgen.sinks.pptx_sink import PptxSink
+
+__all__ = [
+    "OutputSink",
+    "PptxSink",
+    "JsonSink",
+    "ChartImageSink",
+    "CsvSummarySink",
+]
@@ -0,0 +1,17 @@
+"""Interface for the outputs written from the deck aggregates."""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import List
+
+from pptgen.model.deck_aggregates import DeckAggregates
+
+
+class OutputSink(ABC):
+    """Write one output format from aggregates computed once per input."""
+
+    name: str
+
+    @abstractmethod
+    def write(self, aggregates: DeckAggregates) -> List[Path]:
+        """Write the output and return the files written."""
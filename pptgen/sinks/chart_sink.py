@@ -0,0 +1,43 @@
+"""Chart image output sink."""
+
+from pathlib import Path
+from typing import List
+
+import matplotlib.pyplot as plt
+
+from pptgen.generate_dataframe_meta import plot_monthly_counts
+from pptgen.model.deck_aggregates import DeckAggregates
+from pptgen.sinks.base import OutputSink
+
+
+class ChartImageSink(OutputSink):
+    """Write the chart of counts over time as standalone image files."""
+
+    name = "chart"
+
+    def __init__(self, output_file: Path, image_format: str = "png") -> None:
+        self.output_file = output_file
+        self.image_format = image_format
+
+    def write(self, aggregates: DeckAggregates) -> List[Path]:
+        """Write the chart, reusing the rendered PNG or replotting the counts."""
+        overview = aggregates.overview
+        output_file = Path(self.output_file).with_suffix(f".{self.image_format}")
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+
+        if self.image_format == "png":
+            image_bytes = overview.chart_png
+        else:
+            # Vector formats such as PDF and SVG are replotted from the counts
+            image_bytes = plot_monthly_counts(
+                overview.chart_counts,
+                overview.company_name,
+                overview.granularity,
+                image_format=self.image_format,
+            ).getvalue()
+            plt.close()
+
+        output_file.write_bytes(image_bytes)
+        print(f"Chart image created: {output_file}")
+
+        return [output_file]
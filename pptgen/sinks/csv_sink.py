@@ -0,0 +1,42 @@
+"""CSV summary output sink."""
+
+from pathlib import Path
+from typing import List
+
+import pandas as pd
+
+from pptgen.model.deck_aggregates import DeckAggregates
+from pptgen.sinks.base import OutputSink
+
+
+class CsvSummarySink(OutputSink):
+    """Write the column metadata, year counts and counts over time as CSV files."""
+
+    name = "csv"
+
+    def __init__(self, output_dir: Path) -> None:
+        self.output_dir = output_dir
+
+    def write(self, aggregates: DeckAggregates) -> List[Path]:
+        """Write one CSV file per table."""
+        output_dir = Path(self.output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        overview = aggregates.overview
+
+        tables = {
+            "columns": pd.DataFrame(aggregates.columns_meta.model_dump()["columns"]),
+            "time_counts": overview.time_counts.rename(columns={0: "count"}),
+        }
+        if overview.year_counts is not None:
+            tables["year_counts"] = overview.year_counts.rename_axis(
+                overview.year_column
+            ).reset_index()
+
+        files = []
+        for name, table in tables.items():
+            csv_file = output_dir.joinpath(f"{name}.csv")
+            table.to_csv(csv_file, index=False)
+            files.append(csv_file)
+        print(f"CSV summaries created: {output_dir}")
+
+        return files
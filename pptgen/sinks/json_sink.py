@@ -0,0 +1,27 @@
+"""JSON summary output sink."""
+
+import json
+from pathlib import Path
+from typing import List
+
+from pptgen.model.deck_aggregates import DeckAggregates
+from pptgen.sinks.base import OutputSink
+
+
+class JsonSink(OutputSink):
+    """Write the column metadata and aggregates as JSON for dashboards."""
+
+    name = "json"
+
+    def __init__(self, output_file: Path, indent: int = 2) -> None:
+        self.output_file = output_file
+        self.indent = indent
+
+    def write(self, aggregates: DeckAggregates) -> List[Path]:
+        """Write the JSON summary."""
+        output_file = Path(self.output_file)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        output_file.write_text(json.dumps(aggregates.summary(), indent=self.indent))
+        print(f"JSON summary created: {output_file}")
+
+        return [output_file]
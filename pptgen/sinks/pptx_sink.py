@@ -0,0 +1,174 @@
+"""PowerPoint output sink."""
+
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional, Set
+
+from pptx import Presentation
+
+from pptgen.create_presentation import add_title_slide
+from pptgen.deck_patch import patch_deck, tag_slide
+from pptgen.deck_writer import collect_telemetry, write_deck
+from pptgen.generate_dataframe_meta import (
+    add_overview_slide,
+    create_consolidated_view,
+    create_detailed_view,
+)
+from pptgen.layout_planner import (
+    cap_table_slides,
+    omitted_columns_text,
+    plan_metadata_layout,
+)
+from pptgen.model.deck_aggregates import DeckAggregates
+from pptgen.model.package_settings import PackageSettings
+from pptgen.model.powerpoint import ColorTheme, ThemeColorScheme, TitleSlide
+from pptgen.model.pptx_model import PPTXModel
+from pptgen.sinks.base import OutputSink
+
+TITLE_TAG = "title"
+OVERVIEW_TAG = "overview"
+METADATA_TAG_PREFIX = "metadata-"
+
+
+def aggregates_for_tags(tags: Iterable[str]) -> Set[str]:
+    """Get the aggregates the tagged slides need, beyond the title and subtitle."""
+    needed = set()
+    for tag in tags:
+        if tag == OVERVIEW_TAG:
+            needed.add("overview")
+        elif tag.startswith(METADATA_TAG_PREFIX):
+            needed.add("columns_meta")
+
+    return needed
+
+
+class PptxSink(OutputSink):
+    """
+    Write the deck: title, overview and metadata table slides.
+
+    Slides are tagged "title", "overview" and "metadata-1" onwards. With
+    patch_tags, only those slides are rebuilt and patched into the deck
+    already saved at the output file, which is built whole if missing. With
+    telemetry_sidecar, the build telemetry is written next to the deck.
+    """
+
+    name = "pptx"
+
+    def __init__(
+        self,
+        output_file: Path,
+        max_table_slides: Optional[int] = None,
+        package_settings: Optional[PackageSettings] = None,
+        year_table_summary: str = "auto",
+        theme: ColorTheme = ColorTheme.PROFESSIONAL_TEST,
+        patch_tags: Optional[List[str]] = None,
+        telemetry_sidecar: bool = False,
+    ) -> None:
+        self.output_file = output_file
+        self.max_table_slides = max_table_slides
+        self.package_settings = package_settings
+        self.year_table_summary = year_table_summary
+        self.theme = theme
+        self.patch_tags = patch_tags  # Slides to patch into an existing deck
+        self.telemetry_sidecar = telemetry_sidecar
+
+    def add_slides(
+        self,
+        prs: Presentation,
+        aggregates: DeckAggregates,
+        tags: Optional[Set[str]] = None,
+    ) -> None:
+        """Add the tagged slides of the deck, or every slide if no tags are given."""
+        columns_meta = aggregates.columns_meta
+
+        color_scheme = ThemeColorScheme(theme=self.theme)
+
+        # Add title slide
+        if tags is None or TITLE_TAG in tags:
+            title_slide_model = TitleSlide(
+                title=aggregates.title, subtitle=aggregates.subtitle
+            )
+            title_slide = add_title_slide(prs, title_slide_model, color_scheme)
+            tag_slide(title_slide, TITLE_TAG)
+
+        # Add overview slide
+        if tags is None or OVERVIEW_TAG in tags:
+            overview_slide = add_overview_slide(
+                prs, color_scheme, aggregates.overview, self.year_table_summary
+            )
+            tag_slide(overview_slide, OVERVIEW_TAG)
+
+        if tags is not None and not any(
+            tag.startswith(METADATA_TAG_PREFIX) for tag in tags
+        ):
+            return
+
+        # Plan the metadata slides to fit the columns
+        layout_plan = plan_metadata_layout(columns_meta)
+        max_table_slides = self.max_table_slides
+        if max_table_slides is not None and layout_plan.slide_count > max_table_slides:
+            slide_count = layout_plan.slide_count
+            layout_plan = cap_table_slides(layout_plan, max_table_slides)
+            print(
+                f"Capping metadata slides at {max_table_slides} of {slide_count}, "
+                f"{omitted_columns_text(layout_plan.omitted_columns)}"
+            )
+
+        if layout_plan.view == "consolidated":
+            print("Creating consolidated view")
+            slides = create_consolidated_view(
+                columns_meta, prs, color_scheme, layout_plan
+            )
+        else:
+            slides = create_detailed_view(columns_meta, prs, color_scheme, layout_plan)
+        for number, slide in enumerate(slides, start=1):
+            tag_slide(slide, f"{METADATA_TAG_PREFIX}{number}")
+
+    def write(self, aggregates: DeckAggregates) -> List[Path]:
+        """Build the presentation and write the PPTX file, or patch its slides."""
+        # Create a presentation
+        prs = Presentation()
+
+        # Create PPTXModel for the output path
+        pptx_model = PPTXModel(
+            file_name=str(self.output_file),
+            pptx_raw=prs,
+            package_settings=self.package_settings,
+            input_rows=aggregates.overview and aggregates.overview.row_count,
+            input_columns=(
+                aggregates.columns_meta and len(aggregates.columns_meta.columns)
+            ),
+            telemetry_sidecar=self.telemetry_sidecar,
+        )
+        written = [pptx_model.pptx_file]
+        if self.telemetry_sidecar:
+            written.append(pptx_model.telemetry_file)
+
+        start_time = time.perf_counter()
+        if self.patch_tags is not None and pptx_model.pptx_file.exists():
+            # Rebuild only the tagged slides and patch them into the saved deck
+            self.add_slides(prs, aggregates, set(self.patch_tags))
+            pptx_model.build_seconds = time.perf_counter() - start_time
+            patch_report = patch_deck(pptx_model.pptx_file, prs, tags=self.patch_tags)
+            print(patch_report.summary())
+
+            collect_telemetry(
+                pptx_model,
+                pptx_model.pptx_file.read_bytes(),
+                patch_seconds=patch_report.patch_seconds,
+            )
+            if self.telemetry_sidecar:
+                pptx_model.write_telemetry()
+
+            return written
+
+        self.add_slides(prs, aggregates)
+        pptx_model.build_seconds = time.perf_counter() - start_time
+
+        # Write to file
+        write_deck(pptx_model)
+
+        # Check that the output file exists and print that the PPTX file was created
+        pptx_model.validate_output_exists()
+
+        return written
@@ -0,0 +1,50 @@
+"""Append slides to a presentation in constant time."""
+
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
+from pptx.oxml.ns import qn
+from pptx.oxml.xmlchemy import OxmlElement
+from pptx.parts.slide import SlidePart
+from pptx.slide import Slide, SlideLayout
+
+MIN_SLIDE_ID = 256
+MAX_SLIDE_ID = 2147483647
+
+
+def append_slide(prs, layout: SlideLayout) -> Slide:
+    """
+    Add a slide with the given layout at the end of a presentation.
+
+    python-pptx's add_slide scans the relationships of the presentation for
+    one to the new slide, and every slide id for the highest, so building n
+    slides takes O(n²) time. Here the relationship is added directly, and the
+    id follows the last slide's, which is the highest as slides are only
+    appended. Falls back to add_slide if the relationship collection of
+    python-pptx changes.
+
+    Args:
+    prs (Presentation): The presentation to add the slide to.
+    layout (SlideLayout): The layout of the new slide.
+
+    Returns:
+    Slide: The new slide, with the placeholders of its layout.
+    """
+    rels = prs.part.rels
+    sld_id_lst = prs.element.get_or_add_sldIdLst()
+    slide_count = len(sld_id_lst)
+    last_id = int(sld_id_lst[-1].get("id")) if slide_count else MIN_SLIDE_ID - 1
+    if not hasattr(rels, "_add_relationship") or last_id >= MAX_SLIDE_ID:
+        return prs.slides.add_slide(layout)
+
+    partname = PackURI(f"/ppt/slides/slide{slide_count + 1}.xml")
+    slide_part = SlidePart.new(partname, prs.part.package, layout.part)
+    rId = rels._add_relationship(RT.SLIDE, slide_part)
+    sld_id = OxmlElement("p:sldId")
+    sld_id.set("id", str(last_id + 1))
+    sld_id.set(qn("r:id"), rId)
+    sld_id_lst.append(sld_id)
+
+    slide = slide_part.slide
+    slide.shapes.clone_layout_placeholders(layout)
+
+    return slide
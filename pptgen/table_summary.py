@@ -0,0 +1,145 @@
+"""Summarize high-cardinality count breakdowns to fit a slide table."""
+
+import math
+from typing import Hashable, Literal
+
+import numpy as np
+import pandas as pd
+
+MAX_TABLE_ROWS = 19  # Data rows that fit the overview table at a readable size
+SPARK_CHARACTERS = "▁▂▃▄▅▆▇█"
+MAX_SPARK_WIDTH = 60  # Characters that fit under the overview table
+
+SummaryStrategy = Literal["auto", "top_n", "bin", "none"]
+
+
+def format_label(value: Hashable) -> str:
+    """Format a breakdown label, showing integral floats as integers."""
+    if isinstance(value, (float, np.floating)) and float(value).is_integer():
+        return str(int(value))
+
+    return str(value)
+
+
+def has_integral_labels(counts: pd.Series) -> bool:
+    """Check whether a breakdown is keyed by integral numbers, such as years."""
+    if not pd.api.types.is_numeric_dtype(counts.index) or counts.empty:
+        return False
+
+    return bool(np.all(np.mod(counts.index.to_numpy(dtype=float), 1) == 0))
+
+
+def top_n_counts(counts: pd.Series, n: int) -> pd.Series:
+    """
+    Keep the n largest counts in label order and sum the rest into "Other".
+
+    Args:
+    counts (pd.Series): Counts indexed by label.
+    n (int): Number of labels to keep, besides "Other".
+
+    Returns:
+    pd.Series: Counts indexed by formatted label.
+    """
+    if len(counts) <= n:
+        return counts.set_axis(counts.index.map(format_label))
+
+    top = counts.nlargest(n).sort_index()
+    other = counts.drop(top.index)
+    summary = top.set_axis(top.index.map(format_label))
+    summary[f"Other ({len(other)} values)"] = other.sum()
+
+    return summary
+
+
+def bin_counts(counts: pd.Series, max_rows: int) -> pd.Series:
+    """
+    Sum counts keyed by integral numbers into at most max_rows ranges.
+
+    Ranges have the same width and are aligned to multiples of it, so years
+    fall into ranges such as 2000-2004.
+
+    Args:
+    counts (pd.Series): Counts indexed by integral numbers.
+    max_rows (int): Most ranges to return.
+
+    Returns:
+    pd.Series: Counts indexed by range label, in order.
+    """
+    values = counts.index.to_numpy(dtype=float).astype(np.int64)
+    low, high = int(values.min()), int(values.max())
+
+    width = max(math.ceil((high - low + 1) / max_rows), 1)
+    while (high // width) - (low // width) + 1 > max_rows:
+        width += 1
+
+    bins = values // width
+    binned = counts.groupby(bins).sum().sort_index()
+    labels = []
+    for b in binned.index:
+        start, stop = max(b * width, low), min((b + 1) * width - 1, high)
+        labels.append(f"{start}-{stop}" if stop > start else str(start))
+
+    return pd.Series(binned.to_numpy(), index=labels, name=counts.name)
+
+
+def summarize_counts(
+    counts: pd.Series,
+    max_rows: int = MAX_TABLE_ROWS,
+    strategy: SummaryStrategy = "auto",
+) -> pd.Series:
+    """
+    Summarize a count breakdown to at most max_rows table rows.
+
+    "auto" bins breakdowns keyed by integral numbers, such as years, into
+    ranges and keeps the top counts plus "Other" for any other breakdown.
+    "none" only truncates to the first max_rows labels.
+
+    Args:
+    counts (pd.Series): Counts indexed by label, in label order.
+    max_rows (int): Most table rows.
+    strategy (str): "auto", "top_n", "bin" or "none".
+
+    Returns:
+    pd.Series: Counts indexed by formatted label.
+    """
+    if len(counts) <= max_rows or strategy == "none":
+        summary = counts.iloc[:max_rows]
+        return summary.set_axis(summary.index.map(format_label))
+
+    if strategy == "bin" or (strategy == "auto" and has_integral_labels(counts)):
+        if not has_integral_labels(counts):
+            raise ValueError("Only counts keyed by integral numbers can be binned.")
+        return bin_counts(counts, max_rows)
+
+    return top_n_counts(counts, max_rows - 1)
+
+
+def summary_note(counts: pd.Series, summary: pd.Series, noun: str = "years") -> str:
+    """Describe how summarize_counts shortened a breakdown, for a note under its table."""
+    if any(str(label).startswith("Other (") for label in summary.index):
+        return (
+            f"{len(counts):,} {noun}: the {len(summary) - 1} largest are shown "
+            "and the rest are summed into Other"
+        )
+    if summary.sum() == counts.sum():
+        return f"{len(counts):,} {noun} binned into {len(summary)} ranges"
+
+    return f"The first {len(summary)} of {len(counts):,} {noun} are shown"
+
+
+def sparkline(counts: pd.Series, max_width: int = MAX_SPARK_WIDTH) -> str:
+    """Render counts as a line of block characters scaled from their min to max."""
+    values = counts.to_numpy(dtype=float)
+    if values.size == 0:
+        return ""
+    if values.size > max_width:
+        # Average neighbours, as the parts may differ in size by one
+        values = np.array([part.mean() for part in np.array_split(values, max_width)])
+
+    low, high = values.min(), values.max()
+    if high == low:
+        return SPARK_CHARACTERS[len(SPARK_CHARACTERS) // 2] * values.size
+
+    scaled = (values - low) / (high - low) * (len(SPARK_CHARACTERS) - 1)
+    levels = np.round(scaled).astype(int)
+    return "".join(SPARK_CHARACTERS[level] for level in levels)
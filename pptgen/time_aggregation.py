@@ -0,0 +1,185 @@
+"""Aggregate daily row counts to the time granularity that suits the chart."""
+
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Period frequency of each granularity, from finest to coarsest
+GRANULARITIES = {
+    "day": "D",
+    "week": "W",
+    "month": "M",
+    "quarter": "Q",
+    "year": "Y",
+}
+GRANULARITY_LABELS = {
+    "day": "Daily",
+    "week": "Weekly",
+    "month": "Monthly",
+    "quarter": "Quarterly",
+    "year": "Yearly",
+}
+TARGET_POINTS = 120  # Most points to plot before downsampling
+PARTIAL_BUCKET_SHARE = 0.5  # Share of the previous count below which to drop
+
+
+def bucket_count(start: pd.Timestamp, end: pd.Timestamp, granularity: str) -> int:
+    """Count the buckets of a granularity between two dates."""
+    freq = GRANULARITIES[granularity]
+    return (end.to_period(freq) - start.to_period(freq)).n + 1
+
+
+def choose_granularity(
+    start: pd.Timestamp, end: pd.Timestamp, target_points: int = TARGET_POINTS
+) -> str:
+    """Choose the finest granularity with at most target_points buckets."""
+    for granularity in GRANULARITIES:
+        if bucket_count(start, end, granularity) <= target_points:
+            return granularity
+
+    return "year"
+
+
+def bucket_starts(dates: pd.Series, granularity: str) -> pd.Series:
+    """Map dates to the start of their bucket."""
+    return dates.dt.to_period(GRANULARITIES[granularity]).dt.start_time
+
+
+def resample_counts(daily_counts: pd.DataFrame, granularity: str) -> pd.DataFrame:
+    """
+    Sum daily counts into buckets of a granularity.
+
+    Args:
+    daily_counts (pd.DataFrame): Frame with "date" and 0 (count) columns.
+    granularity (str): "day", "week", "month", "quarter" or "year".
+
+    Returns:
+    pd.DataFrame: Frame with "date" (bucket start) and 0 (count) columns.
+    """
+    buckets = bucket_starts(daily_counts["date"], granularity)
+
+    return daily_counts.groupby(buckets.rename("date"))[0].sum().reset_index()
+
+
+def remove_partial_last_bucket(
+    counts: pd.DataFrame,
+    last_date: Optional[pd.Timestamp] = None,
+    granularity: str = "month",
+) -> pd.DataFrame:
+    """
+    Remove the last bucket if it holds less than half of the previous count.
+
+    When the last date in the data is given, a bucket the data covers to its
+    end is complete and is always kept.
+    """
+    if len(counts) < 2:
+        return counts
+
+    if last_date is not None:
+        bucket_end = last_date.to_period(GRANULARITIES[granularity]).end_time
+        if last_date.normalize() >= bucket_end.normalize():
+            return counts
+
+    last_count = counts.iloc[-1][0]
+    previous_count = counts.iloc[-2][0]
+    if last_count < PARTIAL_BUCKET_SHARE * previous_count:
+        counts = counts[:-1]  # Exclude the last bucket
+
+    return counts
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Downsample a series with Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last points and, from each bucket in between, the
+    point forming the largest triangle with the previous kept point and the
+    mean of the next bucket.
+
+    Returns:
+    np.ndarray: Sorted indices of the points to keep.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    indices = np.empty(threshold, dtype=int)
+    indices[0], indices[-1] = 0, n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        start, stop = edges[i], edges[i + 1]
+        # The last bucket is followed by the last point
+        next_stop = edges[i + 2] if i + 2 < len(edges) else n
+        mean_x = x[stop:next_stop].mean()
+        mean_y = y[stop:next_stop].mean()
+
+        areas = np.abs(
+            (x[a] - mean_x) * (y[start:stop] - y[a])
+            - (x[a] - x[start:stop]) * (mean_y - y[a])
+        )
+        a = start + int(areas.argmax())
+        indices[i + 1] = a
+
+    return indices
+
+
+def downsample_counts(counts: pd.DataFrame, max_points: int) -> pd.DataFrame:
+    """Downsample a count series with LTTB, keeping any extra columns."""
+    if len(counts) <= max_points:
+        return counts
+
+    x = counts["date"].to_numpy(dtype="datetime64[ns]").astype("int64").astype(float)
+    y = counts[0].to_numpy(dtype=float)
+
+    return counts.iloc[lttb(x, y, max_points)].reset_index(drop=True)
+
+
+def aggregate_daily_counts(
+    daily_counts: pd.DataFrame,
+    granularity: str = "auto",
+    target_points: int = TARGET_POINTS,
+) -> Tuple[pd.DataFrame, str]:
+    """
+    Aggregate daily counts into buckets of the chart granularity.
+
+    The granularity is chosen from the date span unless given. Every bucket
+    is kept, so the counts sum to the rows with a date.
+
+    Args:
+    daily_counts (pd.DataFrame): Frame with "date" and 0 (count) columns, per day.
+    granularity (str): "auto", "day", "week", "month", "quarter" or "year".
+    target_points (int): Most points to plot, to choose the granularity.
+
+    Returns:
+    Tuple[pd.DataFrame, str]: The counts per bucket and the granularity used.
+    """
+    if granularity != "auto" and granularity not in GRANULARITIES:
+        raise ValueError(f"Unknown granularity: {granularity}")
+    if daily_counts.empty:
+        return daily_counts, "month" if granularity == "auto" else granularity
+
+    first_date, last_date = daily_counts["date"].min(), daily_counts["date"].max()
+    if granularity == "auto":
+        granularity = choose_granularity(first_date, last_date, target_points)
+
+    return resample_counts(daily_counts, granularity), granularity
+
+
+def chart_counts(
+    counts: pd.DataFrame,
+    last_date: Optional[pd.Timestamp],
+    granularity: str,
+    target_points: int = TARGET_POINTS,
+) -> pd.DataFrame:
+    """
+    Get the series to plot from the counts per bucket.
+
+    The partial last bucket is dropped, and series still longer than
+    target_points are downsampled with LTTB.
+    """
+    counts = remove_partial_last_bucket(counts, last_date, granularity)
+
+    return downsample_counts(counts, target_points)
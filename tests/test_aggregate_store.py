@@ -0,0 +1,129 @@
+"""Tests for the incrementally updated aggregate store."""
+
+import hashlib
+import os
+import sqlite3
+
+import pytest
+
+from pptgen.aggregate_store import SCHEMA_VERSION, AggregateStore, hash_file
+from pptgen.compute.pandas_backend import PandasBackend
+from pptgen.compute.store_backend import StoreBackend
+
+HEADER = "FILE_DATE,FILE_YEAR,state\n"
+
+
+def rows(start, stop):
+    return "".join(
+        f"2020-01-{i % 28 + 1:02},{2019 + i % 3},{'CA' if i % 2 else 'NY'}\n"
+        for i in range(start, stop)
+    )
+
+
+def write(path, text):
+    """Write a file and move its mtime on, so an update sees it changed."""
+    path.write_text(text)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def assert_profiles_pandas(store, csv_file):
+    backend = StoreBackend(store, "acme")
+    pandas = PandasBackend()
+    df = pandas.read_csv(csv_file)
+
+    assert backend.row_count("acme") == len(df)
+    assert backend.column_metadata("acme") == pandas.column_metadata(df)
+    assert backend.value_counts("acme", "FILE_YEAR").equals(
+        pandas.value_counts(df, "FILE_YEAR")
+    )
+    assert backend.daily_counts("acme", "FILE_DATE").equals(
+        pandas.daily_counts(df, "FILE_DATE")
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = AggregateStore(tmp_path / "aggregates.sqlite", chunk_rows=70)
+    yield store
+    store.close()
+
+
+def test_hash_file_hashes_the_prefix_in_the_same_pass(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"abcdef")
+
+    assert hash_file(path, 3) == (
+        hashlib.sha256(b"abc").hexdigest(),
+        hashlib.sha256(b"abcdef").hexdigest(),
+    )
+    assert hash_file(path, 10)[0] is None
+
+
+def test_an_unchanged_file_is_not_read_again(store, tmp_path):
+    csv_file = tmp_path / "acme.csv"
+    write(csv_file, HEADER + rows(0, 200))
+
+    assert store.update("acme", csv_file) == "rebuilt"
+    assert store.update("acme", csv_file) == "current"
+    assert_profiles_pandas(store, csv_file)
+
+
+def test_appended_rows_are_added_to_the_stored_aggregates(store, tmp_path):
+    csv_file = tmp_path / "acme.csv"
+    write(csv_file, HEADER + rows(0, 200))
+    store.update("acme", csv_file)
+
+    write(csv_file, HEADER + rows(0, 500))
+
+    assert store.update("acme", csv_file) == "appended"
+    assert_profiles_pandas(store, csv_file)
+
+
+def test_edited_rows_rebuild_the_company(store, tmp_path):
+    csv_file = tmp_path / "acme.csv"
+    write(csv_file, HEADER + rows(0, 200))
+    store.update("acme", csv_file)
+
+    write(csv_file, HEADER + rows(0, 200).replace("CA", "TX", 1) + rows(200, 300))
+
+    assert store.update("acme", csv_file) == "rebuilt"
+    assert_profiles_pandas(store, csv_file)
+
+
+def test_a_completed_last_row_rebuilds_the_company(store, tmp_path):
+    csv_file = tmp_path / "acme.csv"
+    write(csv_file, HEADER + rows(0, 200).rstrip("\n"))
+    store.update("acme", csv_file)
+
+    write(csv_file, HEADER + rows(0, 200).rstrip("\n") + "0\n" + rows(200, 250))
+
+    assert store.update("acme", csv_file) == "rebuilt"
+    assert_profiles_pandas(store, csv_file)
+
+
+def test_unknown_companies_are_rejected(store):
+    with pytest.raises(ValueError):
+        store.row_count("globex")
+
+
+def test_stores_of_another_schema_version_need_a_reset(tmp_path):
+    db_path = tmp_path / "aggregates.sqlite"
+    csv_file = tmp_path / "acme.csv"
+    write(csv_file, HEADER + rows(0, 10))
+    store = AggregateStore(db_path)
+    store.update("acme", csv_file)
+    store.conn.execute("PRAGMA user_version = 1")
+    store.close()
+
+    with pytest.raises(ValueError, match="reset=True"):
+        AggregateStore(db_path)
+
+    store = AggregateStore(db_path, reset=True)
+    with pytest.raises(ValueError):
+        store.row_count("acme")
+    assert store.update("acme", csv_file) == "rebuilt"
+    store.close()
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+    conn.close()
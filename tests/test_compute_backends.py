@@ -0,0 +1,72 @@
+"""Tests that every compute backend reads a CSV the way pandas does."""
+
+import pandas as pd
+import pytest
+
+from pptgen.compute import get_backend
+from pptgen.compute.base import find_year_column
+from pptgen.compute.polars_backend import pl
+
+BACKENDS = [
+    "pandas",
+    pytest.param(
+        "polars",
+        marks=pytest.mark.skipif(pl is None, reason="polars is not installed"),
+    ),
+]
+
+CSV = """FILE_DATE,FILE_YEAR,name,flag
+2020-01-01,2020,a,true
+2020-01-02,,b,
+2021-03-04,2021,,false
+2021-03-04,2021,a,true
+"""
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "filings.csv"
+    path.write_text(CSV)
+    return path
+
+
+@pytest.mark.parametrize("backend_name", BACKENDS)
+def test_backend_matches_pandas(backend_name, csv_path):
+    expected = pd.read_csv(csv_path)
+    backend = get_backend(backend_name)
+    df = backend.read_csv(csv_path)
+
+    assert backend.row_count(df) == 4
+    assert backend.schema(df) == expected.dtypes.astype(str).to_dict()
+    metadata = {meta.column: meta for meta in backend.column_metadata(df)}
+    for column in expected.columns:
+        assert metadata[column].non_null_count == expected[column].count()
+        assert metadata[column].null_count == expected[column].isna().sum()
+        assert metadata[column].unique_values == expected[column].nunique()
+    assert backend.value_counts(df, "FILE_YEAR").to_dict() == {2020.0: 1, 2021.0: 2}
+    daily = backend.daily_counts(df, "FILE_DATE")
+    assert daily[0].tolist() == [1, 1, 2]
+
+
+@pytest.mark.parametrize("backend_name", BACKENDS)
+def test_backend_reads_a_header_only_csv(backend_name, tmp_path):
+    path = tmp_path / "empty.csv"
+    path.write_text("FILE_DATE,FILE_YEAR\n")
+    backend = get_backend(backend_name)
+    df = backend.read_csv(path)
+
+    assert backend.row_count(df) == 0
+    assert [meta.non_null_count for meta in backend.column_metadata(df)] == [0, 0]
+    assert backend.value_counts(df, "FILE_YEAR").empty
+    assert backend.daily_counts(df, "FILE_DATE").empty
+
+
+def test_find_year_column_prefers_file_year():
+    assert find_year_column({"year": "int64", "FILE_YEAR": "int64"}) == "FILE_YEAR"
+    assert find_year_column({"Tax Year": "float64"}) == "Tax Year"
+    assert find_year_column({"name": "object"}) is None
+
+
+def test_unknown_backends_are_rejected():
+    with pytest.raises(ValueError):
+        get_backend("spark")
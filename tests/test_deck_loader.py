@@ -0,0 +1,56 @@
+"""Tests for loading slide models from a deck specification."""
+
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from pptgen.deck_loader import load_deck, theme_overrides
+from pptgen.model.powerpoint import ColorTheme, ContentSlide, ThemeColorScheme
+from pptgen.model.powerpoint.common import BulletPoints
+
+SPEC = {
+    "theme": "christmas",
+    "slides": [
+        {"type": "title", "title": "Christmas", "subtitle": "Happy Holidays!"},
+        {
+            "type": "content",
+            "title": "Facts",
+            "content": {"bullet_points": [{"text": "Snow"}, {"text": "Bells"}]},
+        },
+        {"type": "content", "title": "Text", "content": "One\nTwo"},
+    ],
+}
+
+
+def test_load_deck_builds_typed_slide_models():
+    color_scheme, slides = load_deck(SPEC)
+
+    assert color_scheme.theme == ColorTheme.CHRISTMAS
+    assert [slide.type for slide in slides] == ["title", "content", "content"]
+    assert isinstance(slides[1], ContentSlide)
+    assert isinstance(slides[1].content, BulletPoints)
+    assert [b.text for b in slides[1].content.bullet_points] == ["Snow", "Bells"]
+    assert slides[2].content == "One\nTwo"
+
+
+def test_load_deck_reads_json_like_a_dict():
+    _, from_dict = load_deck(SPEC)
+    _, from_json = load_deck(json.dumps(SPEC).encode())
+
+    assert [s.model_dump() for s in from_json] == [s.model_dump() for s in from_dict]
+
+
+def test_load_deck_rejects_unknown_slide_types():
+    spec = {"theme": "christmas", "slides": [{"type": "chart", "title": "x"}]}
+
+    with pytest.raises(ValidationError):
+        load_deck(spec)
+
+
+def test_theme_overrides_only_set_fields_of_each_slide_type():
+    overrides = theme_overrides(ThemeColorScheme(theme=ColorTheme.CHRISTMAS))
+
+    assert set(overrides) == {"title", "content", "image"}
+    for fields in overrides.values():
+        assert "theme" not in fields
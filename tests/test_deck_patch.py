@@ -0,0 +1,144 @@
+"""Tests for patching tagged slides into saved decks."""
+
+import io
+import zipfile
+
+import numpy as np
+import pytest
+from PIL import Image
+from pptx import Presentation
+from pptx.util import Inches
+
+from pptgen import entrypoint
+from pptgen.deck_patch import patch_deck, tag_slide, tagged_slides
+from pptgen.entrypoint import generate_ppt
+from pptgen.sinks.pptx_sink import aggregates_for_tags
+
+
+def png_bytes(seed):
+    pixels = np.random.default_rng(seed).integers(0, 256, (16, 16, 3), dtype=np.uint8)
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def build_deck(texts, images=None):
+    """Build a deck of tagged text slides, with a picture on the slides given one."""
+    prs = Presentation()
+    for tag, text in texts.items():
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = text
+        if images and tag in images:
+            slide.shapes.add_picture(io.BytesIO(images[tag]), 0, 0, Inches(1))
+        tag_slide(slide, tag)
+    return prs
+
+
+def save(prs, path):
+    prs.save(path)
+    return path
+
+
+def titles(path):
+    return [slide.shapes.title.text for slide in Presentation(path).slides]
+
+
+def test_tagged_slides_maps_tags_to_parts(tmp_path):
+    deck = save(build_deck({"title": "A", "overview": "B"}), tmp_path / "deck.pptx")
+
+    with zipfile.ZipFile(deck) as zf:
+        assert tagged_slides(zf) == {
+            "title": "ppt/slides/slide1.xml",
+            "overview": "ppt/slides/slide2.xml",
+        }
+
+
+def test_duplicate_tags_are_rejected(tmp_path):
+    deck = save(build_deck({"a": "A", "b": "B"}), tmp_path / "deck.pptx")
+    prs = Presentation(deck)
+    tag_slide(prs.slides[1], "a")
+    save(prs, deck)
+
+    with zipfile.ZipFile(deck) as zf, pytest.raises(ValueError):
+        tagged_slides(zf)
+
+
+def test_only_the_tagged_slide_is_replaced(tmp_path):
+    deck = save(build_deck({"a": "A", "b": "B", "c": "C"}), tmp_path / "deck.pptx")
+    before = zipfile.ZipFile(deck)
+    before_entries = {info.filename: before.read(info) for info in before.infolist()}
+    before.close()
+
+    report = patch_deck(deck, build_deck({"b": "New B"}))
+
+    assert titles(deck) == ["A", "New B", "C"]
+    assert report.patched_tags == ["b"] and report.slide_count == 3
+    assert report.parts_removed == []
+    with zipfile.ZipFile(deck) as after:
+        assert after.namelist() == list(before_entries)
+        changed = [
+            name for name in before_entries if after.read(name) != before_entries[name]
+        ]
+    assert changed == ["ppt/slides/slide2.xml"]  # Its relationships are unchanged
+    assert report.parts_copied == len(before_entries) - report.parts_written
+
+
+def test_replaced_media_is_removed_unless_shared(tmp_path):
+    old, new = png_bytes(0), png_bytes(1)
+    deck = save(
+        build_deck({"a": "A", "b": "B"}, {"a": old, "b": old}), tmp_path / "deck.pptx"
+    )
+    patch = build_deck({"a": "A", "b": "B"}, {"a": new, "b": new})
+
+    shared = patch_deck(deck, patch, tags=["a"])
+    both = patch_deck(deck, patch, tags=["b"])
+
+    assert shared.parts_removed == []
+    assert both.parts_removed == ["ppt/media/image1.png"]
+    blobs = [slide.shapes[1].image.blob for slide in Presentation(deck).slides]
+    assert blobs == [new, new]
+
+
+def test_patching_to_another_file_keeps_the_deck(tmp_path):
+    deck = save(build_deck({"a": "A"}), tmp_path / "deck.pptx")
+    deck_bytes = deck.read_bytes()
+
+    patch_deck(deck, build_deck({"a": "New A"}), output_file=tmp_path / "new.pptx")
+
+    assert deck.read_bytes() == deck_bytes
+    assert titles(tmp_path / "new.pptx") == ["New A"]
+
+
+def test_unknown_tags_leave_the_deck_untouched(tmp_path):
+    deck = save(build_deck({"a": "A"}), tmp_path / "deck.pptx")
+    deck_bytes = deck.read_bytes()
+
+    with pytest.raises(ValueError):
+        patch_deck(deck, build_deck({"b": "B"}))
+
+    assert deck.read_bytes() == deck_bytes
+    assert [path.name for path in tmp_path.iterdir()] == ["deck.pptx"]
+
+
+def test_aggregates_for_tags():
+    assert aggregates_for_tags(["title"]) == set()
+    assert aggregates_for_tags(["overview", "title"]) == {"overview"}
+    assert aggregates_for_tags(["metadata-2", "metadata-1"]) == {"columns_meta"}
+
+
+def test_patched_slides_compute_only_what_they_show(tmp_path, monkeypatch):
+    csv_file = tmp_path / "filings.csv"
+    csv_file.write_text("FILE_DATE,FILE_YEAR\n2020-01-01,2020\n2021-06-01,2021\n")
+    deck = generate_ppt("acme", "Filings", csv_file, tmp_path / "deck.pptx")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("The column metadata was computed")
+
+    monkeypatch.setattr(entrypoint, "get_dataframe_metadata", fail)
+    generate_ppt("globex", "Filings", csv_file, deck, patch_slides=["overview"])
+    csv_file.unlink()  # The title slide needs no input at all
+    generate_ppt("globex", "Filings", csv_file, deck, patch_slides=["title"])
+
+    slides = Presentation(deck).slides
+    assert len(slides) == 3
+    assert slides[0].shapes.title.text == "UCC Data - GLOBEX"
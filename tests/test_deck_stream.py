@@ -0,0 +1,68 @@
+"""Tests for the JSON Lines deck format."""
+
+import io
+
+import pytest
+from pptx import Presentation
+
+from pptgen.deck_stream import build_deck_stream, read_deck_stream, write_deck_stream
+from pptgen.model.powerpoint import (
+    BulletPoint,
+    BulletPoints,
+    ColorTheme,
+    ContentSlide,
+    TitleSlide,
+)
+
+SLIDES = [
+    TitleSlide(title="Christmas", subtitle="Happy Holidays!"),
+    ContentSlide(
+        title="Facts",
+        content=BulletPoints(bullet_points=[BulletPoint(text="Snow")]),
+    ),
+]
+
+
+def test_written_decks_read_back_as_the_same_slides():
+    buffer = io.StringIO()
+    assert write_deck_stream(buffer, ColorTheme.CHRISTMAS, SLIDES) == 2
+
+    color_scheme, slides = read_deck_stream(io.StringIO(buffer.getvalue()))
+    slides = list(slides)
+
+    assert color_scheme.theme == ColorTheme.CHRISTMAS
+    assert [slide.title for slide in slides] == ["Christmas", "Facts"]
+    assert slides[1].content.bullet_points[0].text == "Snow"
+
+
+def test_records_leave_out_default_values():
+    buffer = io.StringIO()
+    write_deck_stream(buffer, ColorTheme.CHRISTMAS, SLIDES[:1])
+
+    record = buffer.getvalue().splitlines()[1]
+
+    assert "font" not in record
+
+
+def test_slides_are_read_lazily_and_blank_lines_skipped():
+    lines = iter(['{"theme": "christmas"}\n', "\n", '{"type": "title"'])
+
+    _, slides = read_deck_stream(lines)
+
+    with pytest.raises(ValueError):  # Only the broken line fails, when reached
+        next(slides)
+
+
+def test_the_first_line_must_hold_the_theme():
+    with pytest.raises(ValueError):
+        read_deck_stream(['{"type": "title", "title": "x"}'])
+
+
+def test_build_deck_stream_writes_one_slide_per_record(tmp_path):
+    deck_file = tmp_path / "deck.jsonl"
+    with open(deck_file, "w", encoding="utf-8") as f:
+        write_deck_stream(f, ColorTheme.CHRISTMAS, SLIDES)
+
+    output = io.BytesIO()
+    assert build_deck_stream(deck_file, output) == 2
+    assert len(Presentation(output).slides) == 2
@@ -0,0 +1,57 @@
+"""Tests for the cached image filename index."""
+
+import os
+
+from pptgen import image_index
+from pptgen.image_index import ImageIndex, get_image_index
+
+
+def touch(path, mtime_ns=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"")
+    if mtime_ns is not None:
+        os.utime(path.parent, ns=(mtime_ns, mtime_ns))
+
+
+def test_find_by_name_stem_prefix_and_substring(tmp_path):
+    for name in ("tree.png", "snow/snowman.jpg", "gifts.jpeg", "notes.txt"):
+        touch(tmp_path / name)
+    index = ImageIndex.build(tmp_path)
+
+    assert index.find("tree.png") == (tmp_path / "tree.png").resolve()
+    assert index.find("snowman") == (tmp_path / "snow/snowman.jpg").resolve()
+    assert index.find("gif") == (tmp_path / "gifts.jpeg").resolve()
+    assert index.find("man") == (tmp_path / "snow/snowman.jpg").resolve()
+    assert index.find("notes") is None
+
+
+def test_png_is_found_before_jpeg_of_the_same_stem(tmp_path):
+    touch(tmp_path / "b/star.jpg")
+    touch(tmp_path / "a/star.png")
+
+    assert ImageIndex.build(tmp_path).find("star").name == "star.png"
+
+
+def test_added_files_make_the_index_stale(tmp_path):
+    touch(tmp_path / "tree.png", mtime_ns=1_000_000_000)
+    index = ImageIndex.build(tmp_path)
+    assert not index.is_stale()
+
+    touch(tmp_path / "bell.png", mtime_ns=2_000_000_000)
+
+    assert index.is_stale()
+
+
+def test_get_image_index_persists_and_reuses_the_index(tmp_path, monkeypatch):
+    root = tmp_path / "images"
+    touch(root / "tree.png")
+    index_file = tmp_path / "index.json"
+    monkeypatch.setattr(image_index, "_image_indexes", {})
+
+    built = get_image_index(root, index_file)
+    monkeypatch.setattr(image_index, "_image_indexes", {})
+    monkeypatch.setattr(ImageIndex, "build", None)  # Loading must not rebuild
+    loaded = get_image_index(root, index_file)
+
+    assert loaded.files == built.files == ["tree.png"]
+    assert loaded.find("tree") == built.find("tree")
@@ -0,0 +1,106 @@
+"""Tests for resizing, recompressing and caching slide images."""
+
+import io
+
+import numpy as np
+import pytest
+from PIL import ExifTags, Image
+
+from pptgen import image_pipeline
+from pptgen.image_pipeline import (
+    choose_format,
+    process_image,
+    resize_image,
+    target_pixels,
+)
+from pptgen.model.image_settings import ImageSettings
+
+EMU_PER_INCH = 914400
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    image_pipeline._processed_images.clear()
+    yield
+    image_pipeline._processed_images.clear()
+
+
+def noise(width, height, mode="RGB"):
+    rng = np.random.default_rng(0)
+    channels = len(mode)
+    pixels = rng.integers(0, 256, (height, width, channels), dtype=np.uint8)
+    return Image.fromarray(pixels.squeeze(), mode)
+
+
+def opened(image_bytes):
+    return Image.open(io.BytesIO(image_bytes))
+
+
+def test_target_pixels_converts_emu_at_the_dpi():
+    assert target_pixels(2 * EMU_PER_INCH, EMU_PER_INCH, 150) == (300, 150)
+    assert target_pixels(1, 1, 72) == (1, 1)
+
+
+def test_flat_images_stay_png_and_photos_become_jpeg():
+    settings = ImageSettings()
+    logo = Image.new("RGB", (64, 64), "red")
+
+    assert choose_format(logo, settings) == "PNG"
+    assert choose_format(noise(256, 256), settings) == "JPEG"
+    assert choose_format(noise(256, 256, "RGBA"), settings) == "PNG"
+    assert choose_format(logo, ImageSettings(image_format="JPEG")) == "JPEG"
+
+
+def test_resize_image_shrinks_but_never_upscales(tmp_path):
+    path = tmp_path / "photo.png"
+    noise(400, 100).save(path)
+
+    resized = opened(resize_image(str(path), (200, 200), ImageSettings()))
+
+    assert resized.size == (200, 100)
+    assert resized.format == "JPEG"
+
+
+def test_resize_image_applies_the_exif_orientation(tmp_path):
+    path = tmp_path / "rotated.jpg"
+    exif = Image.Exif()
+    exif[ExifTags.Base.Orientation] = 6  # Rotated 90 degrees clockwise
+    noise(40, 20).save(path, exif=exif)
+
+    upright = opened(resize_image(str(path), (1000, 1000), ImageSettings()))
+
+    assert upright.size == (20, 40)
+
+
+def test_resize_image_keeps_a_source_that_would_only_grow(tmp_path):
+    path = tmp_path / "small.png"
+    Image.new("RGB", (32, 32), "green").save(path, optimize=True)
+
+    assert resize_image(str(path), (64, 64), ImageSettings()) == path.read_bytes()
+
+
+def test_process_image_reuses_the_disk_cache(tmp_path, monkeypatch):
+    path = tmp_path / "photo.png"
+    noise(300, 300).save(path)
+    settings = ImageSettings(cache_dir=tmp_path / "cache")
+    size = 100 * EMU_PER_INCH // 150
+
+    first = process_image(str(path), size, size, settings).getvalue()
+    image_pipeline._processed_images.clear()
+    monkeypatch.setattr(image_pipeline, "resize_image", pytest.fail)
+    second = process_image(str(path), size, size, settings).getvalue()
+
+    assert first == second
+    assert len(list((tmp_path / "cache").glob("*.img"))) == 1
+
+
+def test_process_image_evicts_the_oldest_cached_images(tmp_path, monkeypatch):
+    monkeypatch.setattr(image_pipeline, "MAX_CACHED_IMAGES", 2)
+    path = tmp_path / "logo.png"
+    Image.new("RGB", (50, 50), "blue").save(path)
+
+    for inches in (1, 2, 3):
+        process_image(str(path), inches * EMU_PER_INCH, EMU_PER_INCH)
+
+    sizes = [key[1] for key in image_pipeline._processed_images]
+    assert sizes == [(300, 150), (450, 150)]
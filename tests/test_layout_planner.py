@@ -0,0 +1,138 @@
+"""Tests for the metadata table layout planner."""
+
+import pytest
+from pptx import Presentation
+
+from pptgen.generate_dataframe_meta import create_detailed_view
+from pptgen.layout_planner import (
+    TABLE_HEIGHT,
+    cap_table_slides,
+    count_wrapped_lines,
+    format_count,
+    omitted_columns_text,
+    pack_rows,
+    plan_deck,
+    plan_metadata_layout,
+)
+from pptgen.model.dataframe_meta import ColumnMeta, ColumnsMeta
+from pptgen.model.powerpoint import ColorTheme, ThemeColorScheme
+
+
+def columns(count: int) -> ColumnsMeta:
+    return ColumnsMeta(
+        columns=[
+            ColumnMeta(
+                column=f"column_{i}",
+                type="int64",
+                non_null_count=1000,
+                null_count=0,
+                unique_values=i,
+            )
+            for i in range(count)
+        ]
+    )
+
+
+def test_count_wrapped_lines_wraps_words_and_breaks_long_ones():
+    assert count_wrapped_lines("short", 5.0, "Arial", 10) == 1
+    assert count_wrapped_lines("word " * 200, 1.0, "Arial", 10) > 10
+    assert count_wrapped_lines("x" * 400, 1.0, "Arial", 10) > 1
+    assert count_wrapped_lines("one\ntwo", 5.0, "Arial", 10) == 2
+
+
+def test_count_wrapped_lines_rejects_a_zero_width():
+    with pytest.raises(ValueError):
+        count_wrapped_lines("text", 0, "Arial", 10)
+
+
+def test_pack_rows_fills_slides_and_keeps_tall_rows_alone():
+    assert pack_rows([], 1.0) == []
+    assert pack_rows([0.4, 0.4, 0.4], 1.0) == [(0, 2), (2, 3)]
+    assert pack_rows([2.0, 0.5], 1.0) == [(0, 1), (1, 2)]
+
+
+def test_format_count_marks_estimates():
+    assert format_count(1234) == "1234"
+    assert format_count(1234, (1000, 1500)) == "~1,234 (1,000-1,500)"
+    assert format_count(1234, lower_bound=True) == "≥1,234"
+
+
+def test_few_columns_get_a_single_detailed_slide():
+    layout_plan = plan_metadata_layout(columns(5))
+
+    assert layout_plan.view == "detailed"
+    assert layout_plan.chunks == [(0, 5)]
+    assert sum(layout_plan.column_widths) == pytest.approx(9.0)
+
+
+def test_many_columns_are_packed_in_the_consolidated_view():
+    layout_plan = plan_metadata_layout(columns(200))
+
+    assert layout_plan.view == "consolidated"
+    assert layout_plan.slide_count > 1
+    assert layout_plan.chunks[0][0] == 0
+    assert layout_plan.chunks[-1][1] == 200
+    for start, stop in layout_plan.chunks:
+        rows = layout_plan.row_heights[start:stop]
+        assert sum(rows) <= TABLE_HEIGHT - layout_plan.header_height
+
+
+def test_cap_table_slides_keeps_room_for_the_note():
+    layout_plan = plan_metadata_layout(columns(200))
+    capped = cap_table_slides(layout_plan, 2)
+
+    assert capped.slide_count == 2
+    assert capped.chunks[0] == layout_plan.chunks[0]
+    start, stop = capped.chunks[-1]
+    assert capped.omitted_columns == 200 - stop
+    assert (
+        sum(capped.row_heights[start:stop]) + capped.omitted_height
+        <= TABLE_HEIGHT - capped.header_height
+    )
+
+
+def test_cap_table_slides_leaves_plans_under_the_cap():
+    layout_plan = plan_metadata_layout(columns(5))
+
+    assert cap_table_slides(layout_plan, 1) is layout_plan
+
+
+def test_cap_table_slides_needs_one_slide():
+    with pytest.raises(ValueError):
+        cap_table_slides(plan_metadata_layout(columns(200)), 0)
+
+
+def test_omitted_columns_text():
+    assert omitted_columns_text(1) == "1 column omitted"
+    assert omitted_columns_text(1500) == "1,500 columns omitted"
+
+
+def test_plan_deck_of_an_empty_frame_has_only_title_and_overview():
+    deck_plan = plan_deck(columns(0), row_count=0)
+
+    assert deck_plan.column_count == 0
+    assert deck_plan.layout.slide_count == 0
+    assert deck_plan.slide_count == 2
+
+
+def test_plan_deck_applies_the_cap():
+    deck_plan = plan_deck(columns(200), row_count=10, max_table_slides=1)
+
+    assert deck_plan.slide_count == 3
+    assert deck_plan.layout.omitted_columns > 0
+    assert deck_plan.estimated_bytes < plan_deck(columns(200), 10).estimated_bytes
+
+
+def test_detailed_view_follows_a_capped_plan():
+    meta = columns(120)
+    layout_plan = cap_table_slides(plan_metadata_layout(meta, view="detailed"), 2)
+    color_scheme = ThemeColorScheme(theme=ColorTheme.PROFESSIONAL_TEST)
+
+    slides = create_detailed_view(meta, Presentation(), color_scheme, layout_plan)
+
+    assert len(slides) == 2
+    table = next(shape for shape in slides[-1].shapes if shape.has_table).table
+    start, stop = layout_plan.chunks[-1]
+    assert len(table.rows) == stop - start + 2  # Header and note rows
+    last_row = table.rows[len(table.rows) - 1]
+    assert last_row.cells[0].text == omitted_columns_text(layout_plan.omitted_columns)
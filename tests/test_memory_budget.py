@@ -0,0 +1,112 @@
+"""Tests for planning CSV processing within a memory budget."""
+
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pptgen.compute import ChunkedBackend, ColumnPrunedBackend, PandasBackend
+from pptgen.memory_budget import (
+    MIN_CHUNK_ROWS,
+    LineReader,
+    PeakMemoryMonitor,
+    backend_for_plan,
+    group_columns,
+    plan_memory,
+)
+
+
+@pytest.fixture
+def wide_csv(tmp_path):
+    rng = np.random.default_rng(0)
+    path = tmp_path / "wide.csv"
+    pd.DataFrame({f"col_{i}": rng.integers(0, 1000, 20_000) for i in range(8)}).to_csv(
+        path, index=False
+    )
+    return path
+
+
+def test_line_reader_counts_the_bytes_of_the_rows_read():
+    data = b'a,b\n1,"x\ny"\n2,z\r\n3,w\n'
+    reader = LineReader(io.BytesIO(data))
+
+    df = pd.read_csv(reader, nrows=2)
+
+    assert df["b"].tolist() == ["x\ny", "z"]
+    assert reader.bytes_read == len(b'a,b\n1,"x\ny"\n2,z\r\n')
+
+
+def test_quoted_newlines_do_not_inflate_the_row_estimate(tmp_path):
+    path = tmp_path / "notes.csv"
+    pd.DataFrame({"id": range(5000), "note": ["line one\nline two"] * 5000}).to_csv(
+        path, index=False
+    )
+
+    plan = plan_memory(path, budget_bytes=1 << 30, sample_rows=1000)
+
+    assert plan.estimated_rows == pytest.approx(5000, rel=0.05)
+
+
+def test_files_that_fit_are_read_whole(wide_csv):
+    plan = plan_memory(wide_csv, budget_bytes=1 << 30, sample_rows=50_000)
+
+    assert plan.mode == "in_memory"
+    assert plan.estimated_rows == 20_000  # The whole file was sampled
+    assert isinstance(backend_for_plan(plan), PandasBackend)
+
+
+def test_larger_files_are_extrapolated_from_the_sample(wide_csv):
+    plan = plan_memory(wide_csv, budget_bytes=1 << 30, sample_rows=1000)
+
+    assert plan.estimated_rows == pytest.approx(20_000, rel=0.01)
+    assert plan.column_bytes["col_0"] == pytest.approx(20_000 * 8, rel=0.01)
+
+
+def test_columns_are_grouped_when_the_file_does_not_fit(wide_csv):
+    # Each int64 column takes 160 kB, and read_csv peaks at twice that
+    plan = plan_memory(wide_csv, budget_bytes=1_000_000, sample_rows=1000)
+
+    assert plan.mode == "column_pruned"
+    assert [len(group) for group in plan.column_groups] == [3, 3, 2]
+    assert sum(plan.column_groups, []) == [f"col_{i}" for i in range(8)]
+    assert isinstance(backend_for_plan(plan), ColumnPrunedBackend)
+
+
+def test_a_zero_budget_streams_the_smallest_chunks(wide_csv):
+    plan = plan_memory(wide_csv, budget_bytes=0, sample_rows=1000)
+
+    assert plan.mode == "chunked"
+    assert plan.chunk_rows == MIN_CHUNK_ROWS
+    assert isinstance(backend_for_plan(plan), ChunkedBackend)
+
+
+def test_a_header_only_file_is_read_in_memory(tmp_path):
+    path = tmp_path / "empty.csv"
+    path.write_text("a,b\n")
+
+    plan = plan_memory(path, budget_bytes=0)
+
+    assert plan.mode == "in_memory"
+    assert plan.estimated_rows == 0
+    assert plan.estimated_bytes == 0
+
+
+def test_group_columns_keeps_order_and_gives_up_on_wide_columns():
+    column_bytes = {"a": 40, "b": 40, "c": 30, "d": 90}
+
+    assert group_columns(column_bytes, 100) == [["a", "b"], ["c"], ["d"]]
+    assert group_columns(column_bytes, 80) is None
+    assert group_columns({}, 10) == []
+
+
+def test_peak_memory_monitor_sees_an_allocation():
+    monitor = PeakMemoryMonitor(interval=0.001).start()
+    if monitor.start_bytes is None:
+        pytest.skip("/proc is not available")
+
+    block = np.ones(50_000_000, dtype=np.uint8)
+    peak = monitor.stop()
+    del block
+
+    assert peak - monitor.start_bytes >= 40_000_000
@@ -0,0 +1,116 @@
+"""Tests for the out-of-core backends and their distinct value sketches."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pptgen.compute.out_of_core import (
+    SKETCH_BYTES,
+    SKETCH_SIZE,
+    ChunkedBackend,
+    ColumnPrunedBackend,
+    DistinctCounter,
+    merge_dtypes,
+)
+from pptgen.compute.pandas_backend import PandasBackend
+
+
+def counter_of(values):
+    counter = DistinctCounter()
+    counter.add(pd.Series(values))
+    return counter
+
+
+def test_counts_are_exact_below_the_sketch_size():
+    counter = counter_of(list(range(1000)) * 3)
+
+    assert counter.is_exact
+    assert counter.count() == 1000
+    assert counter.interval() is None
+
+
+def test_large_counts_are_estimated_within_their_intervals():
+    covered = 0
+    for i in range(100):
+        counter = counter_of(np.arange(20_000) + i * 1_000_000)
+        lower, upper = counter.interval()
+
+        assert not counter.is_exact
+        assert counter.count() == pytest.approx(20_000, rel=0.1)
+        assert len(counter.to_bytes()) == SKETCH_BYTES
+        covered += lower <= 20_000 <= upper
+
+    assert covered >= 88
+
+
+def test_sketches_of_chunks_merge_into_the_sketch_of_the_column():
+    values = np.random.default_rng(0).integers(0, 1_000_000, 100_000)
+    whole = counter_of(values)
+
+    merged = counter_of(values[:30_000])
+    merged.merge(counter_of(values[30_000:]))
+
+    assert merged.to_bytes() == whole.to_bytes()
+
+
+def test_int_and_float_chunks_hash_alike():
+    counter = counter_of([1, 2, 3])
+    counter.add(pd.Series([1.0, 2.0, 4.0]))
+
+    assert counter.count() == 4
+
+
+def test_sketches_round_trip_through_bytes():
+    counter = counter_of(np.arange(SKETCH_SIZE * 2))
+
+    loaded = DistinctCounter.from_bytes(counter.to_bytes())
+
+    assert loaded.count() == counter.count()
+    loaded.add(pd.Series([-1.5]))  # Loaded sketches stay writable
+
+
+def test_merge_dtypes_matches_pandas_inference():
+    assert merge_dtypes(["int64", "int64"]) == "int64"
+    assert merge_dtypes(["int64", "float64"]) == "float64"
+    assert merge_dtypes(["bool", "bool"]) == "bool"
+    assert merge_dtypes(["bool", "object"]) == "object"
+
+
+@pytest.fixture
+def mixed_csv(tmp_path):
+    rng = np.random.default_rng(0)
+    dates = pd.Timestamp("2020-01-01") + pd.to_timedelta(
+        rng.integers(0, 90, 3000), unit="D"
+    )
+    # Nulls only in the last rows, so early chunks parse the column as int64
+    late_nulls = np.where(np.arange(3000) > 2500, np.nan, rng.integers(0, 50, 3000))
+    path = tmp_path / "mixed.csv"
+    pd.DataFrame(
+        {
+            "FILE_DATE": dates.strftime("%Y-%m-%d"),
+            "late_nulls": late_nulls,
+            "name": rng.choice(["a", "b", None], 3000),
+        }
+    ).to_csv(path, index=False, float_format="%.0f")
+    return path
+
+
+@pytest.mark.parametrize(
+    "backend",
+    [
+        ChunkedBackend(chunk_rows=700),
+        ColumnPrunedBackend([["FILE_DATE"], ["late_nulls", "name"]]),
+    ],
+    ids=["chunked", "column_pruned"],
+)
+def test_out_of_core_backends_profile_like_pandas(backend, mixed_csv):
+    pandas = PandasBackend()
+    df = pandas.read_csv(mixed_csv)
+
+    path = backend.read_csv(mixed_csv)
+
+    assert backend.row_count(path) == 3000
+    assert backend.column_metadata(path) == pandas.column_metadata(df)
+    assert backend.daily_counts(path, "FILE_DATE").equals(
+        pandas.daily_counts(df, "FILE_DATE")
+    )
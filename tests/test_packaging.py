@@ -0,0 +1,116 @@
+"""Tests for repacking saved PPTX files."""
+
+import io
+import zipfile
+
+import numpy as np
+from PIL import Image
+from pptx import Presentation
+from pptx.util import Inches
+
+from pptgen.model.package_settings import PackageSettings
+from pptgen.packaging import package_pptx, save_package, should_store
+
+
+def png_bytes():
+    pixels = np.random.default_rng(0).integers(0, 256, (32, 32, 3), dtype=np.uint8)
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def saved(prs):
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    return buffer.getvalue()
+
+
+def deck_with_duplicate_media():
+    """Save two picture slides, then give the second its own copy of the image."""
+    prs = Presentation()
+    for _ in range(2):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide.shapes.add_picture(io.BytesIO(png_bytes()), 0, 0, Inches(1))
+
+    source = zipfile.ZipFile(io.BytesIO(saved(prs)))
+    output = io.BytesIO()
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as zf:
+        for info in source.infolist():
+            data = source.read(info)
+            if info.filename == "ppt/slides/_rels/slide2.xml.rels":
+                data = data.replace(b"image1.png", b"image2.png")
+            zf.writestr(info.filename, data)
+            if info.filename == "ppt/media/image1.png":
+                zf.writestr("ppt/media/image2.png", data)
+
+    return output.getvalue()
+
+
+def test_duplicate_media_is_kept_once():
+    pptx_bytes = deck_with_duplicate_media()
+
+    packaged, report = package_pptx(pptx_bytes)
+
+    assert report.media_deduplicated == 1
+    names = zipfile.ZipFile(io.BytesIO(packaged)).namelist()
+    assert "ppt/media/image2.png" not in names
+    slides = Presentation(io.BytesIO(packaged)).slides
+    blobs = [slide.shapes[0].image.blob for slide in slides]
+    assert blobs[0] == blobs[1] == png_bytes()
+
+
+def test_unused_layouts_are_stripped():
+    prs = Presentation()
+    prs.slides.add_slide(prs.slide_layouts[6])
+
+    packaged, report = package_pptx(saved(prs))
+
+    assert "ppt/slideLayouts/slideLayout2.xml" in report.parts_removed
+    reopened = Presentation(io.BytesIO(packaged))
+    assert len(reopened.slides) == 1
+    assert len(reopened.slide_layouts) == 1
+
+
+def test_nothing_is_removed_with_clean_up_turned_off():
+    prs = Presentation()
+    settings = PackageSettings(dedupe_media=False, strip_unused=False)
+
+    packaged, report = package_pptx(saved(prs), settings)
+
+    assert report.parts_removed == []
+    assert len(Presentation(io.BytesIO(packaged)).slide_layouts) == 11
+
+
+def test_deterministic_packages_match_byte_for_byte():
+    settings = PackageSettings(deterministic=True)
+
+    first, first_report = package_pptx(deck_with_duplicate_media(), settings)
+    second, second_report = package_pptx(deck_with_duplicate_media(), settings)
+
+    assert first == second
+    assert first_report.content_hash == second_report.content_hash
+    infos = zipfile.ZipFile(io.BytesIO(first)).infolist()
+    assert {info.date_time for info in infos} == {(1980, 1, 1, 0, 0, 0)}
+    assert [info.filename for info in infos][0] == "[Content_Types].xml"
+
+
+def test_should_store_media_that_deflate_does_not_shrink():
+    settings = PackageSettings()
+
+    assert should_store("ppt/media/image1.jpg", b"", settings)
+    assert should_store("ppt/media/image1.png", png_bytes(), settings)
+    assert not should_store("ppt/media/image1.png", b"\0" * 10_000, settings)
+    assert not should_store("ppt/slides/slide1.xml", b"<p/>", settings)
+    assert should_store(
+        "ppt/slides/slide1.xml", b"", PackageSettings(compression_level=0)
+    )
+    assert not should_store("a.jpg", b"", PackageSettings(store_media=False))
+
+
+def test_save_package_writes_the_packaged_bytes(tmp_path):
+    output_file = tmp_path / "deck.pptx"
+
+    report = save_package(Presentation(), output_file)
+
+    assert output_file.stat().st_size == report.output_bytes
+    assert report.output_bytes < report.input_bytes
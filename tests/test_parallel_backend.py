@@ -0,0 +1,47 @@
+"""Tests for profiling columns in worker processes over shared memory."""
+
+import numpy as np
+import pandas as pd
+
+from pptgen.compute import parallel_backend
+from pptgen.compute.pandas_backend import PandasBackend
+from pptgen.compute.parallel_backend import (
+    ParallelPandasBackend,
+    is_shareable,
+    shard_columns,
+)
+
+
+def test_shard_columns_balances_bytes():
+    shards = shard_columns({"a": 100, "b": 60, "c": 50, "d": 10}, 2)
+
+    assert sorted(map(sorted, shards)) == [["a", "d"], ["b", "c"]]
+
+
+def test_shard_columns_drops_empty_shards():
+    assert shard_columns({"a": 1}, 4) == [["a"]]
+    assert shard_columns({}, 2) == []
+
+
+def test_only_fixed_width_columns_are_shared():
+    assert is_shareable(pd.Series([1, 2]))
+    assert is_shareable(pd.Series(pd.to_datetime(["2020-01-01"])))
+    assert not is_shareable(pd.Series(["a", "b"]))
+    assert not is_shareable(pd.Series([1, None], dtype="Int64"))
+
+
+def test_workers_profile_like_pandas(monkeypatch):
+    monkeypatch.setattr(parallel_backend, "MIN_PARALLEL_CELLS", 0)
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "ints": rng.integers(0, 50, 1000),
+            "floats": np.where(rng.random(1000) < 0.1, np.nan, rng.random(1000)),
+            "flags": rng.random(1000) < 0.5,
+            "names": rng.choice(["a", "b", None], 1000),
+        }
+    )
+
+    parallel = ParallelPandasBackend(workers=2).column_metadata(df)
+
+    assert parallel == PandasBackend().column_metadata(df)
@@ -0,0 +1,142 @@
+"""Tests for preview sampling and the cluster sampling estimates."""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pptgen import sampling
+from pptgen.model.dataframe_sample import DataFrameSample
+from pptgen.sampling import (
+    Z_95,
+    estimate_block_totals,
+    estimate_column_metadata,
+    estimate_counts,
+    estimate_total_rows,
+    estimate_year_counts,
+    sample_csv,
+)
+
+
+def block_sample(block_rows, total_blocks):
+    return DataFrameSample(
+        df=pd.DataFrame({"x": [1]}),
+        strategy="reservoir",
+        block_rows=pd.Series(block_rows, dtype="float64"),
+        block_null_counts=pd.DataFrame({"x": [0] * len(block_rows)}),
+        total_blocks=total_blocks,
+        bytes_read=0,
+        file_bytes=0,
+        elapsed=0.0,
+    )
+
+
+@pytest.fixture
+def filings_csv(tmp_path):
+    rng = np.random.default_rng(0)
+    dates = pd.Timestamp("2015-01-01") + pd.to_timedelta(
+        rng.integers(0, 365 * 6, 20_000), unit="D"
+    )
+    path = tmp_path / "filings.csv"
+    pd.DataFrame(
+        {
+            "FILE_DATE": dates.strftime("%Y-%m-%d"),
+            "FILE_YEAR": dates.year,
+            "amount": np.where(rng.random(20_000) < 0.25, np.nan, 1.0),
+        }
+    ).to_csv(path, index=False)
+    return path
+
+
+def test_block_totals_scale_up_with_the_finite_population_correction():
+    sample = block_sample([10, 20, 30], total_blocks=6)
+
+    estimate = estimate_block_totals(sample.block_rows.to_frame("rows"), sample)
+
+    count, lower, upper = estimate.loc["rows"]
+    margin = Z_95 * math.sqrt(6**2 * (1 - 3 / 6) * 100 / 3)
+    assert count == 120
+    assert (lower, upper) == pytest.approx((120 - margin, 120 + margin))
+
+
+def test_every_block_read_gives_exact_totals():
+    sample = block_sample([10, 20, 30], total_blocks=3)
+
+    assert estimate_total_rows(sample) == (60, 60, 60)
+
+
+def test_a_single_block_gives_a_point_estimate():
+    sample = block_sample([25], total_blocks=4)
+
+    assert estimate_total_rows(sample) == (100, 100, 100)
+
+
+def test_lower_bounds_are_never_negative():
+    sample = block_sample([0, 0, 50], total_blocks=100)
+
+    _, lower, _ = estimate_total_rows(sample)
+
+    assert lower == 0
+
+
+def test_intervals_cover_the_total_about_95_percent_of_the_time():
+    rng = np.random.default_rng(1)
+    population = rng.poisson(rng.uniform(50, 150, 200))
+    covered = 0
+    for _ in range(400):
+        blocks = rng.choice(population, 40, replace=False)
+        _, lower, upper = estimate_total_rows(block_sample(blocks, 200))
+        covered += lower <= population.sum() <= upper
+
+    assert 0.9 <= covered / 400 <= 0.99
+
+
+def test_sampling_every_block_profiles_the_file_exactly(filings_csv, monkeypatch):
+    monkeypatch.setattr(sampling, "BLOCK_BYTES", 16_384)
+    df = pd.read_csv(filings_csv)
+
+    sample = sample_csv(filings_csv, 60, sample_rows=500, strategy="reservoir")
+
+    assert sample.exhaustive
+    assert len(sample.df) == 500
+    assert estimate_total_rows(sample) == (20_000, 20_000, 20_000)
+    amount = estimate_column_metadata(sample).columns[2]
+    assert amount.null_count == df["amount"].isna().sum()
+    assert amount.null_count_ci is None
+    years = estimate_year_counts(sample)
+    assert years["count"].to_dict() == df["FILE_YEAR"].value_counts().to_dict()
+    yearly = estimate_counts(sample, "year")
+    assert yearly[0].sum() == 20_000
+
+
+def test_partial_samples_are_marked_as_estimates(filings_csv, monkeypatch):
+    monkeypatch.setattr(sampling, "BLOCK_BYTES", 16_384)
+    monkeypatch.setattr(sampling, "IO_BUDGET_SHARE", 0)  # Read a single block
+
+    sample = sample_csv(filings_csv, strategy="reservoir")
+
+    assert not sample.exhaustive
+    count, _, _ = estimate_total_rows(sample)
+    assert 10_000 < count < 40_000
+    amount = estimate_column_metadata(sample).columns[2]
+    assert amount.is_estimate and amount.unique_values_lower_bound
+
+
+def test_stratified_samples_split_rows_evenly_across_years(filings_csv, monkeypatch):
+    monkeypatch.setattr(sampling, "BLOCK_BYTES", 16_384)
+
+    sample = sample_csv(filings_csv, time_budget=60, sample_rows=500)
+
+    assert sample.strategy == "stratified"
+    assert sample.df["FILE_YEAR"].value_counts().to_dict() == {
+        year: 500 // 6 for year in range(2015, 2021)
+    }
+
+
+def test_a_header_only_file_cannot_be_sampled(tmp_path):
+    path = tmp_path / "empty.csv"
+    path.write_text("FILE_DATE,FILE_YEAR\n")
+
+    with pytest.raises(ValueError):
+        sample_csv(path)
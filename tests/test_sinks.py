@@ -0,0 +1,68 @@
+"""Tests for writing every output from the aggregates computed once."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from pptx import Presentation
+
+from pptgen.entrypoint import generate_ppt
+from pptgen.sinks import ChartImageSink, CsvSummarySink, JsonSink
+
+
+@pytest.fixture
+def filings_csv(tmp_path):
+    rng = np.random.default_rng(0)
+    dates = pd.Timestamp("2018-01-01") + pd.to_timedelta(
+        rng.integers(0, 900, 500), unit="D"
+    )
+    path = tmp_path / "filings.csv"
+    pd.DataFrame(
+        {
+            "FILE_DATE": dates.strftime("%Y-%m-%d"),
+            "FILE_YEAR": dates.year,
+            "state": rng.choice(["CA", "NY"], 500),
+        }
+    ).to_csv(path, index=False)
+    return path
+
+
+def test_every_sink_writes_the_same_counts(filings_csv, tmp_path):
+    df = pd.read_csv(filings_csv)
+    sinks = [
+        JsonSink(tmp_path / "summary.json"),
+        CsvSummarySink(tmp_path / "csv"),
+        ChartImageSink(tmp_path / "chart"),
+    ]
+
+    generate_ppt("acme", "Filings", filings_csv, tmp_path / "deck.pptx", sinks=sinks)
+
+    assert len(Presentation(tmp_path / "deck.pptx").slides) == 3
+    summary = json.loads((tmp_path / "summary.json").read_text())
+    assert summary["row_count"] == 500 and not summary["is_estimate"]
+    assert summary["year_column"] == "FILE_YEAR"
+    assert [column["column"] for column in summary["columns"]] == list(df.columns)
+    assert sum(record["count"] for record in summary["time_counts"]) == 500
+
+    year_counts = pd.read_csv(tmp_path / "csv" / "year_counts.csv")
+    assert year_counts.set_index("FILE_YEAR")["count"].to_dict() == (
+        df["FILE_YEAR"].value_counts().sort_index().to_dict()
+    )
+    time_counts = pd.read_csv(tmp_path / "csv" / "time_counts.csv")
+    assert time_counts["count"].tolist() == [
+        record["count"] for record in summary["time_counts"]
+    ]
+    columns = pd.read_csv(tmp_path / "csv" / "columns.csv")
+    assert columns["unique_values"].tolist() == df.nunique().tolist()
+
+    assert (tmp_path / "chart.png").read_bytes().startswith(b"\x89PNG")
+
+
+def test_sinks_run_without_a_deck(filings_csv, tmp_path):
+    sinks = [ChartImageSink(tmp_path / "chart", image_format="svg")]
+
+    assert generate_ppt("acme", "Filings", filings_csv, None, sinks=sinks) is None
+
+    assert b"<svg" in (tmp_path / "chart.svg").read_bytes()
+    assert not list(tmp_path.glob("*.pptx"))
@@ -0,0 +1,94 @@
+"""Tests for summarizing count breakdowns to fit a slide table."""
+
+import pandas as pd
+import pytest
+
+from pptgen.table_summary import (
+    SPARK_CHARACTERS,
+    bin_counts,
+    format_label,
+    sparkline,
+    summarize_counts,
+    summary_note,
+    top_n_counts,
+)
+
+
+def year_counts(first, last):
+    years = range(first, last + 1)
+    return pd.Series([1] * len(years), index=[float(y) for y in years], name="count")
+
+
+def test_format_label_drops_the_decimals_of_integral_floats():
+    assert format_label(2020.0) == "2020"
+    assert format_label(2.5) == "2.5"
+    assert format_label("CA") == "CA"
+
+
+def test_top_n_keeps_label_order_and_sums_the_rest():
+    counts = pd.Series({"a": 5, "b": 1, "c": 9, "d": 2, "e": 7})
+
+    summary = top_n_counts(counts, 3)
+
+    assert summary.to_dict() == {"a": 5, "c": 9, "e": 7, "Other (2 values)": 3}
+
+
+def test_bins_are_aligned_to_their_width():
+    summary = bin_counts(year_counts(1998, 2021), 5)
+
+    # Five-year ranges would need six rows, so the width grows to six
+    assert summary.index.tolist() == [
+        "1998-2003",
+        "2004-2009",
+        "2010-2015",
+        "2016-2021",
+    ]
+    assert summary.sum() == 24
+
+
+def test_a_single_value_bins_to_itself():
+    summary = bin_counts(year_counts(2020, 2020), 5)
+
+    assert summary.to_dict() == {"2020": 1}
+
+
+def test_short_breakdowns_are_left_alone():
+    counts = year_counts(2000, 2004)
+
+    summary = summarize_counts(counts, max_rows=5)
+
+    assert summary.index.tolist() == ["2000", "2001", "2002", "2003", "2004"]
+
+
+def test_auto_bins_years_and_tops_other_labels():
+    years = year_counts(1900, 2020)
+    states = pd.Series(range(1, 31), index=[f"S{i:02}" for i in range(30)])
+
+    binned = summarize_counts(years, max_rows=19)
+    topped = summarize_counts(states, max_rows=19)
+
+    assert len(binned) <= 19 and binned.sum() == 121
+    assert summary_note(years, binned) == "121 years binned into 18 ranges"
+    assert len(topped) == 19 and topped.sum() == states.sum()
+    assert summary_note(states, topped, "states").startswith("30 states: the 18")
+
+
+def test_none_truncates_and_bin_rejects_text_labels():
+    states = pd.Series(1, index=[f"S{i:02}" for i in range(30)])
+
+    truncated = summarize_counts(states, 10, "none")
+
+    assert truncated.index[-1] == "S09"
+    assert (
+        summary_note(states, truncated, "states")
+        == "The first 10 of 30 states are shown"
+    )
+    with pytest.raises(ValueError):
+        summarize_counts(states, 10, "bin")
+
+
+def test_sparklines_scale_from_min_to_max():
+    assert sparkline(pd.Series([0, 7])) == SPARK_CHARACTERS[0] + SPARK_CHARACTERS[-1]
+    assert sparkline(pd.Series([3, 3, 3])) == SPARK_CHARACTERS[4] * 3
+    assert sparkline(pd.Series([], dtype=float)) == ""
+    assert len(sparkline(pd.Series(range(1000)), max_width=60)) == 60
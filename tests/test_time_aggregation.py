@@ -0,0 +1,111 @@
+"""Tests for the chart granularity and LTTB downsampling."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pptgen.time_aggregation import (
+    aggregate_daily_counts,
+    chart_counts,
+    choose_granularity,
+    downsample_counts,
+    lttb,
+    remove_partial_last_bucket,
+)
+
+
+def daily(start, days, count=1):
+    dates = pd.date_range(start, periods=days, freq="D")
+    return pd.DataFrame({"date": dates, 0: count})
+
+
+def test_lttb_picks_the_largest_triangle_in_each_bucket():
+    x = np.arange(7, dtype=float)
+    y = np.array([0, 0, 5, 0, 0, -3, 0], dtype=float)
+
+    assert lttb(x, y, 4).tolist() == [0, 2, 5, 6]
+
+
+def test_lttb_keeps_every_point_below_the_threshold():
+    x = np.arange(5, dtype=float)
+
+    assert lttb(x, x, 5).tolist() == [0, 1, 2, 3, 4]
+    assert lttb(x, x, 2).tolist() == [0, 1, 2, 3, 4]
+
+
+def test_lttb_keeps_the_ends_and_a_spike():
+    x = np.arange(1000, dtype=float)
+    y = np.zeros(1000)
+    y[637] = 100
+
+    indices = lttb(x, y, 50)
+
+    assert len(indices) == 50
+    assert indices[0] == 0 and indices[-1] == 999
+    assert np.all(np.diff(indices) > 0)
+    assert 637 in indices
+
+
+@pytest.mark.parametrize(
+    "end, granularity",
+    [
+        ("2020-03-01", "day"),
+        ("2021-12-31", "week"),
+        ("2029-12-31", "month"),
+        ("2040-12-31", "quarter"),
+        ("2400-12-31", "year"),
+    ],
+)
+def test_choose_granularity_from_the_date_span(end, granularity):
+    start = pd.Timestamp("2020-01-01")
+
+    assert choose_granularity(start, pd.Timestamp(end)) == granularity
+
+
+def test_aggregating_keeps_every_row():
+    counts, granularity = aggregate_daily_counts(daily("2010-01-01", 3000))
+
+    assert granularity == "month"
+    assert len(counts) == 99
+    assert counts[0].sum() == 3000
+    assert counts["date"].is_monotonic_increasing
+
+
+def test_aggregating_an_empty_frame():
+    empty = pd.DataFrame({"date": pd.Series(dtype="datetime64[ns]"), 0: []})
+
+    counts, granularity = aggregate_daily_counts(empty)
+
+    assert counts.empty
+    assert granularity == "month"
+
+
+def test_aggregating_a_single_bucket():
+    counts, granularity = aggregate_daily_counts(daily("2020-05-05", 1, 7))
+
+    assert granularity == "day"
+    assert counts.to_dict("list") == {"date": [pd.Timestamp("2020-05-05")], 0: [7]}
+    assert chart_counts(counts, counts["date"].max(), granularity).equals(counts)
+
+
+def test_unknown_granularities_are_rejected():
+    with pytest.raises(ValueError):
+        aggregate_daily_counts(daily("2020-01-01", 3), "fortnight")
+
+
+def test_a_partial_last_bucket_is_dropped_unless_complete():
+    counts, _ = aggregate_daily_counts(daily("2020-01-01", 35), "month")
+
+    assert len(remove_partial_last_bucket(counts)) == 1
+    complete = pd.Timestamp("2020-02-29")
+    assert len(remove_partial_last_bucket(counts, complete, "month")) == 2
+
+
+def test_downsampling_keeps_extra_columns():
+    counts = daily("2000-01-01", 500).assign(lower=0, upper=2)
+
+    downsampled = downsample_counts(counts, 100)
+
+    assert len(downsampled) == 100
+    assert list(downsampled.columns) == ["date", 0, "lower", "upper"]
+    assert downsample_counts(counts, 500) is counts